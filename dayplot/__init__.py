@@ -1,7 +1,33 @@
-from .calendar import calendar
+from .aggregate import DailyAccumulator, aggregate_daily, aggregate_files, scan_daily
+from .animation import animate_calendar
+from .calendar import CalendarHandle, calendar
 from .github import fetch_github_contrib
+from .grid import calendar_grid, shared_norm
+from .render import RenderResult, render_many, render_to_bytes
+from .renderer import CalendarRenderer
+from .store import DailyStore
+from .tiles import export_tiles
 from .utils import load_dataset
 from .styles import styles
 
 __version__ = "0.6.0"
-__all__ = ["calendar", "fetch_github_contrib", "load_dataset", "styles"]
+__all__ = [
+    "CalendarHandle",
+    "CalendarRenderer",
+    "DailyAccumulator",
+    "DailyStore",
+    "RenderResult",
+    "aggregate_daily",
+    "aggregate_files",
+    "animate_calendar",
+    "calendar",
+    "calendar_grid",
+    "export_tiles",
+    "fetch_github_contrib",
+    "load_dataset",
+    "render_many",
+    "render_to_bytes",
+    "scan_daily",
+    "shared_norm",
+    "styles",
+]
@@ -0,0 +1,385 @@
+import os
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from itertools import islice, repeat
+from typing import Any, Literal, Optional, Union, cast
+
+import narwhals as nw
+import numpy as np
+from narwhals.typing import EagerAllowed
+
+from dayplot.calendar import _aggregate_numeric, _is_numeric_values
+from dayplot.utils import (
+    _daily_totals,
+    _date_to_datetime64,
+    _null_days,
+    _parse_date,
+    _scan_source,
+    _to_datetime64,
+    _to_numpy,
+)
+
+
+class DailyAccumulator:
+    """
+    Sum a stream of events per day, with a memory usage that depends on the
+    number of days covered by the events, not on the number of events.
+
+    Events are added by chunks with `add()`, or read from an iterator of
+    `(timestamp, value)` pairs with `consume()`. The daily totals can then be
+    passed to `dayplot.calendar()`:
+
+    ```python
+    acc = dp.DailyAccumulator().consume(events)
+    dp.calendar(acc.dates, acc.values)
+    ```
+
+    Args:
+        start_date: If provided, events before this date are ignored.
+        end_date: If provided, events after this date are ignored.
+        chunk_size: Number of events read at once by `consume()`.
+
+    Attributes:
+        n_events: Number of events added so far (ignored events excluded).
+    """
+
+    def __init__(
+        self,
+        start_date: Optional[Union[date, datetime, str]] = None,
+        end_date: Optional[Union[date, datetime, str]] = None,
+        chunk_size: int = 100_000,
+    ):
+        if chunk_size < 1:
+            raise ValueError("`chunk_size` must be a positive integer.")
+
+        self.chunk_size = chunk_size
+        self.n_events = 0
+        self._min_day = self._to_day(start_date)
+        self._max_day = self._to_day(end_date)
+        if (
+            self._min_day is not None
+            and self._max_day is not None
+            and self._min_day > self._max_day
+        ):
+            raise ValueError("`start_date` must be before `end_date`.")
+
+        # Daily totals of the days from `_first_day` to `_first_day + len(_sums) - 1`.
+        self._first_day: Optional[int] = None
+        self._sums = np.zeros(0)
+        self._observed = np.zeros(0, dtype=bool)
+
+    @staticmethod
+    def _to_day(d: Optional[Union[date, datetime, str]]) -> Optional[int]:
+        if d is None:
+            return None
+        return int(_date_to_datetime64(_parse_date(d)).astype(np.int64))
+
+    def add(self, dates: Any, values: Any = None) -> None:
+        """
+        Add a chunk of events.
+
+        Args:
+            dates: Date-like objects, in any format accepted by `dayplot.calendar()`.
+            values: Numeric values of the events. If None, each event counts as 1.
+        """
+        days = _to_datetime64(dates).astype(np.int64)
+        if values is None:
+            values = np.ones(len(days))
+        else:
+            values = _to_numpy(values)
+            if len(values) != len(days):
+                raise ValueError("`dates` and `values` must have the same length.")
+            if not _is_numeric_values(values):
+                raise ValueError("`values` must be numeric.")
+            values = values.astype(float, copy=False)
+
+        # Null dates (NaT) are dropped, like days out of range.
+        in_range = ~_null_days(days)
+        if self._min_day is not None:
+            in_range &= days >= self._min_day
+        if self._max_day is not None:
+            in_range &= days <= self._max_day
+        if not in_range.all():
+            days, values = days[in_range], values[in_range]
+        if len(days) == 0:
+            return
+
+        self._reserve(int(days.min()), int(days.max()))
+        sums, observed = _aggregate_numeric(
+            days - cast(int, self._first_day), values, len(self._sums)
+        )
+        self._sums += sums
+        self._observed |= observed
+        self.n_events += len(days)
+
+    def consume(self, events: Iterable[tuple[Any, Any]]) -> "DailyAccumulator":
+        """
+        Add all the events of an iterable, `chunk_size` events at a time.
+
+        Args:
+            events: An iterable (e.g., a generator) of `(timestamp, value)` pairs.
+
+        Returns:
+            The accumulator itself.
+        """
+        events = iter(events)
+        while chunk := list(islice(events, self.chunk_size)):
+            dates, values = zip(*chunk)
+            self.add(dates, values)
+        return self
+
+    def merge(self, other: "DailyAccumulator") -> "DailyAccumulator":
+        """
+        Add the daily totals of another accumulator (e.g., computed on another
+        part of the events).
+
+        Args:
+            other: A `dayplot.DailyAccumulator`.
+
+        Returns:
+            The accumulator itself.
+        """
+        if other._first_day is None:
+            return self
+
+        days = other._first_day + np.flatnonzero(other._observed)
+        if self._min_day is not None:
+            days = days[days >= self._min_day]
+        if self._max_day is not None:
+            days = days[days <= self._max_day]
+        if len(days) == 0:
+            return self
+
+        self._reserve(int(days[0]), int(days[-1]))
+        start = other._first_day - cast(int, self._first_day)
+        stop = start + len(other._sums)
+        # `other` may cover days outside of the bounds of this accumulator.
+        clip = max(-start, 0)
+        start, stop = max(start, 0), min(stop, len(self._sums))
+        other_sums = other._sums[clip : clip + stop - start]
+        other_observed = other._observed[clip : clip + stop - start]
+        self._sums[start:stop] += np.where(other_observed, other_sums, 0)
+        self._observed[start:stop] |= other_observed
+        self.n_events += other.n_events
+        return self
+
+    def _reserve(self, min_day: int, max_day: int) -> None:
+        """Extend the daily arrays so that they cover `min_day` to `max_day`."""
+        if self._first_day is None:
+            self._first_day = min_day
+        last_day = self._first_day + len(self._sums) - 1
+        if min_day >= self._first_day and max_day <= last_day:
+            return
+
+        first_day = min(min_day, self._first_day)
+        n_days = max(max_day, last_day) - first_day + 1
+        start = self._first_day - first_day
+        sums = np.zeros(n_days)
+        sums[start : start + len(self._sums)] = self._sums
+        observed = np.zeros(n_days, dtype=bool)
+        observed[start : start + len(self._observed)] = self._observed
+        self._first_day, self._sums, self._observed = first_day, sums, observed
+
+    @property
+    def dates(self) -> np.ndarray:
+        """The days with at least one event, as a `datetime64[D]` array."""
+        if self._first_day is None:
+            return np.array([], dtype="datetime64[D]")
+        days = self._first_day + np.flatnonzero(self._observed)
+        return days.astype("datetime64[D]")
+
+    @property
+    def values(self) -> np.ndarray:
+        """The sum of the values of each day in `dates`."""
+        return self._sums[self._observed]
+
+
+def _aggregate_chunk(
+    dates: Any,
+    values: Any,
+    start_date: Optional[Union[date, datetime, str]],
+    end_date: Optional[Union[date, datetime, str]],
+) -> DailyAccumulator:
+    acc = DailyAccumulator(start_date, end_date)
+    acc.add(dates, values)
+    return acc
+
+
+def _read_file(
+    path: str, columns: list[str], backend: EagerAllowed
+) -> nw.DataFrame[Any]:
+    extension = os.path.splitext(path)[1].lower()
+    if extension in (".parquet", ".pq"):
+        return nw.read_parquet(path, backend=backend, columns=columns)
+    if extension == ".csv":
+        return nw.read_csv(path, backend=backend).select(columns)
+    raise ValueError(
+        f"Unsupported file {path!r}: only CSV and Parquet files can be read."
+    )
+
+
+def _aggregate_file(
+    path: str,
+    dates: str,
+    values: Optional[str],
+    backend: EagerAllowed,
+    start_date: Optional[Union[date, datetime, str]],
+    end_date: Optional[Union[date, datetime, str]],
+) -> DailyAccumulator:
+    columns = [dates] if values is None else [dates, values]
+    frame = _read_file(path, columns, backend)
+    return _aggregate_chunk(
+        frame.get_column(dates),
+        None if values is None else frame.get_column(values),
+        start_date,
+        end_date,
+    )
+
+
+def _merge_partials(
+    partials: Iterable[DailyAccumulator],
+    start_date: Optional[Union[date, datetime, str]],
+    end_date: Optional[Union[date, datetime, str]],
+) -> DailyAccumulator:
+    acc = DailyAccumulator(start_date, end_date)
+    for partial in partials:
+        acc.merge(partial)
+    return acc
+
+
+def aggregate_daily(
+    dates: Any,
+    values: Any = None,
+    workers: Optional[int] = None,
+    start_date: Optional[Union[date, datetime, str]] = None,
+    end_date: Optional[Union[date, datetime, str]] = None,
+) -> DailyAccumulator:
+    """
+    Sum events per day, using several processes.
+
+    The events are split in one chunk per worker. Each worker parses its dates
+    and sums its values per day, and the daily partial sums are then merged.
+
+    Args:
+        dates: Date-like objects, in any format accepted by `dayplot.calendar()`.
+        values: Numeric values of the events. If None, each event counts as 1.
+        workers: Number of worker processes. If None, the number of CPUs is used. If 1,
+            events are aggregated in the current process.
+        start_date: If provided, events before this date are ignored.
+        end_date: If provided, events after this date are ignored.
+
+    Returns:
+        A `dayplot.DailyAccumulator` with the daily totals, whose `dates` and `values`
+            can be passed to `dayplot.calendar()`.
+    """
+    workers = workers or os.cpu_count() or 1
+    dates = _to_numpy(dates)
+    if values is not None:
+        values = _to_numpy(values)
+        if len(values) != len(dates):
+            raise ValueError("`dates` and `values` must have the same length.")
+
+    if workers == 1:
+        return _aggregate_chunk(dates, values, start_date, end_date)
+
+    date_chunks = np.array_split(dates, workers)
+    value_chunks = repeat(None) if values is None else np.array_split(values, workers)
+    with ProcessPoolExecutor(workers) as pool:
+        partials = pool.map(
+            _aggregate_chunk,
+            date_chunks,
+            value_chunks,
+            repeat(start_date),
+            repeat(end_date),
+        )
+        return _merge_partials(partials, start_date, end_date)
+
+
+def aggregate_files(
+    paths: Sequence[Union[str, "os.PathLike[str]"]],
+    dates: str = "dates",
+    values: Optional[str] = "values",
+    backend: Literal["pandas", "polars", "pyarrow", "modin", "cudf"] = "pandas",
+    workers: Optional[int] = None,
+    start_date: Optional[Union[date, datetime, str]] = None,
+    end_date: Optional[Union[date, datetime, str]] = None,
+) -> DailyAccumulator:
+    """
+    Sum the events of several CSV or Parquet files per day, using several processes.
+
+    Each worker reads a file at a time and sums its values per day, and the daily
+    partial sums are then merged, so only the daily totals of each file are sent
+    back from the workers.
+
+    Args:
+        paths: Paths of CSV (".csv") or Parquet (".parquet", ".pq") files.
+        dates: Name of the date column.
+        values: Name of the value column. If None, each row counts as 1.
+        backend: The library used to read files (see `dayplot.load_dataset()`).
+        workers: Number of worker processes. If None, the number of CPUs is used. If 1,
+            files are aggregated in the current process.
+        start_date: If provided, events before this date are ignored.
+        end_date: If provided, events after this date are ignored.
+
+    Returns:
+        A `dayplot.DailyAccumulator` with the daily totals, whose `dates` and `values`
+            can be passed to `dayplot.calendar()`.
+    """
+    workers = workers or os.cpu_count() or 1
+    paths = [os.fspath(path) for path in paths]
+    args = (
+        paths,
+        repeat(dates),
+        repeat(values),
+        repeat(backend),
+        repeat(start_date),
+        repeat(end_date),
+    )
+
+    if workers == 1:
+        return _merge_partials(map(_aggregate_file, *args), start_date, end_date)
+
+    with ProcessPoolExecutor(min(workers, max(len(paths), 1))) as pool:
+        return _merge_partials(pool.map(_aggregate_file, *args), start_date, end_date)
+
+
+def scan_daily(
+    source: Any,
+    dates: str = "dates",
+    values: Optional[str] = "values",
+    start_date: Optional[Union[date, datetime, str]] = None,
+    end_date: Optional[Union[date, datetime, str]] = None,
+    backend: Optional[Literal["polars", "pyarrow", "pandas"]] = None,
+) -> DailyAccumulator:
+    """
+    Sum the events of a CSV or Parquet file, or of a lazy frame, per day, without
+    loading the events in memory.
+
+    The date range filter and the daily group-by are run lazily by the backend, so
+    only the daily totals are collected. With polars, the file is scanned in a
+    streaming way and the date range filter is pushed down to the reader (e.g.,
+    row groups of a Parquet file outside the range are skipped).
+
+    Args:
+        source: Path of a CSV (".csv") or Parquet (".parquet", ".pq") file, or a
+            lazy frame (or dataframe) supported by narwhals (e.g., a `polars.LazyFrame`).
+        dates: Name of the date column. It can contain dates, datetimes or strings
+            starting with a "YYYY-MM-DD" date.
+        values: Name of the value column. If None, each row counts as 1.
+        start_date: If provided, events before this date are ignored.
+        end_date: If provided, events after this date are ignored.
+        backend: The library used to scan files: "polars", "pyarrow" or "pandas". If
+            None, polars is used if installed, else pyarrow. Ignored if `source` is
+            not a path.
+
+    Returns:
+        A `dayplot.DailyAccumulator` with the daily totals, whose `dates` and `values`
+            can be passed to `dayplot.calendar()`.
+    """
+    frame = _scan_source(source, backend)
+    days, sums, rows = _daily_totals(frame, dates, values, start_date, end_date)
+    acc = DailyAccumulator(start_date, end_date)
+    acc.add(days, sums)
+    acc.n_events = int(rows.sum())
+    return acc
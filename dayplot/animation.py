@@ -0,0 +1,90 @@
+from collections.abc import Sequence
+from typing import Any, Optional, cast
+
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.animation import FuncAnimation
+from matplotlib.axes import Axes
+from matplotlib.collections import PathCollection
+from matplotlib.figure import Figure
+
+from dayplot.calendar import CalendarHandle, calendar
+
+
+class _FillFrames:
+    """
+    Frame function of `animate_calendar()`: frame `k` shows the colors of the
+    first `k` days and leaves the following days empty.
+    """
+
+    def __init__(self, handle: CalendarHandle):
+        self.cells = cast(PathCollection, handle.cells)
+        self.final_colors = np.array(self.cells.get_facecolor())
+        self.empty_colors = np.broadcast_to(
+            handle._empty_color(), self.final_colors.shape
+        )
+        self.day_index = np.arange(len(self.final_colors))
+
+    def __call__(self, n_filled: int) -> list[PathCollection]:
+        filled = (self.day_index < n_filled)[:, None]
+        self.cells.set_facecolor(
+            cast(Sequence, np.where(filled, self.final_colors, self.empty_colors))
+        )
+        return [self.cells]
+
+
+def animate_calendar(
+    dates: Any,
+    values: Any,
+    days_per_frame: int = 1,
+    interval: float = 40,
+    repeat: bool = False,
+    ax: Optional[Axes] = None,
+    **kwargs: Any,
+) -> FuncAnimation:
+    """
+    Animate a calendar heatmap filling in over time, one day (or several) per
+    frame.
+
+    The calendar is drawn once with the colors of the full data, so the color
+    scale is stable across frames. Labels, month grid and legend are static:
+    with blitting, they are rendered once into a cached background, and each
+    frame only redraws the single artist holding the day cells.
+
+    Args:
+        dates: Date-like objects, in any format accepted by `dayplot.calendar()`.
+        values: Values corresponding to each date in dates.
+        days_per_frame: Number of days revealed at each frame.
+        interval: Delay between frames, in milliseconds.
+        repeat: Whether the animation repeats when the sequence of frames is
+            completed.
+        ax: A matplotlib axes. If None, plt.gca() will be used.
+        kwargs: Any additional arguments that will be passed to `dayplot.calendar()`
+            (except `render` and `return_handle`).
+
+    Returns:
+        A `matplotlib.animation.FuncAnimation` using blitting. Keep a reference to
+            it until the animation is shown or saved (e.g., with `anim.save("year.gif")`).
+    """
+    if days_per_frame < 1:
+        raise ValueError("`days_per_frame` must be a positive integer.")
+
+    ax = ax or plt.gca()
+    handle = cast(
+        CalendarHandle,
+        calendar(
+            dates, values, render="collection", return_handle=True, ax=ax, **kwargs
+        ),
+    )
+    frames = _FillFrames(handle)
+    n_days = len(frames.day_index)
+
+    return FuncAnimation(
+        cast(Figure, ax.figure),
+        frames,
+        frames=[*range(0, n_days, days_per_frame), n_days],
+        init_func=lambda: frames(0),
+        interval=interval,
+        repeat=repeat,
+        blit=True,
+    )
@@ -1,22 +1,47 @@
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 import matplotlib.colors as mcolors
+from matplotlib.collections import PathCollection
+from matplotlib.image import PcolorImage
+from matplotlib.font_manager import FontProperties
+from matplotlib.text import Text
+from matplotlib.textpath import text_to_path
 from matplotlib.path import Path
+from matplotlib.transforms import Affine2DBase, AffineDeltaTransform
 from matplotlib.colors import LinearSegmentedColormap, Normalize, TwoSlopeNorm
 from matplotlib.axes import Axes
 from matplotlib.colors import Colormap
+import narwhals as nw
+from narwhals.typing import IntoDataFrame, IntoSeries
 import numpy as np
-from calendar import Calendar, day_name, day_abbr
+from calendar import Calendar, day_name, day_abbr, month_abbr
 
-from collections import defaultdict
+from collections import OrderedDict
 from collections.abc import Mapping, Sequence
-from datetime import date, datetime, timedelta
-from itertools import chain
+from datetime import date, datetime
+from functools import cached_property, lru_cache
+from itertools import chain, count
 from numbers import Real
-from typing import List, Union, Optional, Dict, Any, Literal, cast
+from typing import Callable, List, Union, Optional, Dict, Any, Literal, cast
+import re
+import threading
 import warnings
 
-from dayplot.utils import _parse_date, date_range, relative_date_add
+from dayplot.utils import (
+    _daily_totals,
+    _date_to_datetime64,
+    _datetime64_to_date,
+    _factorize,
+    _filter_days,
+    _null_days,
+    _parse_date,
+    _to_datetime64,
+    _to_numpy,
+    _to_series,
+    month_starts,
+    week_positions,
+    week_starts,
+)
 
 
 IMPLEMENTED_BOXSTYLE = [
@@ -35,7 +60,37 @@ NOT_IMPLEMENTED_BOXSTYLE = [
     "darrow",
 ]
 
-_MISSING = object()
+RENDER_MODES = ["patches", "collection", "image"]
+
+# Color limits given as quantiles of the daily values, e.g. "p99".
+_QUANTILE_PATTERN = re.compile(r"p(\d+(?:\.\d*)?)")
+
+AGGREGATIONS = ["sum", "mean", "min", "max", "count", "median"]
+
+GRANULARITIES = ["day", "week", "month", "auto"]
+
+# With `granularity="auto"`, the finest granularity whose cells are at least
+# this many pixels wide, and which has at most this many cells, is used.
+_LOD_MIN_CELL_PIXELS = 4.0
+_LOD_MAX_CELLS = 5000
+
+# Aggregations whose results on daily results equal those on the raw values,
+# and the reduction giving them.
+_REAGGREGATIONS = {"sum": "sum", "count": "sum", "min": "min", "max": "max"}
+
+# `FancyBboxPatch` arguments that shape the box itself rather than its style.
+_BOX_SHAPE_KWARGS = ("mutation_scale", "mutation_aspect")
+
+_DEFAULT_COLOR_FOR_NONE = "#e8e8e8"
+
+# Steps (in months) between month labels that divide a year, so the same months
+# are labeled every year. Longer steps are whole years.
+_MONTH_LABEL_STEPS = (1, 2, 3, 4, 6)
+_YEAR_LABEL_STEPS = (1, 2, 5)
+
+_COLOR_LUT_CACHE_SIZE = 32
+_color_luts: "OrderedDict[int, tuple[Colormap, np.ndarray]]" = OrderedDict()
+_color_luts_lock = threading.Lock()
 
 
 class _DefaultArg:
@@ -59,18 +114,20 @@ def _is_numeric_value(value: Any) -> bool:
     return isinstance(value, Real) and not isinstance(value, bool)
 
 
-def _is_numeric_values(values) -> bool:
-    return all(_is_numeric_value(value) for value in values)
+def _is_categorical_column(series: Optional[nw.Series]) -> bool:
+    """Whether `series` is a dataframe column of strings or categories."""
+    if series is None:
+        return False
+    dtype = series.dtype
+    return dtype == nw.String or dtype == nw.Categorical or dtype == nw.Enum
 
 
-def _unique_values_in_order(values) -> list[Any]:
-    unique_values = []
-    seen = set()
-    for value in values:
-        if value not in seen:
-            seen.add(value)
-            unique_values.append(value)
-    return unique_values
+def _is_numeric_values(values: np.ndarray) -> bool:
+    if values.dtype.kind in "iuf":
+        return True
+    if values.dtype.kind == "O":
+        return all(_is_numeric_value(value) for value in values)
+    return False
 
 
 def _validate_categorical_arguments(
@@ -81,6 +138,8 @@ def _validate_categorical_arguments(
     legend_bins: Any,
     less_label: Any,
     more_label: Any,
+    agg: Any = "sum",
+    norm: Any = None,
 ) -> None:
     invalid_args = []
     if cmap is not _DEFAULT_CMAP:
@@ -97,6 +156,10 @@ def _validate_categorical_arguments(
         invalid_args.append("less_label")
     if more_label is not _DEFAULT_MORE_LABEL:
         invalid_args.append("more_label")
+    if not (isinstance(agg, str) and agg == "sum"):
+        invalid_args.append("agg")
+    if norm is not None:
+        invalid_args.append("norm")
 
     if invalid_args:
         invalid_args_text = ", ".join(f"`{arg}`" for arg in invalid_args)
@@ -145,7 +208,7 @@ def _validate_colors(colors: Any, categories: list[Any]) -> dict[Any, Any]:
     return color_map
 
 
-def _validate_inputs(boxstyle, dates, values):
+def _validate_boxstyle(boxstyle):
     if isinstance(boxstyle, str):
         if boxstyle not in IMPLEMENTED_BOXSTYLE:
             if boxstyle in NOT_IMPLEMENTED_BOXSTYLE:
@@ -159,6 +222,11 @@ def _validate_inputs(boxstyle, dates, values):
             f"`boxstyle` must either be a string or a `matplotlib.patches.BoxStyle`, not {boxstyle}"
         )
 
+
+def _validate_inputs(boxstyle, dates, values):
+    if _validate_boxstyle(boxstyle) is NotImplementedError:
+        return NotImplementedError
+
     if len(dates) != len(values):
         raise ValueError("`dates` and `values` must have the same length.")
 
@@ -166,9 +234,46 @@ def _validate_inputs(boxstyle, dates, values):
         raise ValueError("`dates` and `values` cannot be empty.")
 
 
+def _validate_render(
+    render: str,
+    boxstyle: Union[str, patches.BoxStyle] = "square",
+    edgewidth: float = 0.0,
+    kwargs: Optional[Dict] = None,
+) -> None:
+    if render not in RENDER_MODES:
+        raise ValueError(f"Invalid `render` value. Must be in {RENDER_MODES}")
+
+    if render == "image" and (
+        boxstyle != "square"
+        or edgewidth
+        or any(key in (kwargs or {}) for key in _BOX_SHAPE_KWARGS)
+    ):
+        raise ValueError(
+            '`render="image"` only supports square cells without edges '
+            '(`boxstyle="square"`, `edgewidth=0` and no `mutation_scale`/`mutation_aspect`).'
+        )
+
+
+def _validate_agg(agg: Any) -> None:
+    if not callable(agg) and agg not in AGGREGATIONS:
+        raise ValueError(
+            f"Invalid `agg` value. Must be in {AGGREGATIONS} or a callable."
+        )
+
+
+def _validate_granularity(granularity: Any) -> None:
+    if granularity not in GRANULARITIES:
+        raise ValueError(f"Invalid `granularity` value. Must be in {GRANULARITIES}.")
+
+
+@lru_cache(maxsize=None)
+def _get_named_cmap(name: str) -> Colormap:
+    return plt.get_cmap(name)
+
+
 def _validate_cmap(cmap: Union[str, LinearSegmentedColormap]) -> Colormap:
     if isinstance(cmap, str):
-        return plt.get_cmap(cmap)
+        return _get_named_cmap(cmap)
     elif not isinstance(cmap, LinearSegmentedColormap):
         raise ValueError(
             "Invalid `cmap` input. It must be either a valid matplotlib colormap string "
@@ -178,21 +283,87 @@ def _validate_cmap(cmap: Union[str, LinearSegmentedColormap]) -> Colormap:
     return cmap
 
 
+def _cmap_lut(cmap: Colormap) -> np.ndarray:
+    """
+    Return the RGBA lookup table of `cmap`, followed by its "under", "over"
+    and "bad" colors. Tables are cached per colormap instance.
+    """
+    key = id(cmap)
+    with _color_luts_lock:
+        cached = _color_luts.get(key)
+        if cached is not None and cached[0] is cmap:
+            _color_luts.move_to_end(key)
+            return cached[1]
+
+    lut = np.vstack(
+        [
+            cmap(np.arange(cmap.N)),
+            cmap.get_under(),
+            cmap.get_over(),
+            cmap.get_bad(),
+        ]
+    )
+    lut.setflags(write=False)
+    with _color_luts_lock:
+        _color_luts[key] = (cmap, lut)
+        while len(_color_luts) > _COLOR_LUT_CACHE_SIZE:
+            _color_luts.popitem(last=False)
+    return lut
+
+
+def _map_colors(cmap: Colormap, normed: Any) -> np.ndarray:
+    """
+    Map normalized values to RGBA colors in one pass, following the same
+    binning rules as `Colormap.__call__`.
+    """
+    lut = _cmap_lut(cmap)
+    n = cmap.N
+    scaled = np.ma.filled(np.ma.asarray(normed, dtype=float), np.nan) * n
+    bad = np.isnan(scaled)
+    under = scaled < 0
+    over = scaled > n
+    scaled[bad] = 0
+    indices = np.clip(scaled, 0, n - 1).astype(np.intp)
+    indices[under] = n
+    indices[over] = n + 1
+    indices[bad] = n + 2
+    return lut[indices]
+
+
+def _data_date_range(day_numbers: np.ndarray) -> tuple[Optional[date], Optional[date]]:
+    """
+    Return the first and last dates of day numbers, ignoring null dates (NaT), or
+    None if there are no dates.
+    """
+    day_numbers = day_numbers[~_null_days(day_numbers)]
+    if not len(day_numbers):
+        return None, None
+    return (
+        _datetime64_to_date(day_numbers.min().astype("datetime64[D]")),
+        _datetime64_to_date(day_numbers.max().astype("datetime64[D]")),
+    )
+
+
 def _get_start_and_end_dates(
-    date_counts: dict[date, Any],
+    min_data_date: Optional[date],
+    max_data_date: Optional[date],
     start_date: Union[datetime, str, date, None],
     end_date: Union[datetime, str, date, None],
 ) -> tuple[date, date]:
-    min_data_date = min(date_counts.keys())
-    max_data_date = max(date_counts.keys())
+    if (start_date is None and min_data_date is None) or (
+        end_date is None and max_data_date is None
+    ):
+        raise ValueError(
+            "`start_date` and `end_date` must be provided when `dates` has no date."
+        )
 
     if start_date is None:
-        start_date = min_data_date
+        start_date = cast(date, min_data_date)
     else:
         start_date = _parse_date(start_date)
 
     if end_date is None:
-        end_date = max_data_date
+        end_date = cast(date, max_data_date)
     else:
         end_date = _parse_date(end_date)
 
@@ -209,6 +380,416 @@ def _get_start_and_end_dates(
     return start_date, end_date
 
 
+def _aggregate_numeric(
+    offsets: np.ndarray,
+    values: np.ndarray,
+    n_days: int,
+    agg: Union[str, Callable[[np.ndarray], Any]] = "sum",
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce `values` per day offset in `[0, n_days)` with `agg`, one of
+    `AGGREGATIONS` or a callable taking the values of a day.
+
+    Returns the daily results (0 for days without data) and a boolean mask of
+    the days that have data. Rows outside the window, and NaN values (missing
+    data), are dropped before aggregating.
+    """
+    in_window = (offsets >= 0) & (offsets < n_days) & ~np.isnan(values)
+    offsets, values = offsets[in_window], values[in_window]
+    sizes = np.bincount(offsets, minlength=n_days)
+    observed = sizes > 0
+    if agg == "sum":
+        return np.bincount(offsets, weights=values, minlength=n_days), observed
+    if agg == "count":
+        return sizes.astype(float), observed
+    if agg == "mean":
+        sums = np.bincount(offsets, weights=values, minlength=n_days)
+        return np.divide(sums, sizes, out=np.zeros(n_days), where=observed), observed
+
+    if agg in ("min", "max"):
+        results = np.full(n_days, np.inf if agg == "min" else -np.inf)
+        reduce = np.minimum if agg == "min" else np.maximum
+        reduce.at(results, offsets, values)
+        results[~observed] = 0.0
+        return results, observed
+
+    # Sort the values by day, keeping their order within a day (sorted first
+    # for the median), so that each day is a contiguous run of `lengths` values
+    # starting at `starts`. Day offsets usually fit in 16 bits, for which
+    # NumPy's stable sort is a radix sort.
+    order = np.argsort(values) if agg == "median" else np.arange(len(values))
+    day_keys = offsets[order].astype(np.uint16 if n_days <= 2**16 else np.int64)
+    values = values[order[np.argsort(day_keys, kind="stable")]]
+    days = np.flatnonzero(observed)
+    lengths = sizes[days]
+    starts = np.cumsum(lengths) - lengths
+    results = np.zeros(n_days)
+    if agg == "median":
+        lower = values[starts + (lengths - 1) // 2]
+        upper = values[starts + lengths // 2]
+        results[days] = (lower + upper) / 2
+    else:
+        results[days] = [
+            cast(Callable, agg)(day_values)
+            for day_values in np.split(values, starts[1:])
+        ]
+    return results, observed
+
+
+def _aggregate_last(offsets: np.ndarray, n_days: int) -> np.ndarray:
+    """
+    Return, for each day offset in `[0, n_days)`, the index of the last input
+    row falling on that day, or -1 when the day has no data.
+    """
+    in_window = (offsets >= 0) & (offsets < n_days)
+    last = np.full(n_days, -1, dtype=np.intp)
+    np.maximum.at(last, offsets[in_window], np.flatnonzero(in_window))
+    return last
+
+
+def _parse_quantile(limit: Any, name: str) -> Optional[float]:
+    """
+    Return the quantile (in [0, 1]) of a "pXX" color limit such as "p99", or
+    None if `limit` is not a string.
+    """
+    if not isinstance(limit, str):
+        return None
+    match = _QUANTILE_PATTERN.fullmatch(limit)
+    if match is None or float(match.group(1)) > 100:
+        raise ValueError(
+            f'Invalid `{name}` value {limit!r}. Quantiles must be given as "pXX", '
+            'with XX between 0 and 100 (e.g., "p99" or "p0.5").'
+        )
+    return float(match.group(1)) / 100
+
+
+def _quantile_limits(
+    counts: np.ndarray, observed: np.ndarray, vmin: Any, vmax: Any
+) -> tuple[Any, Any]:
+    """
+    Replace "pXX" color limits by the quantiles of the daily values of the days
+    that have data (or None if no day has data).
+    """
+    quantiles = [_parse_quantile(vmin, "vmin"), _parse_quantile(vmax, "vmax")]
+    if quantiles == [None, None]:
+        return vmin, vmax
+
+    observed_counts = counts[observed]
+    limits = [vmin, vmax]
+    for i, q in enumerate(quantiles):
+        if q is not None:
+            limits[i] = (
+                np.quantile(observed_counts, q) if len(observed_counts) else None
+            )
+    return limits[0], limits[1]
+
+
+def _observed_range(counts: np.ndarray, observed: np.ndarray) -> tuple[Any, Any]:
+    observed_counts = counts[observed]
+    if len(observed_counts):
+        return observed_counts.min(), observed_counts.max()
+    return 0.0, 0.0
+
+
+def _numeric_norm(
+    min_count: Any, max_count: Any, vmin: Any, vmax: Any, vcenter: Any
+) -> tuple[Normalize, bool, Any, Any]:
+    """
+    Return the norm used to color numeric data, whether it is diverging, and
+    the resolved `vmin` and `vmax`.
+    """
+    if vmin is None:
+        vmin = min_count
+    if vmax is None:
+        vmax = max_count if max_count != 0 else 1
+
+    if vcenter is not None:
+        is_diverging = True
+        norm = TwoSlopeNorm(
+            vmin=cast(float, vmin),
+            vcenter=cast(float, vcenter),
+            vmax=cast(float, vmax),
+        )
+    else:
+        # If we have both negative and positive values, use a diverging
+        # scale with a center of 0. Otherwise, use a simple Normalize.
+        if min_count < 0 < max_count:
+            is_diverging = True
+            norm = TwoSlopeNorm(
+                vmin=cast(float, vmin), vcenter=0, vmax=cast(float, vmax)
+            )
+        else:
+            is_diverging = False
+            norm = Normalize(vmin=cast(float, vmin), vmax=cast(float, vmax))
+
+    return norm, is_diverging, vmin, vmax
+
+
+def _resolve_color_for_none(is_diverging: bool, color_for_none: Any) -> Any:
+    if is_diverging:
+        if color_for_none is not None:
+            warnings.warn(
+                "`color_for_none` argument is ignored when `values` "
+                "argument contains negative values.",
+                UserWarning,
+            )
+        return color_for_none
+    return _DEFAULT_COLOR_FOR_NONE if color_for_none is None else color_for_none
+
+
+def _numeric_face_colors(
+    cmap: Colormap,
+    norm: Normalize,
+    counts: np.ndarray,
+    is_diverging: bool,
+    color_for_none: Any,
+) -> np.ndarray:
+    face_colors = _map_colors(cmap, norm(counts))
+    if not is_diverging:
+        face_colors[counts == 0] = mcolors.to_rgba(color_for_none)
+    return face_colors
+
+
+def _validate_month_label_step(month_label_step: Union[int, str]) -> None:
+    if month_label_step == "auto":
+        return
+    if (
+        not isinstance(month_label_step, int)
+        or isinstance(month_label_step, bool)
+        or month_label_step < 1
+    ):
+        raise ValueError('`month_label_step` must be a positive integer or "auto".')
+
+
+@lru_cache(maxsize=256)
+def _text_width(text: str, fontproperties: FontProperties) -> float:
+    """Width of `text`, in points."""
+    return text_to_path.get_text_width_height_descent(
+        text, fontproperties, ismath=False
+    )[0]
+
+
+def _cell_size(ax: Axes, layout: "_Layout") -> float:
+    """
+    Size of a cell (and of the gap around it), in pixels. Cells are square, so
+    the axes fit either the columns or the rows of the layout (with the margins
+    set by `_setup_axes`).
+    """
+    return min(
+        ax.bbox.width / (layout.total_weeks + 1),
+        ax.bbox.height / (layout.n_rows + 1),
+    )
+
+
+def _auto_month_label_step(ax: Axes, layout: "_Layout", month_text_style: dict) -> int:
+    """
+    Return the smallest step (in months) between month labels so that labels do
+    not overlap, given the current size of the axes.
+    """
+    fontproperties = Text(**month_text_style).get_fontproperties()
+    padding = fontproperties.get_size_in_points() / 2
+    column_width = _cell_size(ax, layout) * 72 / ax.figure.dpi
+
+    month_width = max(_text_width(name, fontproperties) for name in month_abbr[1:])
+    for step in _MONTH_LABEL_STEPS:
+        # Consecutive labels are at least `month_columns` columns apart per
+        # month of step.
+        if layout.month_columns * step * column_width >= month_width + padding:
+            return step
+
+    year_width = _text_width(str(layout.end_date.year), fontproperties)
+    for magnitude in count():
+        for years in _YEAR_LABEL_STEPS:
+            step = years * 10**magnitude
+            if layout.year_columns * step * column_width >= year_width + padding:
+                return 12 * step
+    raise AssertionError("unreachable")
+
+
+def _draw_month_labels(
+    ax: Axes,
+    layout: "_Layout",
+    y: float,
+    month_kws: dict,
+    x_offset: float = 0.0,
+    step: Union[int, str] = 1,
+    readable: bool = False,
+) -> None:
+    """
+    Label every `step` months, counted from January of year 0 so that labels are
+    evenly spaced across years. Multiples of 12 months label Januaries with their
+    year, and other steps from 12 months label months with their year. If
+    `readable`, integer steps are raised to the "auto" step when labels would
+    overlap.
+    """
+    month_text_style: dict[str, Any] = dict(ha="left", va="top", size=10)
+    month_text_style.update(month_kws)
+
+    if step == "auto":
+        step = _auto_month_label_step(ax, layout, month_text_style)
+    elif readable:
+        step = max(
+            cast(int, step), _auto_month_label_step(ax, layout, month_text_style)
+        )
+    step = cast(int, step)
+
+    for m_start, week_of_month in zip(layout.month_starts, layout.month_weeks.tolist()):
+        if (m_start.year * 12 + m_start.month - 1) % step:
+            continue
+        if step < 12:
+            label = m_start.strftime("%b")
+        elif step % 12 == 0:
+            label = str(m_start.year)
+        else:
+            label = m_start.strftime("%b %Y")
+        ax.text(
+            x_offset + week_of_month + 0.1,
+            y,
+            label,
+            **month_text_style,
+        )
+
+
+def _draw_day_labels(
+    ax: Axes, firstweekday: int, x: float, day_kws: dict, y_offset: float = 0.0
+) -> None:
+    # Create labels in the adjusted order based on week_starts_on
+    labels = [day_abbr[(firstweekday + i) % 7] for i in range(7)]
+    _draw_row_labels(ax, labels, x, day_kws, y_offset)
+
+
+def _draw_row_labels(
+    ax: Axes, labels: Sequence[str], x: float, day_kws: dict, y_offset: float = 0.0
+) -> None:
+    day_text_style: dict[str, Any] = dict(
+        transform=ax.get_yaxis_transform(), ha="left", va="center", size=10
+    )
+    day_text_style.update(day_kws)
+
+    for row, label in enumerate(labels):
+        ax.text(x, y_offset + row + 0.5, label, **day_text_style)
+
+
+def _setup_axes(ax: Axes, width: float, height: float) -> None:
+    ax.spines[["top", "right", "left", "bottom"]].set_visible(False)
+    ax.set_xlim(-0.5, width + 0.5)
+    ax.set_ylim(-0.5, height + 0.5)
+    ax.set_xticks([])
+    ax.set_yticks([])
+    ax.invert_yaxis()
+    ax.set_aspect("equal")
+
+
+def _box_template_path(boxstyle: Union[str, patches.BoxStyle], **kwargs: Any) -> Path:
+    """
+    Return the outline of a single day cell, centered on the origin.
+
+    The path is computed once by a `FancyBboxPatch` so that every implemented
+    `boxstyle` (and `mutation_scale`/`mutation_aspect`) is rendered exactly
+    like the patch-based cells. Paths of named box styles are cached.
+    """
+    shape = tuple((k, kwargs[k]) for k in _BOX_SHAPE_KWARGS if k in kwargs)
+    if isinstance(boxstyle, str):
+        try:
+            return _named_box_template_path(boxstyle, shape)
+        except TypeError:  # unhashable `mutation_scale` or `mutation_aspect`
+            pass
+    return _new_box_template_path(boxstyle, shape)
+
+
+def _new_box_template_path(
+    boxstyle: Union[str, patches.BoxStyle], shape: tuple[tuple[str, Any], ...]
+) -> Path:
+    template = patches.FancyBboxPatch(
+        xy=(-0.15, -0.15), width=0.3, height=0.3, boxstyle=boxstyle, **dict(shape)
+    )
+    return template.get_path()
+
+
+@lru_cache(maxsize=64)
+def _named_box_template_path(boxstyle: str, shape: tuple[tuple[str, Any], ...]) -> Path:
+    path = _new_box_template_path(boxstyle, shape)
+    # Shared by every collection drawn with this style.
+    return Path(path.vertices, path.codes, readonly=True)
+
+
+def _draw_cell_collection(
+    ax: Axes,
+    weeks: Any,
+    weekdays: Any,
+    facecolors: Any,
+    edgecolor: Any,
+    edgewidth: float,
+    boxstyle: Union[str, patches.BoxStyle],
+    **kwargs: Any,
+) -> PathCollection:
+    """
+    Draw all day cells as a single `PathCollection`.
+
+    One template path is shared by every cell and placed at the cell centers
+    through the collection offsets, so the cost of building and drawing the
+    artist barely grows with the number of days.
+    """
+    offsets = np.column_stack(
+        [np.asarray(weeks, dtype=float) + 0.5, np.asarray(weekdays, dtype=float) + 0.5]
+    )
+    collection = PathCollection(
+        [_box_template_path(boxstyle, **kwargs)],
+        offsets=offsets,
+        offset_transform=ax.transData,
+        facecolors=facecolors,
+        edgecolors=edgecolor,
+        linewidths=edgewidth,
+        **{k: v for k, v in kwargs.items() if k not in _BOX_SHAPE_KWARGS},
+    )
+    # Scale the template with the data coordinates, but leave the translation
+    # to the offsets.
+    collection.set_transform(AffineDeltaTransform(cast(Affine2DBase, ax.transData)))
+    ax.add_collection(collection, autolim=False)
+    return collection
+
+
+def _cell_image_edges(n_cells: int) -> np.ndarray:
+    """
+    Return the boundaries of `n_cells` day cells and of the gaps between them,
+    along one axis. A square cell spans 0.9 of its unit, centered in it.
+    """
+    starts = np.arange(n_cells, dtype=float)
+    return np.column_stack([starts + 0.05, starts + 0.95]).ravel()
+
+
+def _cell_image(
+    layout: "_Layout", facecolors: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Return the column and row edges and the RGBA array of `_draw_cell_image`,
+    from the layout: cells are on even rows and columns, and the gaps between
+    them are transparent.
+    """
+    data = np.zeros((2 * layout.n_rows - 1, 2 * layout.total_weeks - 1, 4))
+    data[2 * layout.weekdays, 2 * layout.weeks] = facecolors
+    return (
+        _cell_image_edges(layout.total_weeks),
+        _cell_image_edges(layout.n_rows),
+        data,
+    )
+
+
+def _draw_cell_image(
+    ax: Axes, layout: "_Layout", facecolors: np.ndarray, **kwargs: Any
+) -> PcolorImage:
+    """
+    Draw all (square, edgeless) day cells as a single image.
+
+    The image grid is irregular so that cells keep the exact size and spacing
+    of the patch-based cells, while the whole calendar is rasterized at once
+    (and embedded as one small image in vector outputs).
+    """
+    image = PcolorImage(ax, *_cell_image(layout, facecolors), **kwargs)
+    ax.add_image(image)
+    return image
+
+
 def calendar_week(cal: Calendar, date: date) -> list[date]:
     """
     Return the list of dates representing the calendar week containing `date`.
@@ -243,9 +824,474 @@ def calendar_week(cal: Calendar, date: date) -> list[date]:
     raise ValueError(msg)
 
 
+class _CalendarLayout:
+    """
+    Positions of the days, month labels and month grid of a calendar for a
+    given date window and first day of the week.
+
+    Layouts only depend on `(start_date, end_date, firstweekday)` and are
+    cached by `_get_layout`, so repeated renders of the same window skip
+    the layout work entirely.
+    """
+
+    n_rows = 7
+    # Minimum number of columns per month and per year, to space labels.
+    month_columns = 4
+    year_columns = 52
+
+    def __init__(self, start_date: date, end_date: date, firstweekday: int):
+        self.start_date = start_date
+        self.end_date = end_date
+        self.firstweekday = firstweekday
+        first_weeks = week_starts(
+            np.array([start_date, end_date], dtype="datetime64[D]"), firstweekday
+        )
+        self.cal_start_date = _datetime64_to_date(first_weeks[0])
+        self.total_weeks = (
+            int((first_weeks[1] - first_weeks[0]).astype(np.int64)) // 7 + 1
+        )
+        self.n_days = max((end_date - start_date).days + 1, 0)
+
+        self.weeks, self.weekdays = week_positions(
+            _date_to_datetime64(start_date) + np.arange(self.n_days),
+            start_date,
+            firstweekday,
+        )
+        starts = month_starts(start_date, end_date)
+        self.month_starts = tuple(starts.tolist())
+        self.month_weeks = week_positions(starts, start_date, firstweekday)[0]
+        for array in (self.weeks, self.weekdays, self.month_weeks):
+            array.setflags(write=False)
+
+    @property
+    def n_cells(self) -> int:
+        return self.n_days
+
+    @property
+    def row_labels(self) -> list[str]:
+        return [day_abbr[(self.firstweekday + i) % 7] for i in range(7)]
+
+    def cell_offsets(self, offsets: np.ndarray) -> np.ndarray:
+        """Map day offsets from `start_date` to cell indices (cells are days)."""
+        return offsets
+
+    @cached_property
+    def month_grid_path(self) -> Path:
+        """Outline of every month, as drawn with `month_grid=True`."""
+        # vertical grid around data within each months
+        verts, codes = [], []
+        last_month = _datetime64_to_date(np.datetime64(self.month_starts[-1], "M") + 1)
+        horizontal_gaps = []  # track horizontal lines that appear on the chart top
+        for m_start in chain(self.month_starts, [last_month]):
+            week_of_month = (m_start - self.cal_start_date).days // 7
+            day_of_week = (m_start.weekday() - self.firstweekday) % 7
+            if day_of_week == 0:
+                horizontal_gaps.append((week_of_month, week_of_month + 1))
+            verts.extend(
+                [
+                    (week_of_month, 7),
+                    (week_of_month, day_of_week),
+                    (week_of_month + 1, day_of_week),
+                    (week_of_month + 1, 0),
+                ]
+            )
+
+            codes.extend([Path.MOVETO, Path.LINETO, Path.LINETO, Path.LINETO])
+
+        # horizontal grid above/below data, ensuring they do not overlap with any lines drawn in the previous step.
+        last_week_of_month = (last_month - self.cal_start_date).days // 7
+        verts.extend(
+            [
+                # bottom line
+                (0, 7),
+                (last_week_of_month, 7),
+                # top line
+                (1, 0),
+                *((wk, 0) for gap in horizontal_gaps for wk in gap),
+                (last_week_of_month + 1, 0),
+            ]
+        )
+        codes.extend(
+            [
+                # bottom line
+                *[Path.MOVETO, Path.LINETO],
+                # top line
+                *[
+                    Path.MOVETO,
+                    *([Path.LINETO, Path.MOVETO] * len(horizontal_gaps)),
+                    Path.LINETO,
+                ],
+            ]
+        )
+
+        return Path(verts, codes, closed=False, readonly=True)
+
+
+class _PeriodLayout:
+    """
+    Positions of the cells of a calendar with one cell per week or per month,
+    for long date windows where day cells would be too small to see.
+
+    The layout nests periods like the daily one: weeks are the rows of their
+    month's column (by the day of the month they start on), and months the
+    rows of their year's column. `weeks` and `weekdays` hold the columns and
+    rows of the cells, so both layouts are drawn by the same code.
+    """
+
+    def __init__(
+        self,
+        start_date: date,
+        end_date: date,
+        firstweekday: int,
+        granularity: Literal["week", "month"],
+    ):
+        self.start_date = start_date
+        self.end_date = end_date
+        self.firstweekday = firstweekday
+        self.n_days = max((end_date - start_date).days + 1, 0)
+        start, end = np.array([start_date, end_date], dtype="datetime64[D]")
+        days = start + np.arange(self.n_days)
+
+        if granularity == "week":
+            first_week, last_week = week_starts(np.array([start, end]), firstweekday)
+            starts = np.arange(first_week, last_week + 1, 7)
+            months = starts.astype("datetime64[M]")
+            self._day_cells = (days - first_week).astype(np.int64) // 7
+            self.weeks = (months - months[0]).astype(np.int64)
+            self.weekdays = (starts - months.astype("datetime64[D]")).astype(
+                np.int64
+            ) // 7
+            self.n_rows = 5
+            self.month_columns, self.year_columns = 1, 12
+            self.row_labels = [f"W{row + 1}" for row in range(5)]
+            label_months = np.arange(months[0], months[-1] + 1)
+        else:
+            starts = month_starts(start_date, end_date)
+            months = starts.astype("datetime64[M]")
+            self._day_cells = (days.astype("datetime64[M]") - months[0]).astype(
+                np.int64
+            )
+            month_numbers = months.astype(np.int64)
+            self.weeks = month_numbers // 12 - month_numbers[0] // 12
+            self.weekdays = month_numbers % 12
+            self.n_rows = 12
+            # Columns are years, so months are never labeled.
+            self.month_columns, self.year_columns = 0, 1
+            self.row_labels = list(month_abbr[1:])
+            label_months = np.arange(
+                months[0].astype("datetime64[Y]"),
+                months[-1].astype("datetime64[Y]") + 1,
+            ).astype("datetime64[M]")
+
+        self.n_cells = len(starts)
+        self.total_weeks = int(self.weeks[-1]) + 1
+        # Labels are placed on the first month of every column.
+        self.month_starts = tuple(label_months.astype("datetime64[D]").tolist())
+        self.month_weeks = np.arange(len(label_months))
+        for array in (self.weeks, self.weekdays, self.month_weeks, self._day_cells):
+            array.setflags(write=False)
+
+    def cell_offsets(self, offsets: np.ndarray) -> np.ndarray:
+        """
+        Map day offsets from `start_date` to cell indices, and days outside the
+        window to -1.
+        """
+        in_window = (offsets >= 0) & (offsets < self.n_days)
+        return np.where(in_window, self._day_cells[np.where(in_window, offsets, 0)], -1)
+
+    @cached_property
+    def month_grid_path(self) -> Path:
+        """Outline of every column, as drawn with `month_grid=True`."""
+        first_rows = np.full(self.total_weeks, self.n_rows)
+        last_rows = np.zeros(self.total_weeks, dtype=np.int64)
+        np.minimum.at(first_rows, self.weeks, self.weekdays)
+        np.maximum.at(last_rows, self.weeks, self.weekdays + 1)
+
+        verts, codes = [], []
+        for column, (top, bottom) in enumerate(
+            zip(first_rows.tolist(), last_rows.tolist())
+        ):
+            verts.extend(
+                [
+                    (column, top),
+                    (column + 1, top),
+                    (column + 1, bottom),
+                    (column, bottom),
+                    (column, top),
+                ]
+            )
+            codes.extend([Path.MOVETO, *[Path.LINETO] * 3, Path.CLOSEPOLY])
+        return Path(verts, codes, readonly=True)
+
+
+_Layout = Union[_CalendarLayout, _PeriodLayout]
+
+
+@lru_cache(maxsize=128)
+def _get_layout(
+    start_date: date,
+    end_date: date,
+    firstweekday: int,
+    granularity: Literal["day", "week", "month"] = "day",
+) -> _Layout:
+    if granularity == "day":
+        return _CalendarLayout(start_date, end_date, firstweekday)
+    return _PeriodLayout(start_date, end_date, firstweekday, granularity)
+
+
+def _resolve_granularity(
+    ax: Axes, start_date: date, end_date: date, firstweekday: int
+) -> Literal["day", "week", "month"]:
+    """
+    Return the finest granularity whose cells are large enough to be seen in
+    `ax`, with at most `_LOD_MAX_CELLS` cells.
+    """
+    for granularity in ("day", "week"):
+        layout = _get_layout(start_date, end_date, firstweekday, granularity)
+        if (
+            layout.n_cells <= _LOD_MAX_CELLS
+            and _cell_size(ax, layout) >= _LOD_MIN_CELL_PIXELS
+        ):
+            return granularity
+    return "month"
+
+
+class CalendarHandle:
+    """
+    A calendar drawn by `dayplot.calendar(..., return_handle=True)`.
+
+    The handle keeps the daily data and the color scale of the calendar, so
+    new data only recomputes the colors of the cells that changed. The layout,
+    labels and month grid are never rebuilt.
+
+    Attributes:
+        ax: The matplotlib axes the calendar is drawn on.
+        cells: The day cells, as returned by `dayplot.calendar()`.
+    """
+
+    def __init__(
+        self,
+        ax: Axes,
+        cells: Union[List[patches.FancyBboxPatch], PathCollection, PcolorImage],
+        layout: _Layout,
+        face_colors: np.ndarray,
+        *,
+        counts: Optional[np.ndarray] = None,
+        observed: Optional[np.ndarray] = None,
+        cmap: Optional[Colormap] = None,
+        norm: Optional[Normalize] = None,
+        is_diverging: bool = False,
+        scale_args: Optional[tuple[Any, Any, Any]] = (None, None, None),
+        vmin: Any = None,
+        vmax: Any = None,
+        color_for_none_arg: Any = None,
+        color_for_none: Any = None,
+        codes: Optional[np.ndarray] = None,
+        palette: Optional[np.ndarray] = None,
+        categories: Optional[list[Any]] = None,
+        legend_rects: Optional[List[patches.FancyBboxPatch]] = None,
+        legend_label_artists: Optional[list[Any]] = None,
+        legend_labels_precision: Optional[int] = None,
+        agg: Union[str, Callable[[np.ndarray], Any]] = "sum",
+    ):
+        self.ax = ax
+        self.cells = cells
+        self._layout = layout
+        self._start_day = _date_to_datetime64(layout.start_date).astype(np.int64)
+        self._face_colors = face_colors
+        self._is_categorical = codes is not None
+
+        self._counts = counts
+        self._observed = observed
+        self._cmap = cmap
+        self._norm = norm
+        self._is_diverging = is_diverging
+        self._scale_args = scale_args
+        self._vmin = vmin
+        self._vmax = vmax
+        self._color_for_none_arg = color_for_none_arg
+        self._color_for_none = color_for_none
+
+        self._codes = codes
+        self._palette = palette
+        self._category_codes = {
+            category: i for i, category in enumerate(categories or [])
+        }
+
+        self._legend_rects = legend_rects or []
+        self._legend_label_artists = legend_label_artists or []
+        self._legend_labels_precision = legend_labels_precision
+        self._agg = agg
+
+    def set_values(self, dates: Any, values: Any) -> None:
+        """
+        Replace all the data of the calendar and recolor its cells in place.
+
+        Args:
+            dates: Date-like objects, in any format accepted by `dayplot.calendar()`.
+            values: Values corresponding to each date in dates. Numeric values of
+                duplicate dates are aggregated with the `agg` of the calendar, and
+                categorical values use the last value.
+        """
+        offsets, values = self._prepare(dates, values)
+        n_cells = self._layout.n_cells
+        if self._is_categorical:
+            last_rows = _aggregate_last(offsets, n_cells)
+            observed = last_rows >= 0
+            codes = np.full(n_cells, len(self._category_codes), dtype=np.intp)
+            codes[observed] = self._encode(values[last_rows[observed]])
+            self._codes = codes
+        else:
+            self._counts, self._observed = _aggregate_numeric(
+                offsets, values.astype(float, copy=False), n_cells, self._agg
+            )
+        self._recolor(None)
+
+    def update(self, dates: Any, values: Any) -> None:
+        """
+        Set the values of the given days and recolor only their cells. Days that
+        are not in `dates` keep their current value. When cells are weeks or months
+        (see `granularity`), the cells of the given days get the aggregate of the
+        new values only.
+
+        Args:
+            dates: Date-like objects, in any format accepted by `dayplot.calendar()`.
+            values: New values corresponding to each date in dates. Numeric values of
+                duplicate dates are aggregated with the `agg` of the calendar, and
+                categorical values use the last value.
+        """
+        offsets, values = self._prepare(dates, values)
+        n_cells = self._layout.n_cells
+        if self._is_categorical:
+            last_rows = _aggregate_last(offsets, n_cells)
+            changed = np.flatnonzero(last_rows >= 0)
+            cast(np.ndarray, self._codes)[changed] = self._encode(
+                values[last_rows[changed]]
+            )
+        else:
+            sums, observed = _aggregate_numeric(
+                offsets, values.astype(float, copy=False), n_cells, self._agg
+            )
+            changed = np.flatnonzero(observed)
+            cast(np.ndarray, self._counts)[changed] = sums[changed]
+            cast(np.ndarray, self._observed)[changed] = True
+        self._recolor(changed)
+
+    def _empty_color(self) -> np.ndarray:
+        """Color of a day without data."""
+        if self._is_categorical:
+            return cast(np.ndarray, self._palette)[-1]
+        return _numeric_face_colors(
+            cast(Colormap, self._cmap),
+            cast(Normalize, self._norm),
+            np.zeros(1),
+            self._is_diverging,
+            self._color_for_none,
+        )[0]
+
+    def _prepare(self, dates: Any, values: Any) -> tuple[np.ndarray, np.ndarray]:
+        if len(dates) != len(values):
+            raise ValueError("`dates` and `values` must have the same length.")
+        values = _to_numpy(values)
+        if not self._is_categorical and not _is_numeric_values(values):
+            raise ValueError("This calendar only accepts numeric `values`.")
+        offsets = _to_datetime64(dates).astype(np.int64) - self._start_day
+        return self._layout.cell_offsets(offsets), values
+
+    def _encode(self, values: Any) -> list[int]:
+        values = values.tolist()
+        unknown = [value for value in values if value not in self._category_codes]
+        if unknown:
+            unknown_text = ", ".join(repr(value) for value in dict.fromkeys(unknown))
+            raise ValueError(
+                f"Unknown categories: {unknown_text}. Only categories that were "
+                "displayed when the calendar was created can be used."
+            )
+        return [self._category_codes[value] for value in values]
+
+    def _recolor(self, changed: Optional[np.ndarray]) -> None:
+        """
+        Recompute the colors of the `changed` days (all days if None), push
+        them to the artists and request a redraw.
+        """
+        if self._is_categorical:
+            rows = slice(None) if changed is None else changed
+            self._face_colors[rows] = cast(np.ndarray, self._palette)[
+                cast(np.ndarray, self._codes)[rows]
+            ]
+        else:
+            counts = cast(np.ndarray, self._counts)
+            observed = cast(np.ndarray, self._observed)
+            if self._scale_args is None:
+                # A shared norm is kept whatever the data.
+                norm, is_diverging = self._norm, self._is_diverging
+                vmin, vmax = self._vmin, self._vmax
+            else:
+                min_count, max_count = _observed_range(counts, observed)
+                vmin, vmax, vcenter = self._scale_args
+                vmin, vmax = _quantile_limits(counts, observed, vmin, vmax)
+                norm, is_diverging, vmin, vmax = _numeric_norm(
+                    min_count, max_count, vmin, vmax, vcenter
+                )
+            if (vmin, vmax, is_diverging) != (
+                self._vmin,
+                self._vmax,
+                self._is_diverging,
+            ):
+                # The color scale moved: every cell and the legend change color.
+                self._norm, self._is_diverging = norm, is_diverging
+                self._vmin, self._vmax = vmin, vmax
+                self._color_for_none = _resolve_color_for_none(
+                    is_diverging, self._color_for_none_arg
+                )
+                self._recolor_legend()
+                changed = None
+
+            rows = slice(None) if changed is None else changed
+            self._face_colors[rows] = _numeric_face_colors(
+                cast(Colormap, self._cmap),
+                cast(Normalize, self._norm),
+                counts[rows],
+                self._is_diverging,
+                self._color_for_none,
+            )
+
+        self._set_cell_colors(changed)
+        self.ax.figure.canvas.draw_idle()
+
+    def _set_cell_colors(self, changed: Optional[np.ndarray]) -> None:
+        if isinstance(self.cells, PathCollection):
+            self.cells.set_facecolor(cast(Sequence, self._face_colors))
+            return
+        if isinstance(self.cells, PcolorImage):
+            self.cells.set_data(*_cell_image(self._layout, self._face_colors))
+            return
+        indices = range(len(self.cells)) if changed is None else changed.tolist()
+        for i in indices:
+            self.cells[i].set_facecolor(tuple(self._face_colors[i]))
+
+    def _recolor_legend(self) -> None:
+        if not self._legend_rects:
+            return
+        legend_values = np.linspace(
+            cast(float, self._vmin), cast(float, self._vmax), len(self._legend_rects)
+        )
+        legend_colors = _numeric_face_colors(
+            cast(Colormap, self._cmap),
+            cast(Normalize, self._norm),
+            legend_values,
+            self._is_diverging,
+            self._color_for_none,
+        )
+        for rect, color in zip(self._legend_rects, legend_colors):
+            rect.set_facecolor(tuple(color))
+        for text, val in zip(self._legend_label_artists, legend_values):
+            text.set_text(str(round(val, ndigits=self._legend_labels_precision)))
+
+
 def calendar(
-    dates: List[Union[date, datetime, str]],
-    values: List[Any],
+    dates: Union[List[Union[date, datetime, str]], IntoSeries, np.ndarray, str],
+    values: Union[List[Any], IntoSeries, np.ndarray, str],
     start_date: Optional[Union[date, datetime, str]] = None,
     end_date: Optional[Union[date, datetime, str]] = None,
     color_for_none: Optional[str] = None,
@@ -273,9 +1319,19 @@ def calendar(
     month_grid: bool = False,
     month_grid_kws: Dict = {},
     clip_on: bool = False,
+    month_label_step: Union[int, Literal["auto"]] = 1,
+    agg: Union[
+        Literal["sum", "mean", "min", "max", "count", "median"],
+        Callable[[np.ndarray], Any],
+    ] = "sum",
+    norm: Optional[Normalize] = None,
+    granularity: Literal["day", "week", "month", "auto"] = "day",
+    render: Literal["patches", "collection", "image"] = "patches",
+    return_handle: bool = False,
+    data: Optional[IntoDataFrame] = None,
     ax: Optional[Axes] = None,
     **kwargs: Any,
-) -> List[patches.FancyBboxPatch]:
+) -> Union[List[patches.FancyBboxPatch], PathCollection, PcolorImage, CalendarHandle]:
     """
     Create a calendar heatmap (GitHub-style) from input dates and values,
     supporting both positive and negative values via a suitable colormap scale.
@@ -292,10 +1348,15 @@ def calendar(
 
     Args:
         dates: A list of date-like objects (e.g., datetime.date, datetime.datetime,
-            or strings in "YYYY-MM-DD" format). Must have the same length as values.
-        values: A list of numeric or categorical values corresponding to each date in
-            dates. Numeric values are aggregated by summing duplicate dates. Categorical
-            values use the last value for duplicate dates.
+            or strings in "YYYY-MM-DD" format), a dataframe column (pandas, polars,
+            pyarrow, etc), an Arrow array or a NumPy `datetime64` array. Must have the
+            same length as values. Null dates (e.g., `NaT`) are ignored, with their
+            values. When `data` is provided, the name of the date column.
+        values: A list, dataframe column, Arrow array or NumPy array of numeric or
+            categorical values corresponding to each date in dates. Numeric values of
+            duplicate dates are aggregated with `agg`, and NaN values are treated as missing.
+            Categorical values use the last value for duplicate dates. When `data` is
+            provided, the name of the value column.
         start_date: The earliest date to display on the chart. Can be a date, datetime,
             or a string in "YYYY-MM-DD" format. If not provided, the minimum date found in
             `dates` will be used.
@@ -326,9 +1387,13 @@ def calendar(
         vmin: The lower bound for the color scale. If None, it is determined automatically from the
             data. If data contains both positive and negative values and `vcenter` is not provided, `vmin` will
             default to the data's minimum. Providing `vmin` overrides the automatic calculation.
+            It can also be a quantile of the daily values, given as "pXX" (e.g., "p1"), so that
+            a few outlier days do not squeeze the color scale.
         vmax: The upper bound for the color scale. If None, it is determined automatically from the
             data. If data contains both positive and negative values and `vcenter` is not provided, `vmax`
             will default to the data's maximum. Providing `vmax` overrides the automatic calculation.
+            It can also be a quantile of the daily values, given as "pXX" (e.g., "p99"). Days
+            above it get the color of `vmax`.
         vcenter: The midpoint for the color scale, typically used with diverging colormaps (e.g.,
             "RdBu") to position a central reference (e.g., zero). If None and the data spans negative and
             positive values, `vcenter` will default to 0. Providing vcenter overrides this automatic setting.
@@ -352,25 +1417,106 @@ def calendar(
             visible bounding boxes around each month.
         clip_on: Whether the artist (e.g., squares) is clipped to the axes boundaries (True) or allowed to extend
             beyond them (False).
+        month_label_step: Label every `month_label_step` months (e.g., 3 for quarters),
+            evenly spaced across years. Multiples of 12 label the January of every
+            `month_label_step // 12` years with its year, and other steps from 12 label
+            months with their year (e.g., "Jul 2023"). If "auto", the smallest step keeping labels readable is chosen
+            from the size of the axes and of the labels, so the number of labels stays
+            small on charts spanning decades.
+        agg: How numeric values of the same day are combined: "sum", "mean", "min", "max",
+            "count" (number of non-missing values) or "median", or a function taking the
+            values of a day as a NumPy array and returning a number. When `data` is
+            provided, the built-in aggregations are computed by the dataframe library.
+        norm: A `matplotlib.colors.Normalize` mapping daily values to colors, usually
+            computed by `dayplot.shared_norm()` so that several calendars share the same
+            color scale. It replaces `vmin`, `vmax` and `vcenter`, and a `TwoSlopeNorm`
+            gives a diverging scale. If its limits are not set, they are set in place
+            from the daily values, like in matplotlib.
+        granularity: The period of a cell: "day", "week" or "month". Week cells are
+            laid out in one column per month (one row per week, by the day of the
+            month it starts on) and month cells in one column per year, and their
+            values are aggregated over the period with `agg`. If "auto", the finest
+            granularity whose cells are at least a few pixels wide in `ax`, with at
+            most a few thousand cells, is chosen, which keeps multi-decade charts
+            readable and fast. With weeks or months, `month_label_step` is raised
+            when labels would overlap.
+        render: How day cells are drawn. "patches" adds one `FancyBboxPatch` per day,
+            while "collection" draws every cell as a single `matplotlib.collections.PathCollection`,
+            which is much faster for long date ranges. "image" draws every cell in a single
+            image, the fastest option for multi-decade charts which also keeps PDF and SVG
+            outputs small. It requires `boxstyle="square"` and `edgewidth=0`.
+        return_handle: If True, return a `dayplot.CalendarHandle` instead of the cells. Its
+            `set_values()` and `update()` methods recolor the calendar in place with new data,
+            without rebuilding the layout, labels and month grid.
+        data: A dataframe (pandas, polars, pyarrow, etc). If provided, `dates` and `values`
+            are column names of this dataframe. It can also be a lazy frame (e.g., a
+            `polars.LazyFrame`), in which case the `start_date`/`end_date` filter and
+            the daily sums are computed lazily and only the daily totals are collected.
         ax: A matplotlib axes. If None, plt.gca() will be used. It is advisable to make this explicit
             to avoid unexpected behaviour, particularly when manipulating a figure with several axes.
         kwargs: Any additional arguments that will be passed to `matplotlib.patches.FancyBboxPatch`.
             For example, you can set `alpha`, `hatch`, `linestyle`, etc. You can find them all
             [here](https://matplotlib.org/stable/api/_as_gen/matplotlib.patches.FancyBboxPatch.html).
+            With `render="collection"`, `mutation_scale` and `mutation_aspect` shape the cells
+            and the other arguments are passed to `matplotlib.collections.PathCollection`.
+            With `render="image"`, they are passed to `matplotlib.image.PcolorImage`.
 
     Returns:
-        A list of `matplotlib.patches.FancyBboxPatch` (one for each cell).
+        A list of `matplotlib.patches.FancyBboxPatch` (one for each cell), or a single
+            `matplotlib.collections.PathCollection` when `render="collection"`, or a single
+            `matplotlib.image.PcolorImage` when `render="image"`. When `return_handle=True`, a `dayplot.CalendarHandle` wrapping those cells.
 
     Notes:
-        The function aggregates multiple numeric entries for the same date by summing
-        their values. For categorical data, the last entry for a date is used.
+        The function aggregates multiple numeric entries for the same date with `agg`,
+        summing their values by default. For categorical data, the last entry for a date
+        is used.
     """
+    _validate_agg(agg)
+    _validate_granularity(granularity)
+    # Aggregation of the values left after the dataframe library has (or has
+    # not) aggregated them per day.
+    daily_agg = agg
+    if data is not None:
+        frame = nw.from_native(data)
+        dates, values = cast(str, dates), cast(str, values)
+        schema = frame.collect_schema()
+        if (
+            isinstance(agg, str)
+            and (granularity == "day" or agg in _REAGGREGATIONS)
+            and schema[values].is_numeric()
+            and (
+                isinstance(frame, nw.LazyFrame)
+                or schema[dates] in (nw.Date, nw.Datetime)
+            )
+        ):
+            # Only the daily results are collected.
+            dates, values, _ = _daily_totals(
+                frame.lazy(), dates, values, start_date, end_date, agg
+            )
+            daily_agg = _REAGGREGATIONS.get(agg, "sum")
+        else:
+            if isinstance(frame, nw.LazyFrame):
+                frame, day = _filter_days(frame, dates, start_date, end_date)
+                frame = frame.select(day.alias(dates), nw.col(values)).collect()
+            dates = frame.get_column(dates)
+            values = frame.get_column(values)
+
     _validate_inputs(boxstyle, dates, values)
-    is_categorical = not _is_numeric_values(values)
+    _validate_render(render, boxstyle, edgewidth, kwargs)
+    _validate_month_label_step(month_label_step)
+    _parse_quantile(vmin, "vmin")
+    _parse_quantile(vmax, "vmax")
+    values_column = _to_series(values)
+    if _is_categorical_column(values_column):
+        # Factorized from the column itself, without a NumPy copy.
+        is_categorical = True
+    else:
+        values = _to_numpy(values)
+        is_categorical = not _is_numeric_values(values)
 
     if is_categorical:
         _validate_categorical_arguments(
-            cmap, vmin, vmax, vcenter, legend_bins, less_label, more_label
+            cmap, vmin, vmax, vcenter, legend_bins, less_label, more_label, agg, norm
         )
         validated_cmap = _validate_cmap(_DEFAULT_CMAP.value)
     else:
@@ -394,8 +1540,11 @@ def calendar(
             else more_label
         )
         validated_cmap = _validate_cmap(cmap)
+        if norm is not None and (vmin, vmax, vcenter) != (None, None, None):
+            raise ValueError("`vmin`, `vmax` and `vcenter` cannot be used with `norm`.")
+    is_shared_norm = norm is not None
 
-    cal = Calendar([*day_name].index(week_starts_on))
+    firstweekday = [*day_name].index(week_starts_on)
 
     month_kws = month_kws or {}
     day_kws = day_kws or {}
@@ -407,197 +1556,137 @@ def calendar(
     categories: list[Any] = []
     color_map: dict[Any, Any] = {}
     is_diverging = False
-    norm: Any = None
-
-    if is_categorical:
-        date_counts = {}
-        category_order = _unique_values_in_order(values)
-        for d, v in zip(dates, values):
-            date_counts[_parse_date(d)] = v
-    else:
-        date_counts = defaultdict(float)
-        for d, v in zip(dates, values):
-            date_counts[_parse_date(d)] += cast(float, v)
-
-    start_date, end_date = _get_start_and_end_dates(date_counts, start_date, end_date)
-    cal_start_date = calendar_week(cal, start_date)[0]
-    cal_end_date = calendar_week(cal, end_date)[-1]
-
-    delta_days = (end_date - start_date).days + 1
-    full_range = [start_date + timedelta(days=i) for i in range(delta_days)]
-
-    data_for_plot = []
-    for d in full_range:
-        week_index = (d - cal_start_date).days // 7
-        day_of_week = (d.weekday() - cal.firstweekday) % 7
-        count = date_counts.get(d, _MISSING if is_categorical else 0)
-        data_for_plot.append((week_index, day_of_week, count))
-
-    total_weeks = (cal_end_date - cal_start_date).days // 7 + 1
+    codes: Optional[np.ndarray] = None
+    palette: Optional[np.ndarray] = None
+    counts: Optional[np.ndarray] = None
+    scale_args: Optional[tuple[Any, Any, Any]] = None
+    color_for_none_arg = None
+
+    day_numbers = _to_datetime64(dates).astype(np.int64)
+    start_date, end_date = _get_start_and_end_dates(
+        *_data_date_range(day_numbers), start_date, end_date
+    )
+    if granularity == "auto":
+        granularity = _resolve_granularity(ax, start_date, end_date, firstweekday)
+    layout = _get_layout(start_date, end_date, firstweekday, granularity)
+    n_cells = layout.n_cells
+    # Null dates (NaT) are dropped with their values, like missing values.
+    offsets = layout.cell_offsets(
+        np.where(
+            _null_days(day_numbers),
+            -1,
+            day_numbers - _date_to_datetime64(start_date).astype(np.int64),
+        )
+    )
 
     if is_categorical:
-        observed_categories = {
-            count for _, _, count in data_for_plot if count is not _MISSING
-        }
+        if color_for_none is None:
+            color_for_none = _DEFAULT_COLOR_FOR_NONE
+        last_rows = _aggregate_last(offsets, n_cells)
+        observed = last_rows >= 0
+        category_order, observed_codes = _factorize(
+            values if values_column is None else values_column,
+            rows=last_rows[observed],
+        )
+        # Only the categories shown in the calendar are kept, in first-appearance
+        # order, and `category_index` maps their codes to their new positions.
+        is_shown = np.zeros(len(category_order), dtype=bool)
+        is_shown[observed_codes] = True
+        category_index = np.cumsum(is_shown) - 1
         categories = [
-            category for category in category_order if category in observed_categories
+            category
+            for category, shown in zip(category_order, is_shown.tolist())
+            if shown
         ]
         color_map = _validate_colors(colors, categories)
-    else:
-        all_counts = np.array(list(date_counts.values()))
-        min_count, max_count = all_counts.min(), all_counts.max()
-
-        if vmin is None:
-            vmin = min_count
-        if vmax is None:
-            vmax = max_count if max_count != 0 else 1
 
-        if vcenter is not None:
-            is_diverging = True
-            norm = TwoSlopeNorm(
-                vmin=cast(float, vmin),
-                vcenter=cast(float, vcenter),
-                vmax=cast(float, vmax),
-            )
+        # The last palette entry is used for days without data.
+        palette = np.array(
+            [mcolors.to_rgba(color_map[category]) for category in categories]
+            + [mcolors.to_rgba(color_for_none)]
+        )
+        codes = np.full(n_cells, len(categories), dtype=np.intp)
+        codes[observed] = category_index[observed_codes]
+        face_colors = palette[codes]
+    else:
+        counts, observed = _aggregate_numeric(
+            offsets, _to_numpy(values).astype(float, copy=False), n_cells, daily_agg
+        )
+        scale_args = (vmin, vmax, vcenter)
+        color_for_none_arg = color_for_none
+        if norm is not None:
+            # A shared color scale, which does not depend on this data. Like
+            # matplotlib, limits that are not set are taken from the data.
+            if not norm.scaled():
+                norm.autoscale_None(_observed_range(counts, observed))
+            is_diverging = isinstance(norm, TwoSlopeNorm)
+            vmin, vmax = norm.vmin, norm.vmax
         else:
-            # If we have both negative and positive values, use a diverging
-            # scale with a center of 0. Otherwise, use a simple Normalize.
-            if min_count < 0 < max_count:
-                is_diverging = True
-                norm = TwoSlopeNorm(
-                    vmin=cast(float, vmin), vcenter=0, vmax=cast(float, vmax)
-                )
-            else:
-                is_diverging = False
-                norm = Normalize(vmin=cast(float, vmin), vmax=cast(float, vmax))
-
-    rect_patches = []
-    for week, weekday, count in data_for_plot:
-        if is_categorical:
-            if count is _MISSING:
-                if color_for_none is None:
-                    color_for_none = "#e8e8e8"
-                face_color = color_for_none
-            else:
-                face_color = color_map[count]
-        elif is_diverging:
-            if color_for_none is not None:
-                warnings.warn(
-                    "`color_for_none` argument is ignored when `values` "
-                    "argument contains negative values.",
-                    UserWarning,
-                )
-            face_color = validated_cmap(norm(cast(float, count)))
-        elif not is_diverging:
-            if count == 0:
-                if color_for_none is None:
-                    color_for_none = "#e8e8e8"
-                face_color = color_for_none
-            else:
-                face_color = validated_cmap(norm(cast(float, count)))
-
-        rect = patches.FancyBboxPatch(
-            xy=(week + 0.35, weekday + 0.35),
-            width=0.3,
-            height=0.3,
-            linewidth=edgewidth,
-            edgecolor=edgecolor,
-            facecolor=face_color,
-            boxstyle=boxstyle,
-            **kwargs,
+            min_count, max_count = _observed_range(counts, observed)
+            vmin, vmax = _quantile_limits(counts, observed, vmin, vmax)
+            norm, is_diverging, vmin, vmax = _numeric_norm(
+                min_count, max_count, vmin, vmax, vcenter
+            )
+        color_for_none = _resolve_color_for_none(is_diverging, color_for_none)
+        face_colors = _numeric_face_colors(
+            validated_cmap, norm, counts, is_diverging, color_for_none
         )
-        ax.add_patch(rect)
-        rect_patches.append(rect)
 
-    month_text_style: dict[str, Any] = dict(ha="left", va="top", size=10)
-    month_text_style.update(month_kws)
-
-    month_starts = [
-        *date_range(start_date.replace(day=1), end_date.replace(day=1), months=1)
-    ]
-    for m_start in month_starts:
-        week_of_month = (m_start - cal_start_date).days // 7
-        ax.text(
-            week_of_month + 0.1,
-            7 + month_y_margin,
-            m_start.strftime("%b"),
-            **month_text_style,
+    cells: Union[List[patches.FancyBboxPatch], PathCollection, PcolorImage]
+    if render == "collection":
+        cells = _draw_cell_collection(
+            ax,
+            layout.weeks,
+            layout.weekdays,
+            face_colors,
+            edgecolor,
+            edgewidth,
+            boxstyle,
+            **kwargs,
         )
+    elif render == "image":
+        cells = _draw_cell_image(ax, layout, face_colors, **kwargs)
+    else:
+        cells = []
+        for week, weekday, face_color in zip(
+            layout.weeks.tolist(), layout.weekdays.tolist(), face_colors
+        ):
+            rect = patches.FancyBboxPatch(
+                xy=(week + 0.35, weekday + 0.35),
+                width=0.3,
+                height=0.3,
+                linewidth=edgewidth,
+                edgecolor=edgecolor,
+                facecolor=tuple(face_color),
+                boxstyle=boxstyle,
+                **kwargs,
+            )
+            ax.add_patch(rect)
+            cells.append(rect)
 
-    ax.spines[["top", "right", "left", "bottom"]].set_visible(False)
-    ax.set_xlim(-0.5, total_weeks + 0.5)
-    ax.set_ylim(-0.5, 7.5)
-    ax.set_xticks([])
-    ax.set_yticks([])
-    ax.invert_yaxis()
-    ax.set_aspect("equal")
+    _setup_axes(ax, layout.total_weeks, layout.n_rows)
 
-    day_text_style: dict[str, Any] = dict(
-        transform=ax.get_yaxis_transform(), ha="left", va="center", size=10
+    _draw_month_labels(
+        ax,
+        layout,
+        layout.n_rows + month_y_margin,
+        month_kws,
+        step=month_label_step,
+        readable=granularity != "day",
     )
-    day_text_style.update(day_kws)
 
-    ticks = [0.5, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5]
-    # Create labels in the adjusted order based on week_starts_on
-    labels = [day_abbr[(cal.firstweekday + i) % 7] for i in range(7)]
-
-    for y_tick, day_label in zip(ticks, labels):
-        ax.text(-day_x_margin, y_tick, day_label, **day_text_style)
+    _draw_row_labels(ax, layout.row_labels, -day_x_margin, day_kws)
 
     if month_grid:
-        # vertical grid around data within each months
-        verts, codes = [], []
-        last_month = relative_date_add(month_starts[-1], months=1)
-        horizontal_gaps = []  # track horizontal lines that appear on the chart top
-        for m_start in chain(month_starts, [last_month]):
-            week_of_month = (m_start - cal_start_date).days // 7
-            day_of_week = (m_start.weekday() - cal.firstweekday) % 7
-            if day_of_week == 0:
-                horizontal_gaps.append((week_of_month, week_of_month + 1))
-            verts.extend(
-                [
-                    (week_of_month, 7),
-                    (week_of_month, day_of_week),
-                    (week_of_month + 1, day_of_week),
-                    (week_of_month + 1, 0),
-                ]
-            )
-
-            codes.extend([Path.MOVETO, Path.LINETO, Path.LINETO, Path.LINETO])
-
-        # horizontal grid above/below data, ensuring they do not overlap with any lines drawn in the previous step.
-        last_week_of_month = (last_month - cal_start_date).days // 7
-        verts.extend(
-            [
-                # bottom line
-                (0, 7),
-                (last_week_of_month, 7),
-                # top line
-                (1, 0),
-                *((wk, 0) for gap in horizontal_gaps for wk in gap),
-                (last_week_of_month + 1, 0),
-            ]
-        )
-        codes.extend(
-            [
-                # bottom line
-                *[Path.MOVETO, Path.LINETO],
-                # top line
-                *[
-                    Path.MOVETO,
-                    *([Path.LINETO, Path.MOVETO] * len(horizontal_gaps)),
-                    Path.LINETO,
-                ],
-            ]
-        )
-
-        path = Path(verts, codes, closed=False)
+        path = layout.month_grid_path
         default_month_grid_kws = dict(facecolor="none", clip_on=clip_on)
         default_month_grid_kws.update(month_grid_kws)
 
         patch = patches.PathPatch(path, **default_month_grid_kws)
         ax.add_patch(patch)
 
+    legend_rects: List[patches.FancyBboxPatch] = []
+    legend_label_artists = []
     if legend:
         if is_categorical:
             legend_handles = []
@@ -649,76 +1738,106 @@ def calendar(
                 if "color" in legend_labels_kws:
                     for text in legend_artist.get_texts():
                         text.set_color(legend_labels_kws["color"])
-            return rect_patches
-
-        legend_rects = []
-        legend_values = np.linspace(
-            cast(float, vmin), cast(float, vmax), cast(int, legend_bins)
-        )
+        else:
+            legend_values = np.linspace(
+                cast(float, vmin), cast(float, vmax), cast(int, legend_bins)
+            )
+            legend_colors = _numeric_face_colors(
+                validated_cmap,
+                cast(Normalize, norm),
+                legend_values,
+                is_diverging,
+                color_for_none,
+            )
 
-        for i, val in enumerate(legend_values):
-            if is_diverging:
-                color = validated_cmap(norm(cast(float, val)))
-            else:
-                color = (
-                    color_for_none
-                    if val == 0
-                    else validated_cmap(norm(cast(float, val)))
+            for i, (val, color) in enumerate(zip(legend_values, legend_colors)):
+                legend_xloc = layout.total_weeks - len(legend_values) + i
+                rect = patches.FancyBboxPatch(
+                    xy=(legend_xloc + 0.35, -1.2),
+                    width=0.3,
+                    height=0.3,
+                    linewidth=edgewidth,
+                    edgecolor=edgecolor,
+                    facecolor=tuple(color),
+                    boxstyle=boxstyle,
+                    clip_on=False,
+                    **kwargs,
                 )
+                ax.add_patch(rect)
+                legend_rects.append(rect)
 
-            legend_xloc = total_weeks - len(legend_values) + i
-            rect = patches.FancyBboxPatch(
-                xy=(legend_xloc + 0.35, -1.2),
-                width=0.3,
-                height=0.3,
-                linewidth=edgewidth,
-                edgecolor=edgecolor,
-                facecolor=color,
-                boxstyle=boxstyle,
-                clip_on=False,
-                **kwargs,
-            )
-            ax.add_patch(rect)
-            legend_rects.append(rect)
+                if legend_labels is not None:
+                    if legend_labels == "auto":
+                        legend_label = round(val, ndigits=legend_labels_precision)
+                    else:
+                        legend_label = str(cast(List, legend_labels)[i])
 
-            if legend_labels is not None:
-                if legend_labels == "auto":
-                    legend_label = round(val, ndigits=legend_labels_precision)
-                else:
-                    legend_label = str(cast(List, legend_labels)[i])
-
-                legend_labels_style: dict[str, Any] = dict(
-                    size=7, ha="center", va="bottom"
-                )
-                legend_labels_style.update(legend_labels_kws)
-                ax.annotate(
-                    legend_label,
-                    xy=(0.5, 1),
-                    xycoords=rect,
-                    xytext=(0, 1),
-                    textcoords="offset points",
-                    **legend_labels_style,
-                )
+                    legend_labels_style: dict[str, Any] = dict(
+                        size=7, ha="center", va="bottom"
+                    )
+                    legend_labels_style.update(legend_labels_kws)
+                    legend_label_artist = ax.annotate(
+                        legend_label,
+                        xy=(0.5, 1),
+                        xycoords=rect,
+                        xytext=(0, 1),
+                        textcoords="offset points",
+                        **legend_labels_style,
+                    )
+                    if legend_labels == "auto":
+                        legend_label_artists.append(legend_label_artist)
+
+            ax.annotate(
+                less_label,
+                xy=(0, 0.5),
+                xycoords=legend_rects[0],
+                xytext=(-5, 0),
+                textcoords="offset points",
+                va="center",
+                ha="right",
+                size=8,
+            )
+            ax.annotate(
+                more_label,
+                xy=(1, 0.5),
+                xycoords=legend_rects[-1],
+                xytext=(5, 0),
+                textcoords="offset points",
+                va="center",
+                ha="left",
+                size=8,
+            )
 
-        ax.annotate(
-            less_label,
-            xy=(0, 0.5),
-            xycoords=legend_rects[0],
-            xytext=(-5, 0),
-            textcoords="offset points",
-            va="center",
-            ha="right",
-            size=8,
-        )
-        ax.annotate(
-            more_label,
-            xy=(1, 0.5),
-            xycoords=legend_rects[-1],
-            xytext=(5, 0),
-            textcoords="offset points",
-            va="center",
-            ha="left",
-            size=8,
+    if return_handle:
+        if is_categorical:
+            return CalendarHandle(
+                ax,
+                cells,
+                layout,
+                face_colors,
+                codes=codes,
+                palette=palette,
+                categories=categories,
+            )
+        return CalendarHandle(
+            ax,
+            cells,
+            layout,
+            face_colors,
+            counts=counts,
+            observed=observed,
+            cmap=validated_cmap,
+            norm=norm,
+            is_diverging=is_diverging,
+            scale_args=None if is_shared_norm else scale_args,
+            vmin=vmin,
+            vmax=vmax,
+            color_for_none_arg=color_for_none_arg,
+            color_for_none=color_for_none,
+            legend_rects=legend_rects,
+            legend_label_artists=legend_label_artists,
+            legend_labels_precision=legend_labels_precision,
+            agg=agg,
         )
 
-    return rect_patches
+    return cells
@@ -0,0 +1,347 @@
+from calendar import day_name
+from collections.abc import Mapping
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Literal, Optional, Union
+
+import matplotlib.patches as patches
+import matplotlib.pyplot as plt
+import narwhals as nw
+import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.collections import PathCollection
+from matplotlib.colors import Normalize
+from narwhals.typing import IntoDataFrame
+
+from dayplot.calendar import (
+    _aggregate_numeric,
+    _data_date_range,
+    _date_to_datetime64,
+    _draw_cell_collection,
+    _draw_day_labels,
+    _draw_month_labels,
+    _get_layout,
+    _get_start_and_end_dates,
+    _is_numeric_values,
+    _numeric_face_colors,
+    _numeric_norm,
+    _observed_range,
+    _parse_quantile,
+    _quantile_limits,
+    _resolve_color_for_none,
+    _setup_axes,
+    _validate_agg,
+    _validate_cmap,
+    _validate_inputs,
+)
+from dayplot.utils import _factorize, _to_datetime64, _to_numpy
+
+
+def _collect_series(
+    data: Union[Mapping[Any, Any], IntoDataFrame],
+    by: Optional[str],
+    dates: str,
+    values: str,
+    boxstyle: Union[str, patches.BoxStyle],
+) -> tuple[list[Any], np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Return the series keys, and the day numbers, values and series index of
+    every input row.
+    """
+    if isinstance(data, Mapping):
+        if not data:
+            raise ValueError("`data` cannot be empty.")
+        keys = list(data)
+        day_numbers, all_values, lengths = [], [], []
+        for key in keys:
+            series_dates, series_values = data[key]
+            _validate_inputs(boxstyle, series_dates, series_values)
+            day_numbers.append(_to_datetime64(series_dates).astype(np.int64))
+            all_values.append(_to_numpy(series_values))
+            lengths.append(len(all_values[-1]))
+        return (
+            keys,
+            np.concatenate(day_numbers),
+            np.concatenate(all_values),
+            np.repeat(np.arange(len(keys)), lengths),
+        )
+
+    if by is None:
+        raise ValueError("`by` must be provided when `data` is a dataframe.")
+    frame = nw.from_native(data, eager_only=True)
+    series_dates = frame.get_column(dates)
+    series_values = frame.get_column(values)
+    _validate_inputs(boxstyle, series_dates, series_values)
+    keys, codes = _factorize(frame.get_column(by))
+    return (
+        keys,
+        _to_datetime64(series_dates).astype(np.int64),
+        _to_numpy(series_values),
+        codes,
+    )
+
+
+def _aggregate_series(
+    day_numbers: np.ndarray,
+    values: np.ndarray,
+    codes: np.ndarray,
+    n_series: int,
+    start_date: date,
+    n_days: int,
+    agg: Any,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Aggregate the values of every series per day at once, over a flattened
+    (series, day) axis of `n_series * n_days` days.
+    """
+    offsets = day_numbers - _date_to_datetime64(start_date).astype(np.int64)
+    in_window = (offsets >= 0) & (offsets < n_days)
+    flat_offsets = np.where(in_window, codes * n_days + offsets, -1)
+    return _aggregate_numeric(
+        flat_offsets, values.astype(float, copy=False), n_series * n_days, agg
+    )
+
+
+def shared_norm(
+    data: Union[Mapping[Any, Any], IntoDataFrame],
+    by: Optional[str] = None,
+    dates: str = "dates",
+    values: str = "values",
+    start_date: Optional[Union[date, datetime, str]] = None,
+    end_date: Optional[Union[date, datetime, str]] = None,
+    vmin: Optional[Union[float, str]] = None,
+    vmax: Optional[Union[float, str]] = None,
+    vcenter: Optional[float] = None,
+    agg: Union[
+        Literal["sum", "mean", "min", "max", "count", "median"],
+        Callable[[np.ndarray], Any],
+    ] = "sum",
+) -> Normalize:
+    """
+    Compute one color scale for several calendars, so that their colors can be
+    compared.
+
+    The daily values of every series are computed at once, and the scale is
+    chosen from all of them as `dayplot.calendar()` does for a single series.
+    The result is passed to each `dayplot.calendar()` call with `norm=`:
+
+    ```python
+    norm = dp.shared_norm({"a": (dates_a, values_a), "b": (dates_b, values_b)})
+    dp.calendar(dates_a, values_a, norm=norm, ax=ax1)
+    dp.calendar(dates_b, values_b, norm=norm, ax=ax2)
+    ```
+
+    Args:
+        data: Either a mapping of series id to a `(dates, values)` pair, or a
+            long-format dataframe (pandas, polars, pyarrow, etc) with one row per
+            event, as in `dayplot.calendar_grid()`.
+        by: Name of the column holding the series id when `data` is a dataframe.
+        dates: Name of the date column when `data` is a dataframe.
+        values: Name of the value column when `data` is a dataframe.
+        start_date: If provided, days before this date are ignored.
+        end_date: If provided, days after this date are ignored.
+        vmin: The lower bound of the color scale. Defaults to the minimum across all
+            series. Can be a quantile of the daily values, given as "pXX" (e.g., "p1").
+        vmax: The upper bound of the color scale. Defaults to the maximum across all
+            series. Can be a quantile of the daily values, given as "pXX" (e.g., "p99").
+        vcenter: The midpoint of the color scale. Defaults to 0 if the data spans
+            negative and positive values.
+        agg: How values of the same day are combined. It should match the `agg`
+            of the calendars. See `dayplot.calendar()`.
+
+    Returns:
+        A `matplotlib.colors.Normalize`, or a `matplotlib.colors.TwoSlopeNorm` for
+            a diverging scale.
+    """
+    _validate_agg(agg)
+    _parse_quantile(vmin, "vmin")
+    _parse_quantile(vmax, "vmax")
+    keys, day_numbers, all_values, codes = _collect_series(
+        data, by, dates, values, "square"
+    )
+    if not _is_numeric_values(all_values):
+        raise ValueError("`shared_norm()` only supports numeric values.")
+
+    start_date, end_date = _get_start_and_end_dates(
+        *_data_date_range(day_numbers), start_date, end_date
+    )
+    n_days = max((end_date - start_date).days + 1, 0)
+    counts, observed = _aggregate_series(
+        day_numbers, all_values, codes, len(keys), start_date, n_days, agg
+    )
+
+    min_count, max_count = _observed_range(counts, observed)
+    vmin, vmax = _quantile_limits(counts, observed, vmin, vmax)
+    return _numeric_norm(min_count, max_count, vmin, vmax, vcenter)[0]
+
+
+def calendar_grid(
+    data: Union[Mapping[Any, Any], IntoDataFrame],
+    by: Optional[str] = None,
+    dates: str = "dates",
+    values: str = "values",
+    start_date: Optional[Union[date, datetime, str]] = None,
+    end_date: Optional[Union[date, datetime, str]] = None,
+    ncols: int = 1,
+    color_for_none: Optional[str] = None,
+    edgecolor: str = "black",
+    edgewidth: float = 0.0,
+    cmap: Any = "Greens",
+    week_starts_on: str = "Sunday",
+    labels: bool = True,
+    label_kws: Optional[Dict] = None,
+    month_kws: Optional[Dict] = None,
+    day_kws: Optional[Dict] = None,
+    day_x_margin: float = 0.02,
+    month_y_margin: float = 0.4,
+    hspace: float = 1.5,
+    wspace: float = 2.0,
+    vmin: Optional[Union[float, str]] = None,
+    vmax: Optional[Union[float, str]] = None,
+    vcenter: Optional[float] = None,
+    boxstyle: Union[str, patches.BoxStyle] = "square",
+    agg: Union[
+        Literal["sum", "mean", "min", "max", "count", "median"],
+        Callable[[np.ndarray], Any],
+    ] = "sum",
+    ax: Optional[Axes] = None,
+    **kwargs: Any,
+) -> PathCollection:
+    """
+    Draw one calendar heatmap per series (small multiples) on a single axes.
+
+    All series share the same date window, layout and color scale, so the
+    layout and normalization are computed once and every cell of every series
+    is drawn in a single `matplotlib.collections.PathCollection`. This makes it
+    possible to render hundreds of calendars in a few seconds.
+
+    Args:
+        data: Either a mapping of series id to a `(dates, values)` pair, or a
+            long-format dataframe (pandas, polars, pyarrow, etc) with one row per
+            event. Values must be numeric, and are aggregated with `agg` for duplicate dates.
+        by: Name of the column holding the series id when `data` is a dataframe.
+        dates: Name of the date column when `data` is a dataframe.
+        values: Name of the value column when `data` is a dataframe.
+        start_date: The earliest date to display. Defaults to the minimum date
+            across all series.
+        end_date: The latest date to display. Defaults to the maximum date across
+            all series.
+        ncols: Number of calendars per row.
+        color_for_none: Color to use for days with no contributions (i.e., count zero).
+            Defaults to "#e8e8e8", a light gray color. This parameter is ignored when `values`
+            has negative values.
+        edgecolor: Color of the edges for each day's cell.
+        edgewidth: Line width for the edges of each day's cell.
+        cmap: A valid Matplotlib colormap name or a LinearSegmentedColormap instance.
+        week_starts_on: The starting day of the week, which can be specified as a string
+            ("Sunday", "Monday", ..., "Saturday").
+        labels: Whether to write the series id above each calendar.
+        label_kws: Additional keyword arguments passed to the matplotlib.axes.Axes.text function
+            when labeling series ids.
+        month_kws: Additional keyword arguments passed to the matplotlib.axes.Axes.text function
+            when labeling month names, under the bottom calendar of each column.
+        day_kws: Additional keyword arguments passed to the matplotlib.axes.Axes.text function
+            when labeling weekday names, next to the first calendar.
+        day_x_margin: Distance between the day labels and the first calendar.
+        month_y_margin: Distance between the month labels and the bottom calendars.
+        hspace: Vertical space between calendars, in number of cells.
+        wspace: Horizontal space between calendars, in number of cells.
+        vmin: The lower bound of the shared color scale. Defaults to the minimum
+            across all series. Can be a quantile of the daily values of all series,
+            given as "pXX" (e.g., "p1").
+        vmax: The upper bound of the shared color scale. Defaults to the maximum
+            across all series. Can be a quantile of the daily values of all series,
+            given as "pXX" (e.g., "p99").
+        vcenter: The midpoint of the shared color scale. Defaults to 0 if the data
+            spans negative and positive values.
+        boxstyle: The style of each box. See `dayplot.calendar()`.
+        agg: How values of the same day are combined. See `dayplot.calendar()`.
+        ax: A matplotlib axes. If None, plt.gca() will be used.
+        kwargs: Any additional arguments that will be passed to
+            `matplotlib.collections.PathCollection` (`mutation_scale` and
+            `mutation_aspect` shape the cells, as in `dayplot.calendar()`).
+
+    Returns:
+        A single `matplotlib.collections.PathCollection` with the cells of every series.
+    """
+    if ncols < 1:
+        raise ValueError("`ncols` must be a positive integer.")
+    _validate_agg(agg)
+    _parse_quantile(vmin, "vmin")
+    _parse_quantile(vmax, "vmax")
+
+    keys, day_numbers, all_values, codes = _collect_series(
+        data, by, dates, values, boxstyle
+    )
+    if not _is_numeric_values(all_values):
+        raise ValueError("`calendar_grid()` only supports numeric values.")
+    validated_cmap = _validate_cmap(cmap)
+
+    firstweekday = [*day_name].index(week_starts_on)
+    month_kws = month_kws or {}
+    day_kws = day_kws or {}
+    label_kws = label_kws or {}
+    ax = ax or plt.gca()
+
+    start_date, end_date = _get_start_and_end_dates(
+        *_data_date_range(day_numbers), start_date, end_date
+    )
+    layout = _get_layout(start_date, end_date, firstweekday)
+    total_weeks = layout.total_weeks
+
+    n_series = len(keys)
+    counts, observed = _aggregate_series(
+        day_numbers, all_values, codes, n_series, start_date, layout.n_days, agg
+    )
+
+    min_count, max_count = _observed_range(counts, observed)
+    vmin, vmax = _quantile_limits(counts, observed, vmin, vmax)
+    norm, is_diverging, vmin, vmax = _numeric_norm(
+        min_count, max_count, vmin, vmax, vcenter
+    )
+    color_for_none = _resolve_color_for_none(is_diverging, color_for_none)
+    face_colors = _numeric_face_colors(
+        validated_cmap, norm, counts, is_diverging, color_for_none
+    )
+
+    nrows = -(-n_series // ncols)
+    panel_width = total_weeks + wspace
+    panel_height = 7 + hspace
+    panels = np.arange(n_series)
+    x_offsets = (panels % ncols) * panel_width
+    y_offsets = (panels // ncols) * panel_height
+
+    cells = _draw_cell_collection(
+        ax,
+        (x_offsets[:, None] + layout.weeks).ravel(),
+        (y_offsets[:, None] + layout.weekdays).ravel(),
+        face_colors,
+        edgecolor,
+        edgewidth,
+        boxstyle,
+        **kwargs,
+    )
+
+    if labels:
+        label_style: dict[str, Any] = dict(ha="left", va="bottom", size=10)
+        label_style.update(label_kws)
+        for key, x, y in zip(keys, x_offsets.tolist(), y_offsets.tolist()):
+            ax.text(x + 0.1, y - 0.2, str(key), **label_style)
+
+    for col in range(min(ncols, n_series)):
+        bottom_row = (n_series - 1 - col) // ncols
+        _draw_month_labels(
+            ax,
+            layout,
+            bottom_row * panel_height + 7 + month_y_margin,
+            month_kws,
+            x_offset=col * panel_width,
+        )
+
+    _setup_axes(
+        ax,
+        min(ncols, n_series) * panel_width - wspace,
+        nrows * panel_height - hspace,
+    )
+    _draw_day_labels(ax, firstweekday, -day_x_margin, day_kws)
+
+    return cells
@@ -0,0 +1,328 @@
+import io
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from dayplot.calendar import calendar
+
+
+class RenderResult(NamedTuple):
+    """
+    Outcome of a job of `dayplot.render_many()`.
+
+    Attributes:
+        filename: The `filename` of the job.
+        path: Path of the saved file, or None if the job failed.
+        seconds: Time spent rendering and saving the job.
+        error: The error raised by the job (e.g., "ValueError: ..."), or None if it
+            succeeded.
+    """
+
+    filename: str
+    path: Optional[str]
+    seconds: float
+    error: Optional[str]
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+_FIGURE_POOL_SIZES = 8
+_FIGURES_PER_SIZE = 4
+# Idle figures, by (figsize, dpi), least recently used first.
+_figure_pool: "OrderedDict[tuple[tuple[float, float], float], list[Figure]]" = (
+    OrderedDict()
+)
+_figure_pool_lock = threading.Lock()
+
+
+@contextmanager
+def _pooled_figure(figsize: tuple[float, float], dpi: float) -> Iterator[Figure]:
+    """
+    Lend an empty Agg figure of the given size, without going through pyplot.
+
+    The figure is cleared and put back in the pool afterwards, so that calendars
+    rendered one after the other reuse the same figures and canvases. Each figure
+    is lent to a single caller at a time, which makes this safe across threads.
+    """
+    key = ((float(figsize[0]), float(figsize[1])), float(dpi))
+    with _figure_pool_lock:
+        idle = _figure_pool.get(key)
+        fig = idle.pop() if idle else None
+    if fig is None:
+        fig = Figure(figsize=key[0], dpi=key[1])
+        FigureCanvasAgg(fig)
+
+    try:
+        yield fig
+    finally:
+        fig.clear()
+        with _figure_pool_lock:
+            idle = _figure_pool.setdefault(key, [])
+            _figure_pool.move_to_end(key)
+            if len(idle) < _FIGURES_PER_SIZE:
+                idle.append(fig)
+            while len(_figure_pool) > _FIGURE_POOL_SIZES:
+                _figure_pool.popitem(last=False)
+
+
+def render_to_bytes(
+    dates: Any,
+    values: Any,
+    format: str = "png",
+    figsize: tuple[float, float] = (15, 6),
+    dpi: float = 100,
+    savefig_kws: Optional[Dict] = None,
+    **kwargs: Any,
+) -> bytes:
+    """
+    Render a calendar to an in-memory image file.
+
+    Unlike `plt.subplots()` followed by `savefig()` and `plt.close()`, this does not
+    use pyplot: calendars are drawn on a small pool of figures that are reused
+    across calls (one pool per `figsize` and `dpi`). This makes it suited to web
+    backends serving a calendar per request, including from several threads.
+
+    Args:
+        dates: Date-like objects, in any format accepted by `dayplot.calendar()`.
+        values: Values corresponding to each date in dates.
+        format: The file format, e.g., "png", "svg" or "pdf".
+        figsize: Size of the figure, in inches.
+        dpi: Resolution of the figure, in dots per inch.
+        savefig_kws: Additional keyword arguments passed to `matplotlib.figure.Figure.savefig`
+            (e.g., `{"bbox_inches": "tight"}`).
+        kwargs: Any additional arguments that will be passed to `dayplot.calendar()`.
+
+    Returns:
+        The content of the image file.
+    """
+    buffer = io.BytesIO()
+    with _pooled_figure(figsize, dpi) as fig:
+        calendar(dates, values, ax=fig.add_subplot(), **kwargs)
+        fig.savefig(buffer, format=format, **(savefig_kws or {}))
+    return buffer.getvalue()
+
+
+def _render_job(
+    index: int,
+    job: Mapping[str, Any],
+    out_dir: str,
+    figsize: tuple[float, float],
+    dpi: float,
+    savefig_kws: dict,
+) -> tuple[int, RenderResult]:
+    start = time.perf_counter()
+    filename = str(job.get("filename"))
+    try:
+        if "filename" not in job:
+            raise ValueError("Each job must have a `filename`.")
+        path = os.path.join(out_dir, filename)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+        with _pooled_figure(figsize, dpi) as fig:
+            calendar(
+                **{k: v for k, v in job.items() if k != "filename"},
+                ax=fig.add_subplot(),
+            )
+            fig.savefig(path, **savefig_kws)
+        result = RenderResult(filename, path, time.perf_counter() - start, None)
+    except Exception as e:
+        result = RenderResult(
+            filename, None, time.perf_counter() - start, f"{type(e).__name__}: {e}"
+        )
+    return index, result
+
+
+# `max_tasks_per_child` of `ProcessPoolExecutor` needs Python 3.11.
+_REPLACES_WORKERS = sys.version_info >= (3, 11)
+
+
+def _new_pool(workers: int, max_jobs_per_worker: int) -> ProcessPoolExecutor:
+    """
+    Return a pool of `workers` processes, each replaced after `max_jobs_per_worker`
+    jobs. Before Python 3.11, `ProcessPoolExecutor` cannot replace its workers:
+    `_run_jobs()` replaces the whole pool instead.
+    """
+    pool_kws: dict[str, Any] = {}
+    if _REPLACES_WORKERS:
+        pool_kws["max_tasks_per_child"] = max_jobs_per_worker
+    return ProcessPoolExecutor(workers, **pool_kws)
+
+
+def render_many(
+    jobs: Iterable[Mapping[str, Any]],
+    out_dir: str,
+    workers: Optional[int] = None,
+    figsize: tuple[float, float] = (15, 6),
+    dpi: float = 100,
+    savefig_kws: Optional[Dict] = None,
+    max_jobs_per_worker: int = 500,
+) -> list[RenderResult]:
+    """
+    Render many calendars to image files, in parallel.
+
+    Each worker process imports matplotlib once and reuses a single figure (without
+    pyplot) for all its jobs. Jobs are consumed lazily from `jobs` and only a few
+    are queued per worker at a time, so `jobs` can be a generator over a very large
+    number of calendars. A job that fails is reported in the results and does not
+    stop the other jobs. If a worker process dies (e.g., out of memory), a new pool
+    renders the remaining jobs: the jobs that were running at that time are run
+    again one at a time, and only the job that killed its worker is reported as
+    failed.
+
+    Since workers are separate processes, scripts calling this function should be
+    guarded by `if __name__ == "__main__":`.
+
+    Args:
+        jobs: An iterable of mappings, each holding a `filename` (the output path,
+            relative to `out_dir`, whose extension sets the image format) and the
+            arguments passed to `dayplot.calendar()` (`dates`, `values`, `cmap`, etc).
+        out_dir: Directory where files are saved. It is created if needed.
+        workers: Number of worker processes. If None, the number of CPUs is used. If 1,
+            jobs are rendered in the current process.
+        figsize: Size of the figure, in inches.
+        dpi: Resolution of the figure, in dots per inch.
+        savefig_kws: Additional keyword arguments passed to `matplotlib.figure.Figure.savefig`
+            (e.g., `{"bbox_inches": "tight"}`).
+        max_jobs_per_worker: Number of jobs after which a worker process is replaced by
+            a new one, which bounds its memory usage. Before Python 3.11, the whole
+            pool is replaced instead, every `workers * max_jobs_per_worker` jobs.
+
+    Returns:
+        A list of `dayplot.RenderResult`, one for each job, in the order of `jobs`.
+    """
+    savefig_kws = savefig_kws or {}
+    os.makedirs(out_dir, exist_ok=True)
+    run = partial(
+        _render_job,
+        out_dir=out_dir,
+        figsize=figsize,
+        dpi=dpi,
+        savefig_kws=savefig_kws,
+    )
+    return _run_jobs(run, jobs, workers, max_jobs_per_worker)
+
+
+def _run_jobs(
+    run: Callable[[int, Mapping[str, Any]], tuple[int, RenderResult]],
+    jobs: Iterable[Mapping[str, Any]],
+    workers: Optional[int],
+    max_jobs_per_worker: int,
+) -> list[RenderResult]:
+    """
+    Call `run(index, job)` for every job, in a pool of `workers` processes (or in
+    the current process if `workers=1`), and return the results in job order.
+    `run` must be picklable, e.g. a module-level function or a `partial` of one.
+
+    Workers are replaced after `max_jobs_per_worker` jobs. Before Python 3.11,
+    the pool is replaced once its running jobs are done, every
+    `workers * max_jobs_per_worker` jobs.
+    """
+    workers = workers or os.cpu_count() or 1
+    results: dict[int, RenderResult] = {}
+
+    if workers == 1:
+        for index, job in enumerate(jobs):
+            results[index] = run(index, job)[1]
+        return [results[index] for index in sorted(results)]
+
+    pool = _new_pool(workers, max_jobs_per_worker)
+    pending: dict[Future, tuple[int, Mapping[str, Any]]] = {}
+    pool_jobs = 0  # Number of jobs submitted to the current pool.
+    max_pool_jobs = None if _REPLACES_WORKERS else workers * max_jobs_per_worker
+
+    def replace_pool() -> None:
+        nonlocal pool, pool_jobs
+        pool.shutdown()
+        pool = _new_pool(workers, max_jobs_per_worker)
+        pool_jobs = 0
+
+    def failed(job: Mapping[str, Any], e: BaseException) -> RenderResult:
+        return RenderResult(
+            str(job.get("filename")), None, 0.0, f"{type(e).__name__}: {e}"
+        )
+
+    def collect(done: Iterable[Future]) -> list[tuple[int, Mapping[str, Any]]]:
+        """
+        Store the results of finished jobs, and return the jobs that were running
+        when a worker died (e.g., out of memory).
+        """
+        interrupted = []
+        for future in done:
+            index, job = pending.pop(future)
+            try:
+                results[index] = future.result()[1]
+            except BrokenProcessPool:
+                interrupted.append((index, job))
+            except Exception as e:
+                results[index] = failed(job, e)
+        return interrupted
+
+    def recover(interrupted: list[tuple[int, Mapping[str, Any]]]) -> None:
+        """
+        Replace the broken pool, and find which of the `interrupted` jobs killed
+        its worker by running them again one at a time. Only that job is
+        reported as failed.
+        """
+        interrupted = interrupted + collect(wait(pending)[0])
+        replace_pool()
+        if len(interrupted) == 1:
+            index, job = interrupted[0]
+            results[index] = failed(
+                job, BrokenProcessPool("The worker running this job died.")
+            )
+            return
+        for index, job in interrupted:
+            try:
+                results[index] = pool.submit(run, index, job).result()[1]
+            except BrokenProcessPool as e:
+                results[index] = failed(job, e)
+                replace_pool()
+            except Exception as e:
+                results[index] = failed(job, e)
+
+    def finish_pending() -> None:
+        while pending:
+            interrupted = collect(wait(pending)[0])
+            if interrupted:
+                recover(interrupted)
+
+    def submit(index: int, job: Mapping[str, Any]) -> None:
+        nonlocal pool_jobs
+        if max_pool_jobs is not None and pool_jobs >= max_pool_jobs:
+            finish_pending()
+            replace_pool()
+        try:
+            future = pool.submit(run, index, job)
+        except BrokenProcessPool:
+            # A worker died since the last results were collected.
+            recover([])
+            future = pool.submit(run, index, job)
+        pending[future] = (index, job)
+        pool_jobs += 1
+
+    try:
+        for index, job in enumerate(jobs):
+            submit(index, job)
+            if len(pending) >= 2 * workers:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                interrupted = collect(done)
+                if interrupted:
+                    recover(interrupted)
+        finish_pending()
+    finally:
+        pool.shutdown()
+
+    return [results[index] for index in sorted(results)]
@@ -0,0 +1,124 @@
+import inspect
+from calendar import day_name
+from collections.abc import Mapping, Sequence
+from typing import Any, Optional, Union
+
+import matplotlib.patches as patches
+from matplotlib.axes import Axes
+from matplotlib.collections import PathCollection
+from matplotlib.image import PcolorImage
+from narwhals.typing import IntoDataFrame
+
+from dayplot.calendar import (
+    CalendarHandle,
+    _parse_quantile,
+    _validate_agg,
+    _validate_boxstyle,
+    _validate_cmap,
+    _validate_colors,
+    _validate_granularity,
+    _validate_month_label_step,
+    _validate_render,
+    calendar,
+)
+
+# Arguments of `calendar()` that are given to `CalendarRenderer.render()`.
+_DATA_ARGUMENTS = ("dates", "values", "data", "ax")
+_CALENDAR_ARGUMENTS = frozenset(inspect.signature(calendar).parameters)
+
+
+def _validate_style_colors(colors: Any) -> None:
+    """
+    Check the colors of categories, before the categories of the data are known.
+    """
+    if isinstance(colors, Mapping):
+        _validate_colors(colors, list(colors))
+    elif isinstance(colors, Sequence) and not isinstance(colors, str):
+        _validate_colors(colors, list(range(len(colors))))
+    else:
+        _validate_colors(colors, [])
+
+
+class CalendarRenderer:
+    """
+    A calendar style, validated once, to draw many calendars with it.
+
+    The arguments of `dayplot.calendar()` that are not data (colormap, colors,
+    labels, box style, etc) are checked when the renderer is created, so that an
+    invalid style fails once, before any calendar is drawn, rather than on every
+    render:
+
+    ```python
+    renderer = dp.CalendarRenderer(render="collection", **dp.styles["github"])
+    for ax, (dates, values) in zip(axes, series):
+        renderer.render(dates, values, ax=ax)
+    ```
+
+    `render()` calls `dayplot.calendar()` with the style, so it draws exactly the
+    same calendars in the same time: a renderer checks a style early, it does not
+    make rendering faster.
+
+    Args:
+        style: Any arguments of `dayplot.calendar()`, except `dates`, `values`, `data`
+            and `ax`, which are given to `render()`.
+    """
+
+    def __init__(self, **style: Any):
+        data_arguments = [name for name in _DATA_ARGUMENTS if name in style]
+        if data_arguments:
+            names = ", ".join(f"`{name}`" for name in data_arguments)
+            raise ValueError(
+                f"{names} cannot be part of a style: pass them to `render()`."
+            )
+
+        boxstyle: Union[str, patches.BoxStyle] = style.get("boxstyle", "square")
+        cell_kwargs = {k: v for k, v in style.items() if k not in _CALENDAR_ARGUMENTS}
+        _validate_boxstyle(boxstyle)
+        _validate_render(
+            style.get("render", "patches"),
+            boxstyle,
+            style.get("edgewidth", 0.0),
+            cell_kwargs,
+        )
+        _validate_month_label_step(style.get("month_label_step", 1))
+        _validate_agg(style.get("agg", "sum"))
+        _validate_granularity(style.get("granularity", "day"))
+        _parse_quantile(style.get("vmin"), "vmin")
+        _parse_quantile(style.get("vmax"), "vmax")
+        if style.get("week_starts_on", "Sunday") not in day_name:
+            raise ValueError(
+                f"Invalid `week_starts_on` value. Must be in {list(day_name)}"
+            )
+
+        if "cmap" in style:
+            _validate_cmap(style["cmap"])
+        _validate_style_colors(style.get("colors"))
+        self._style = style
+
+    @property
+    def style(self) -> dict[str, Any]:
+        """The arguments passed to `dayplot.calendar()` by `render()`."""
+        return dict(self._style)
+
+    def render(
+        self,
+        dates: Any,
+        values: Any,
+        ax: Optional[Axes] = None,
+        data: Optional[IntoDataFrame] = None,
+    ) -> Union[
+        list[patches.FancyBboxPatch], PathCollection, PcolorImage, CalendarHandle
+    ]:
+        """
+        Draw a calendar with this style.
+
+        Args:
+            dates: Date-like objects, or a column name of `data`. See `dayplot.calendar()`.
+            values: Values corresponding to each date in dates, or a column name of `data`.
+            ax: A matplotlib axes. If None, plt.gca() will be used.
+            data: A dataframe (or lazy frame) holding the `dates` and `values` columns.
+
+        Returns:
+            The output of `dayplot.calendar()` with this style.
+        """
+        return calendar(dates, values, data=data, ax=ax, **self._style)
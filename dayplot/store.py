@@ -0,0 +1,225 @@
+import json
+import os
+from datetime import date, datetime
+from collections.abc import Sequence
+from typing import Any, Literal, Optional, Union
+
+import numpy as np
+
+from dayplot.aggregate import DailyAccumulator
+from dayplot.utils import _date_to_datetime64, _datetime64_to_date, _parse_date
+
+_MAGIC = b"DAYPLOT1"
+# The data starts at a multiple of this many bytes.
+_ALIGNMENT = 64
+
+
+class DailyStore:
+    """
+    A binary file of daily series, read through a memory map.
+
+    The file holds a JSON header (origin date, number of days, dtype and series
+    names) followed by one row of daily values per series. Days without data are
+    NaN. Reading a series, or a window of it, does not load or copy the file.
+    `dayplot.calendar()` aggregates float64 values, so it uses the values of a
+    "float64" store as they are, and copies the window of a "float32" store:
+
+    ```python
+    store = dp.DailyStore.create(
+        "counts.dayplot", names=["alice", "bob"], start_date="2015-01-01", end_date="2024-12-31"
+    )
+    store.write("alice", df["dates"], df["values"])
+    store.flush()
+
+    store = dp.DailyStore("counts.dayplot")
+    dp.calendar(*store.read("alice", "2024-01-01", "2024-12-31"))
+    ```
+
+    Args:
+        path: Path of a file created by `DailyStore.create()`.
+        mode: "r" to open the file read-only, "r+" to also write series.
+
+    Attributes:
+        path: Path of the file.
+        names: Names of the series, in file order.
+        start_date: First day of every series.
+        end_date: Last day of every series.
+    """
+
+    def __init__(
+        self, path: Union[str, "os.PathLike[str]"], mode: Literal["r", "r+"] = "r"
+    ):
+        if mode not in ("r", "r+"):
+            raise ValueError('`mode` must be "r" or "r+".')
+
+        self.path = os.fspath(path)
+        with open(self.path, "rb") as f:
+            if f.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError(f"{self.path!r} is not a dayplot store.")
+            header_size = int.from_bytes(f.read(8), "little")
+            header = json.loads(f.read(header_size))
+
+        self.names: list[Any] = header["names"]
+        self._rows = {name: row for row, name in enumerate(self.names)}
+        self._origin = int(np.datetime64(header["origin"], "D").astype(np.int64))
+        n_days = header["n_days"]
+        self.start_date = _datetime64_to_date(np.datetime64(self._origin, "D"))
+        self.end_date = _datetime64_to_date(
+            np.datetime64(self._origin + n_days - 1, "D")
+        )
+        self._data = np.memmap(
+            self.path,
+            dtype=np.dtype(header["dtype"]),
+            mode=mode,
+            offset=_data_offset(header_size),
+            shape=(len(self.names), n_days),
+        )
+
+    @classmethod
+    def create(
+        cls,
+        path: Union[str, "os.PathLike[str]"],
+        names: Sequence[Union[str, int]],
+        start_date: Union[date, datetime, str],
+        end_date: Union[date, datetime, str],
+        dtype: Literal["float32", "float64"] = "float32",
+    ) -> "DailyStore":
+        """
+        Create a store where all the days of every series are missing, and open it
+        for writing.
+
+        Args:
+            path: Path of the file. An existing file is overwritten.
+            names: Names (strings or integers) of the series, e.g., user ids.
+            start_date: First day of every series.
+            end_date: Last day of every series.
+            dtype: Type of the daily values. "float32" halves the size of the file,
+                and represents integers exactly up to 16,777,216, but the windows
+                drawn with `dayplot.calendar()` are then converted to float64.
+
+        Returns:
+            A `dayplot.DailyStore` opened with `mode="r+"`.
+        """
+        names = list(names)
+        if len(set(names)) != len(names):
+            raise ValueError("`names` must be unique.")
+        if not all(isinstance(name, (str, int)) for name in names):
+            raise ValueError("`names` must be strings or integers.")
+        if dtype not in ("float32", "float64"):
+            raise ValueError('`dtype` must be "float32" or "float64".')
+
+        origin = _date_to_datetime64(_parse_date(start_date))
+        n_days = (
+            int((_date_to_datetime64(_parse_date(end_date)) - origin).astype(np.int64))
+            + 1
+        )
+        if n_days < 1:
+            raise ValueError("`start_date` must be before `end_date`.")
+
+        header = json.dumps(
+            {
+                "origin": str(origin),
+                "n_days": n_days,
+                "dtype": np.dtype(dtype).str,
+                "names": names,
+            }
+        ).encode()
+        # Pad the header with spaces, so the data is aligned.
+        header += b" " * (_data_offset(len(header)) - len(_MAGIC) - 8 - len(header))
+        with open(path, "wb") as f:
+            f.write(_MAGIC)
+            f.write(len(header).to_bytes(8, "little"))
+            f.write(header)
+            f.truncate(
+                _data_offset(len(header))
+                + len(names) * n_days * np.dtype(dtype).itemsize
+            )
+
+        data = np.memmap(
+            path,
+            dtype=dtype,
+            mode="r+",
+            offset=_data_offset(len(header)),
+            shape=(len(names), n_days),
+        )
+        data[:] = np.nan
+        data.flush()
+        del data
+        return cls(path, mode="r+")
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: Any) -> bool:
+        return name in self._rows
+
+    def _row(self, name: Any) -> int:
+        try:
+            return self._rows[name]
+        except KeyError:
+            raise KeyError(f"Unknown series {name!r}.") from None
+
+    def _day_range(
+        self,
+        start_date: Optional[Union[date, datetime, str]],
+        end_date: Optional[Union[date, datetime, str]],
+    ) -> tuple[int, int]:
+        n_days = self._data.shape[1]
+        start = 0 if start_date is None else self._day_index(start_date)
+        stop = n_days if end_date is None else self._day_index(end_date) + 1
+        return min(max(start, 0), n_days), min(max(stop, 0), n_days)
+
+    def _day_index(self, d: Union[date, datetime, str]) -> int:
+        return int(_date_to_datetime64(_parse_date(d)).astype(np.int64)) - self._origin
+
+    def read(
+        self,
+        name: Union[str, int],
+        start_date: Optional[Union[date, datetime, str]] = None,
+        end_date: Optional[Union[date, datetime, str]] = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Read a series, or a window of it, without copying it.
+
+        Args:
+            name: Name of the series.
+            start_date: First day of the window. If None, the first day of the store.
+            end_date: Last day of the window. If None, the last day of the store.
+
+        Returns:
+            A tuple of `dates` (a `datetime64[D]` array of every day of the window)
+                and `values` (a view of the memory-mapped file, with NaN for days
+                without data), which can be passed to `dayplot.calendar()`.
+        """
+        row = self._row(name)
+        start, stop = self._day_range(start_date, end_date)
+        dates = np.arange(self._origin + start, self._origin + stop).astype(
+            "datetime64[D]"
+        )
+        return dates, self._data[row, start:stop]
+
+    def write(self, name: Union[str, int], dates: Any, values: Any = None) -> None:
+        """
+        Sum events per day and store them in a series. Days that are not in `dates`
+        keep their current value, and events outside the days of the store are
+        ignored.
+
+        Args:
+            name: Name of the series.
+            dates: Date-like objects, in any format accepted by `dayplot.calendar()`.
+            values: Numeric values of the events. If None, each event counts as 1.
+        """
+        row = self._row(name)
+        acc = DailyAccumulator(self.start_date, self.end_date)
+        acc.add(dates, values)
+        days = acc.dates.astype(np.int64) - self._origin
+        self._data[row, days] = acc.values
+
+    def flush(self) -> None:
+        """Write the changes to the file."""
+        self._data.flush()
+
+
+def _data_offset(header_size: int) -> int:
+    size = len(_MAGIC) + 8 + header_size
+    return -(-size // _ALIGNMENT) * _ALIGNMENT
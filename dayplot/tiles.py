@@ -0,0 +1,327 @@
+import json
+import os
+import time
+from calendar import day_name
+from collections.abc import Mapping, Sequence
+from datetime import date, datetime
+from functools import partial
+from typing import Any, Callable, Literal, Optional, Union
+
+import numpy as np
+
+from dayplot.calendar import (
+    _aggregate_numeric,
+    _data_date_range,
+    _get_start_and_end_dates,
+    _is_numeric_values,
+    _numeric_norm,
+    _observed_range,
+    _parse_quantile,
+    _quantile_limits,
+    _validate_agg,
+    calendar,
+)
+from dayplot.render import RenderResult, _pooled_figure, _run_jobs
+from dayplot.utils import (
+    _date_to_datetime64,
+    _datetime64_to_date,
+    _to_datetime64,
+    _to_numpy,
+    week_starts,
+)
+
+# Months per tile, and average days per tile (to size the cells of a level).
+TILE_LEVELS = {
+    "decade": (120, 3652.5),
+    "year": (12, 365.25),
+    "quarter": (3, 91.3125),
+    "month": (1, 30.4375),
+}
+
+_INDEX_FILENAME = "index.json"
+
+
+def _tile_key(level: str, period: np.datetime64) -> str:
+    year, month = divmod(int(period.astype(np.int64)), 12)
+    year += 1970
+    if level == "decade":
+        return f"{year}s"
+    if level == "year":
+        return str(year)
+    if level == "quarter":
+        return f"{year}-Q{month // 3 + 1}"
+    return f"{year}-{month + 1:02d}"
+
+
+def _level_tiles(
+    level: str, start: np.datetime64, end: np.datetime64, firstweekday: int
+) -> list[dict[str, Any]]:
+    """
+    Return the tiles of a level covering the days from `start` to `end`.
+
+    A tile holds the week columns of the global calendar whose first day falls
+    in its period, so the tiles of a level partition the columns and line up
+    side by side. `column` is the index of the first column of a tile in the
+    global calendar.
+    """
+    months_per_tile = TILE_LEVELS[level][0]
+    first_month, last_month = np.array([start, end]).astype("datetime64[M]")
+    first_month -= first_month.astype(np.int64) % months_per_tile
+    periods = np.arange(first_month, last_month + 1, months_per_tile)
+
+    origin, last_week = week_starts(np.array([start, end]), firstweekday)
+    period_starts = periods.astype("datetime64[D]")
+    period_ends = (periods + months_per_tile).astype("datetime64[D]") - 1
+    # First week starting in the period, and last week starting in it.
+    first_weeks = week_starts(period_starts + 6, firstweekday)
+    last_weeks = week_starts(period_ends, firstweekday)
+    first_weeks = np.maximum(first_weeks, origin)
+    last_weeks = np.minimum(last_weeks, last_week)
+
+    tiles = []
+    for period, first_week, last_week_of_tile in zip(periods, first_weeks, last_weeks):
+        if last_week_of_tile < first_week:
+            continue
+        tiles.append(
+            dict(
+                key=_tile_key(level, period),
+                start_date=max(first_week, start),
+                end_date=min(last_week_of_tile + 6, end),
+                column=int((first_week - origin).astype(np.int64)) // 7,
+                n_columns=int((last_week_of_tile - first_week).astype(np.int64)) // 7
+                + 1,
+            )
+        )
+    return tiles
+
+
+def _render_tile(
+    index: int, job: Mapping[str, Any], out_dir: str
+) -> tuple[int, RenderResult]:
+    start = time.perf_counter()
+    filename = str(job["filename"])
+    try:
+        path = os.path.join(out_dir, filename)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # One inch per week column, at one dot per pixel of a column, so that
+        # tiles have an exact size in pixels.
+        n_columns = job["n_columns"]
+        with _pooled_figure((n_columns, 7), job["column_pixels"]) as fig:
+            ax = fig.add_axes((0, 0, 1, 1))
+            calendar(**job["calendar_kws"], ax=ax)
+            # Labels are left to the viewer: they would be cut at tile edges.
+            for text in list(ax.texts):
+                text.remove()
+            ax.set_aspect("auto")
+            ax.set_xlim(0, n_columns)
+            ax.set_ylim(7, 0)
+            fig.savefig(path, format="png")
+        result = RenderResult(filename, path, time.perf_counter() - start, None)
+    except Exception as e:
+        result = RenderResult(
+            filename, None, time.perf_counter() - start, f"{type(e).__name__}: {e}"
+        )
+    return index, result
+
+
+def export_tiles(
+    dates: Any,
+    values: Any,
+    out_dir: str,
+    levels: Sequence[Literal["decade", "year", "quarter", "month"]] = (
+        "decade",
+        "year",
+        "quarter",
+    ),
+    tile_width: int = 1024,
+    start_date: Optional[Union[date, datetime, str]] = None,
+    end_date: Optional[Union[date, datetime, str]] = None,
+    week_starts_on: str = "Sunday",
+    agg: Union[
+        Literal["sum", "mean", "min", "max", "count", "median"],
+        Callable[[np.ndarray], Any],
+    ] = "sum",
+    vmin: Optional[Union[float, str]] = None,
+    vmax: Optional[Union[float, str]] = None,
+    vcenter: Optional[float] = None,
+    workers: Optional[int] = None,
+    max_jobs_per_worker: int = 500,
+    **kwargs: Any,
+) -> list[RenderResult]:
+    """
+    Render a calendar as PNG tiles at several zoom levels, for zoomable viewers.
+
+    Each level splits the calendar into tiles of one period (e.g., one tile per
+    year), saved as `out_dir/<level>/<key>.png` (e.g., `year/2024.png`). A tile
+    holds the week columns starting in its period, so the tiles of a level line
+    up seamlessly side by side, and all tiles share the same color scale. Daily
+    values are aggregated once, and tiles are rendered in parallel like
+    `dayplot.render_many()` (scripts should be guarded by
+    `if __name__ == "__main__":`).
+
+    The tiles are described in `out_dir/index.json`, with the window of the
+    calendar, the color limits and, for each level, the size of a week column in
+    pixels and the tiles that were rendered:
+
+    ```json
+    {
+      "start_date": "1990-01-01", "end_date": "2024-12-31", "columns": 1827,
+      "rows": 7, "week_starts_on": "Sunday", "vmin": 0.0, "vmax": 14.0,
+      "levels": [
+        {
+          "name": "year", "column_pixels": 20,
+          "tiles": [
+            {"key": "1990", "path": "year/1990.png", "start_date": "1990-01-01",
+             "end_date": "1990-12-29", "column": 0, "columns": 52,
+             "width": 1040, "height": 140},
+            ...
+          ]
+        },
+        ...
+      ]
+    }
+    ```
+
+    A tile is placed at `column * column_pixels` pixels from the left of its
+    level. Month and day labels are not drawn on tiles, since they would be cut
+    at tile edges: viewers draw them from the dates of the index.
+
+    Args:
+        dates: Date-like objects, in any format accepted by `dayplot.calendar()`.
+        values: Numeric values corresponding to each date in dates.
+        out_dir: Directory where tiles and the index are saved. It is created if
+            needed.
+        levels: Zoom levels to render, among "decade", "year", "quarter" and "month".
+        tile_width: Approximate width of a tile, in pixels. Week columns have the same
+            whole number of pixels in all tiles of a level.
+        start_date: The earliest date of the calendar. If not provided, the minimum
+            date found in `dates` will be used.
+        end_date: The latest date of the calendar. If not provided, the maximum date
+            found in `dates` will be used.
+        week_starts_on: The starting day of the week ("Sunday", "Monday", etc).
+        agg: How values of the same day are combined. See `dayplot.calendar()`.
+        vmin: The lower bound of the color scale, shared by all tiles. Can be a
+            quantile of the daily values, given as "pXX" (e.g., "p1").
+        vmax: The upper bound of the color scale, shared by all tiles. Can be a
+            quantile of the daily values, given as "pXX" (e.g., "p99").
+        vcenter: The midpoint of the color scale. See `dayplot.calendar()`.
+        workers: Number of worker processes. If None, the number of CPUs is used. If 1,
+            tiles are rendered in the current process.
+        max_jobs_per_worker: Number of tiles after which a worker process is replaced
+            by a new one. See `dayplot.render_many()`.
+        kwargs: Any additional arguments that will be passed to `dayplot.calendar()`
+            to style the cells (e.g., `cmap`, `color_for_none`, `boxstyle` or
+            `render`, which defaults to "collection").
+
+    Returns:
+        A list of `dayplot.RenderResult`, one for each tile, level by level.
+    """
+    for level in levels:
+        if level not in TILE_LEVELS:
+            raise ValueError(
+                f"Invalid level {level!r}. Must be in {list(TILE_LEVELS)}."
+            )
+    if week_starts_on not in day_name:
+        raise ValueError(f"Invalid `week_starts_on` value. Must be in {list(day_name)}")
+    _validate_agg(agg)
+    _parse_quantile(vmin, "vmin")
+    _parse_quantile(vmax, "vmax")
+    if len(dates) != len(values):
+        raise ValueError("`dates` and `values` must have the same length.")
+    values = _to_numpy(values)
+    if not _is_numeric_values(values):
+        raise ValueError("`export_tiles()` only supports numeric values.")
+    firstweekday = [*day_name].index(week_starts_on)
+
+    day_numbers = _to_datetime64(dates).astype(np.int64)
+    start_date, end_date = _get_start_and_end_dates(
+        *_data_date_range(day_numbers), start_date, end_date
+    )
+    start, end = _date_to_datetime64(start_date), _date_to_datetime64(end_date)
+    n_days = int((end - start).astype(np.int64)) + 1
+    counts, observed = _aggregate_numeric(
+        day_numbers - start.astype(np.int64),
+        values.astype(float, copy=False),
+        n_days,
+        agg,
+    )
+    min_count, max_count = _observed_range(counts, observed)
+    vmin, vmax = _quantile_limits(counts, observed, vmin, vmax)
+    norm, _, vmin, vmax = _numeric_norm(min_count, max_count, vmin, vmax, vcenter)
+    days = start + np.arange(n_days)
+
+    kwargs.setdefault("render", "collection")
+    origin, last_week = week_starts(np.array([start, end]), firstweekday)
+    index: dict[str, Any] = dict(
+        start_date=str(start),
+        end_date=str(end),
+        columns=int((last_week - origin).astype(np.int64)) // 7 + 1,
+        rows=7,
+        week_starts_on=week_starts_on,
+        vmin=float(vmin),
+        vmax=float(vmax),
+        levels=[],
+    )
+    jobs = []
+    for level in levels:
+        column_pixels = max(round(tile_width * 7 / TILE_LEVELS[level][1]), 1)
+        tiles = []
+        for tile in _level_tiles(level, start, end, firstweekday):
+            first = int((tile["start_date"] - start).astype(np.int64))
+            last = int((tile["end_date"] - start).astype(np.int64)) + 1
+            has_data = observed[first:last]
+            if has_data.any():
+                tile_dates = days[first:last][has_data]
+                tile_values = counts[first:last][has_data]
+            else:
+                # A missing value, so that empty tiles are drawn too.
+                tile_dates, tile_values = days[first : first + 1], np.array([np.nan])
+
+            filename = f"{level}/{tile['key']}.png"
+            jobs.append(
+                dict(
+                    filename=filename,
+                    n_columns=tile["n_columns"],
+                    column_pixels=column_pixels,
+                    calendar_kws=dict(
+                        kwargs,
+                        dates=tile_dates,
+                        values=tile_values,
+                        start_date=_datetime64_to_date(tile["start_date"]),
+                        end_date=_datetime64_to_date(tile["end_date"]),
+                        week_starts_on=week_starts_on,
+                        norm=norm,
+                    ),
+                )
+            )
+            tiles.append(
+                dict(
+                    key=tile["key"],
+                    path=filename,
+                    start_date=str(tile["start_date"]),
+                    end_date=str(tile["end_date"]),
+                    column=tile["column"],
+                    columns=tile["n_columns"],
+                    width=tile["n_columns"] * column_pixels,
+                    height=7 * column_pixels,
+                )
+            )
+        index["levels"].append(
+            dict(name=level, column_pixels=column_pixels, tiles=tiles)
+        )
+
+    os.makedirs(out_dir, exist_ok=True)
+    results = _run_jobs(
+        partial(_render_tile, out_dir=out_dir), jobs, workers, max_jobs_per_worker
+    )
+
+    # Only the tiles that were rendered are listed.
+    rendered = {result.filename for result in results if result.ok}
+    for level_index in index["levels"]:
+        level_index["tiles"] = [
+            tile for tile in level_index["tiles"] if tile["path"] in rendered
+        ]
+    with open(os.path.join(out_dir, _INDEX_FILENAME), "w") as f:
+        json.dump(index, f, indent=2)
+    return results
@@ -1,7 +1,9 @@
 import os
+from importlib.util import find_spec
 import narwhals as nw
+import numpy as np
 from narwhals.typing import IntoDataFrame
-from typing import Any, Union, Literal
+from typing import Any, Optional, Union, Literal
 import calendar
 from datetime import date, datetime, timedelta
 from typing import Generator
@@ -9,6 +11,9 @@ from typing import Generator
 
 PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# Proleptic Gregorian ordinal of 1970-01-01, the `datetime64` epoch.
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
 
 def load_dataset(
     backend: Literal["pandas", "polars", "pyarrow", "modin", "cudf"] = "pandas",
@@ -45,6 +50,255 @@ def _parse_date(d: Union[datetime, str, date]) -> date:
     raise TypeError("Unsupported date type")
 
 
+def _to_series(column: Any) -> Optional[nw.Series]:
+    """
+    Return a narwhals series from a dataframe column or an Arrow array, or None
+    for other objects (lists, NumPy arrays, etc).
+    """
+    pa = nw.dependencies.get_pyarrow()
+    if pa is not None and isinstance(column, pa.Array):
+        column = pa.chunked_array([column])
+
+    series = nw.from_native(column, series_only=True, pass_through=True)
+    return series if isinstance(series, nw.Series) else None
+
+
+def _scan_source(
+    source: Any, backend: Optional[Literal["polars", "pyarrow", "pandas"]] = None
+) -> nw.LazyFrame[Any]:
+    """
+    Return a narwhals LazyFrame from a path to a CSV or Parquet file (scanned with
+    polars if installed, else pyarrow), or from a dataframe or a lazy frame.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        if backend is None:
+            backend = "polars" if find_spec("polars") is not None else "pyarrow"
+        extension = os.path.splitext(path)[1].lower()
+        if extension in (".parquet", ".pq"):
+            return nw.scan_parquet(path, backend=backend)
+        if extension == ".csv":
+            return nw.scan_csv(path, backend=backend)
+        raise ValueError(
+            f"Unsupported file {path!r}: only CSV and Parquet files can be read."
+        )
+
+    frame = nw.from_native(source)
+    return frame.lazy() if isinstance(frame, nw.DataFrame) else frame
+
+
+def _filter_days(
+    frame: nw.LazyFrame[Any],
+    dates: str,
+    start_date: Optional[Union[date, datetime, str]] = None,
+    end_date: Optional[Union[date, datetime, str]] = None,
+) -> tuple[nw.LazyFrame[Any], nw.Expr]:
+    """
+    Keep the rows of `frame` from `start_date` to `end_date`, and return it with
+    an expression of the day of each row (a date, or a datetime at midnight).
+
+    The filter is applied to the column itself, before parsing or truncating it,
+    so that backends can push it down to the file reader. Strings are compared
+    as ISO 8601 dates.
+    """
+    dtype = frame.collect_schema()[dates]
+    column = nw.col(dates)
+    if dtype == nw.String:
+        day = column.str.slice(0, 10).str.to_datetime("%Y-%m-%d")
+        to_bound: Any = date.isoformat
+    elif dtype == nw.Datetime:
+        if dtype.time_zone is not None:  # type: ignore[union-attr]
+            column = column.dt.replace_time_zone(None)
+        day = column.dt.truncate("1d")
+        to_bound = lambda d: datetime(d.year, d.month, d.day)  # noqa: E731
+    elif dtype == nw.Date:
+        day = column
+        to_bound = lambda d: d  # noqa: E731
+    else:
+        raise ValueError(
+            f"Column {dates!r} must contain dates, datetimes or strings, not {dtype}."
+        )
+
+    predicates = []
+    if start_date is not None:
+        predicates.append(column >= to_bound(_parse_date(start_date)))
+    if end_date is not None:
+        next_day = _parse_date(end_date) + timedelta(days=1)
+        predicates.append(column < to_bound(next_day))
+    if predicates:
+        frame = frame.filter(*predicates)
+    return frame, day
+
+
+def _daily_totals(
+    frame: nw.LazyFrame[Any],
+    dates: str,
+    values: Optional[str],
+    start_date: Optional[Union[date, datetime, str]] = None,
+    end_date: Optional[Union[date, datetime, str]] = None,
+    agg: Literal["sum", "mean", "min", "max", "count", "median"] = "sum",
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Aggregate the `values` column of `frame` per day with `agg`, lazily, and
+    collect only the daily results.
+
+    Returns the days (a `datetime64[D]` array), the aggregated values of each
+    day (the number of rows if `values` is None) and the number of rows of
+    each day. Missing values (null or NaN) are dropped before aggregating.
+    """
+    frame, day = _filter_days(frame, dates, start_date, end_date)
+    aggregations = [nw.len().alias("__rows")]
+    if values is not None:
+        dtype = frame.collect_schema()[values]
+        if not dtype.is_numeric():
+            raise ValueError(f"Column {values!r} must be numeric.")
+        if dtype.is_float():
+            frame = frame.with_columns(nw.col(values).fill_nan(None))
+        frame = frame.drop_nulls(subset=[values])
+        aggregations.append(getattr(nw.col(values), agg)().alias("__value"))
+
+    daily = (
+        frame.with_columns(day.alias("__day"))
+        .group_by("__day")
+        .agg(*aggregations)
+        .collect()
+    )
+    days = _to_datetime64(daily.get_column("__day"))
+    rows = daily.get_column("__rows").to_numpy().astype(np.int64)
+    results = rows if values is None else daily.get_column("__value").to_numpy()
+    return days, results.astype(float), rows
+
+
+def _to_numpy(column: Any) -> np.ndarray:
+    """
+    Return a 1D NumPy array from a sequence, a NumPy array, a dataframe column
+    (pandas, polars, pyarrow, etc) or an Arrow array.
+
+    Columns are converted through narwhals, so they keep their native dtype
+    and are never turned into Python lists. Timezone-aware datetimes keep
+    their local wall-clock time. Sequences of values of different types give
+    an object array of the original values.
+    """
+    if isinstance(column, np.ndarray):
+        return column
+
+    series = _to_series(column)
+    if series is not None:
+        dtype = series.dtype
+        if isinstance(dtype, nw.Datetime) and dtype.time_zone is not None:
+            series = series.dt.replace_time_zone(None)
+        return series.to_numpy()
+
+    array = np.asarray(column)
+    if array.dtype.kind != "O" and array.ndim == 1:
+        if len({type(value) for value in column}) > 1:
+            # NumPy converts mixed values to a common type (e.g., [1, "a"] to
+            # strings), while each value must keep its own.
+            return np.fromiter(column, dtype=object, count=len(array))
+    return array
+
+
+def _factorize(
+    values: Any, rows: Optional[np.ndarray] = None
+) -> tuple[list[Any], np.ndarray]:
+    """
+    Return the distinct values of `values` in first-appearance order, and the
+    index of each element in that list (only of the elements at `rows`, if given).
+
+    Dataframe columns and Arrow arrays without nulls are factorized by their own
+    backend, which only reads the codes of categorical columns. Other values are
+    factorized with a dictionary.
+    """
+    series = _to_series(values)
+    if series is not None and series.null_count() == 0:
+        uniques = series.unique(maintain_order=True).to_list()
+        inverse = series.replace_strict(
+            uniques, range(len(uniques)), return_dtype=nw.Int64
+        ).to_numpy()
+        inverse = inverse.astype(np.intp, copy=False)
+        return uniques, inverse if rows is None else inverse[rows]
+
+    values = _to_numpy(values)
+    uniques = list(dict.fromkeys(values.tolist()))
+    codes = {value: i for i, value in enumerate(uniques)}
+    selected = values.tolist() if rows is None else values[rows].tolist()
+    inverse = np.fromiter(
+        map(codes.__getitem__, selected), dtype=np.intp, count=len(selected)
+    )
+    return uniques, inverse
+
+
+def _parse_dates(dates: np.ndarray) -> np.ndarray:
+    """
+    Parse an array of date-like objects to a `datetime64[D]` array.
+
+    Dates and datetimes are converted in bulk through their ordinals, which
+    keeps the local date of timezone-aware datetimes like `_parse_date` does.
+    Otherwise, each distinct value is parsed only once. When every distinct
+    value is a "YYYY-MM-DD" string, they are parsed by NumPy in bulk. Otherwise
+    they go through `_parse_date`, and invalid strings are reported with the
+    rows they appear in.
+    """
+    if len(dates) and isinstance(dates[0], date):
+        try:
+            ordinals = np.fromiter(
+                map(date.toordinal, dates.tolist()), dtype=np.int64, count=len(dates)
+            )
+            return (ordinals - _EPOCH_ORDINAL).astype("datetime64[D]")
+        except TypeError:
+            # Not only dates: parsed value by value below.
+            pass
+
+    uniques, inverse = _factorize(dates)
+    if all(isinstance(value, str) and len(value) == 10 for value in uniques):
+        try:
+            return np.array(uniques, dtype="datetime64[D]")[inverse]
+        except ValueError:
+            pass
+
+    parsed = np.empty(len(uniques), dtype="datetime64[D]")
+    for i, value in enumerate(uniques):
+        try:
+            parsed[i] = _parse_date(value)
+        except ValueError:
+            rows = np.flatnonzero(inverse == i)
+            rows_text = ", ".join(str(row) for row in rows[:5])
+            if len(rows) > 5:
+                rows_text += f" and {len(rows) - 5} more"
+            raise ValueError(
+                f"Invalid date {value!r} in `dates` (row {rows_text}). "
+                'Date strings must be in "YYYY-MM-DD" format.'
+            ) from None
+    return parsed[inverse]
+
+
+def _to_datetime64(dates: Any) -> np.ndarray:
+    """
+    Convert date-like objects to a `datetime64[D]` array.
+    """
+    dates = _to_numpy(dates)
+    if np.issubdtype(dates.dtype, np.datetime64):
+        return dates.astype("datetime64[D]")
+    return _parse_dates(dates)
+
+
+def _null_days(day_numbers: np.ndarray) -> np.ndarray:
+    """
+    Return a mask of the null dates (NaT) of day numbers from `_to_datetime64()`.
+    """
+    return np.isnat(day_numbers.view("datetime64[D]"))
+
+
+def _datetime64_to_date(d: np.datetime64) -> date:
+    return date.fromordinal(
+        _EPOCH_ORDINAL + int(d.astype("datetime64[D]").astype(np.int64))
+    )
+
+
+def _date_to_datetime64(d: date) -> np.datetime64:
+    return np.datetime64(d, "D")
+
+
 def relative_date_add(
     d: date, *, years: int = 0, months: int = 0, days: int = 0
 ) -> date:
@@ -70,6 +324,45 @@ def relative_date_add(
     return result + timedelta(days=days)
 
 
+def month_starts(start: Union[date, str], end: Union[date, str]) -> np.ndarray:
+    """
+    Return the first day of every month from the month of `start` to the month
+    of `end`, as a `datetime64[D]` array.
+    """
+    first_month = np.datetime64(_parse_date(start), "M")
+    last_month = np.datetime64(_parse_date(end), "M")
+    return np.arange(first_month, last_month + 1).astype("datetime64[D]")
+
+
+def _week_start_days(day_numbers: Any, firstweekday: int) -> Any:
+    # 1970-01-01, the datetime64 epoch, is a Thursday (weekday 3).
+    return day_numbers - (day_numbers + 3 - firstweekday) % 7
+
+
+def week_starts(dates: Any, firstweekday: int = 0) -> np.ndarray:
+    """
+    Return the first day of the calendar week of each date, as a `datetime64[D]`
+    array. Weeks start on `firstweekday` (0 is Monday, 6 is Sunday), like in
+    `calendar.Calendar`.
+    """
+    day_numbers = _to_datetime64(dates).astype(np.int64)
+    return _week_start_days(day_numbers, firstweekday).astype("datetime64[D]")
+
+
+def week_positions(
+    dates: Any, start: Union[date, str], firstweekday: int = 0
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return the week index (counted from the calendar week of `start`) and the
+    day of week (0 for `firstweekday`) of each date.
+    """
+    day_numbers = _to_datetime64(dates).astype(np.int64)
+    start_day = int(_date_to_datetime64(_parse_date(start)).astype(np.int64))
+    first_week = _week_start_days(start_day, firstweekday)
+    weekdays = day_numbers - _week_start_days(day_numbers, firstweekday)
+    return (day_numbers - first_week) // 7, weekdays
+
+
 def date_range(
     start: date,
     stop: Union[date, None] = None,
@@ -0,0 +1,238 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+from datetime import date, datetime, timedelta
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from dayplot import (
+    DailyAccumulator,
+    aggregate_daily,
+    aggregate_files,
+    calendar,
+    load_dataset,
+    scan_daily,
+)
+
+
+def _events(n):
+    start = datetime(2024, 1, 1)
+    for i in range(n):
+        yield start + timedelta(hours=7 * i), i % 5
+
+
+def test_consume_matches_calendar_aggregation():
+    events = list(_events(1000))
+    acc = DailyAccumulator(chunk_size=64).consume(iter(events))
+
+    assert acc.n_events == 1000
+    dates, values = zip(*events)
+    fig, ax = plt.subplots()
+    expected = calendar(dates, values, render="collection", ax=ax)
+    cells = calendar(acc.dates, acc.values, render="collection", ax=ax)
+    assert cells.get_facecolors() == pytest.approx(expected.get_facecolors())
+    assert acc.values.sum() == sum(values)
+    plt.close("all")
+
+
+def test_add_chunks_in_any_order():
+    acc = DailyAccumulator()
+    acc.add(["2024-03-01", "2024-03-03"], [1, 2])
+    acc.add(["2024-01-01"], [5])
+    acc.add(np.array(["2024-03-03", "2024-05-01"], dtype="datetime64[D]"), [1, 1])
+
+    assert acc.dates.tolist() == [
+        date(2024, 1, 1),
+        date(2024, 3, 1),
+        date(2024, 3, 3),
+        date(2024, 5, 1),
+    ]
+    assert acc.values.tolist() == [5, 1, 3, 1]
+
+
+def test_add_counts_events_without_values():
+    acc = DailyAccumulator()
+    acc.add([datetime(2024, 1, 1, 8), datetime(2024, 1, 1, 20), date(2024, 1, 2)])
+
+    assert acc.values.tolist() == [2, 1]
+
+
+def test_add_drops_null_dates():
+    acc = DailyAccumulator()
+    acc.add(np.array(["2024-01-01", "NaT", "2024-01-03"], dtype="datetime64[D]"))
+
+    assert acc.dates.tolist() == [date(2024, 1, 1), date(2024, 1, 3)]
+    assert acc.n_events == 2
+
+
+def test_start_and_end_dates_bound_memory():
+    acc = DailyAccumulator(start_date="2024-01-10", end_date="2024-01-19")
+    acc.consume(_events(1000))
+
+    assert acc.dates.min() == np.datetime64("2024-01-10")
+    assert acc.dates.max() == np.datetime64("2024-01-19")
+    assert len(acc._sums) == 10
+    assert acc.n_events == sum(
+        date(2024, 1, 10) <= d.date() <= date(2024, 1, 19) for d, _ in _events(1000)
+    )
+
+
+def test_empty_accumulator():
+    acc = DailyAccumulator().consume([])
+
+    assert acc.n_events == 0
+    assert len(acc.dates) == 0
+    assert len(acc.values) == 0
+
+
+def test_invalid_inputs():
+    with pytest.raises(ValueError, match="chunk_size"):
+        DailyAccumulator(chunk_size=0)
+    with pytest.raises(ValueError, match="start_date"):
+        DailyAccumulator(start_date="2024-02-01", end_date="2024-01-01")
+
+    acc = DailyAccumulator()
+    with pytest.raises(ValueError, match="numeric"):
+        acc.add(["2024-01-01"], ["a"])
+    with pytest.raises(ValueError, match="same length"):
+        acc.add(["2024-01-01"], [1, 2])
+
+
+def test_merge_partial_accumulators():
+    events = list(_events(500))
+    dates, values = zip(*events)
+    expected = DailyAccumulator().consume(events)
+
+    first = DailyAccumulator().consume(events[250:])
+    second = DailyAccumulator().consume(events[:250])
+    merged = DailyAccumulator().merge(first).merge(second).merge(DailyAccumulator())
+
+    np.testing.assert_array_equal(merged.dates, expected.dates)
+    np.testing.assert_allclose(merged.values, expected.values)
+    assert merged.n_events == 500
+
+
+def test_merge_respects_bounds():
+    partial = DailyAccumulator()
+    partial.add(["2024-01-01", "2024-01-05", "2024-01-09"], [1, 2, 3])
+
+    acc = DailyAccumulator(start_date="2024-01-03", end_date="2024-01-06")
+    acc.merge(partial)
+
+    assert acc.dates.tolist() == [date(2024, 1, 5)]
+    assert acc.values.tolist() == [2]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_aggregate_daily(workers):
+    rng = np.random.default_rng(0)
+    dates = np.datetime64("2024-01-01") + rng.integers(0, 100, 10_000)
+    values = rng.random(10_000)
+
+    acc = aggregate_daily(dates, values, workers=workers, end_date="2024-03-01")
+    expected = DailyAccumulator(end_date="2024-03-01")
+    expected.add(dates, values)
+
+    np.testing.assert_array_equal(acc.dates, expected.dates)
+    np.testing.assert_allclose(acc.values, expected.values)
+
+    counts = aggregate_daily(dates.astype(str), workers=workers)
+    assert counts.values.sum() == 10_000
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_aggregate_files(tmp_path, workers):
+    df = load_dataset()
+    half = len(df) // 2
+    df.iloc[:half].to_csv(tmp_path / "a.csv", index=False)
+    df.iloc[half:].to_parquet(tmp_path / "b.parquet")
+
+    acc = aggregate_files(
+        [tmp_path / "a.csv", str(tmp_path / "b.parquet")], workers=workers
+    )
+
+    expected = DailyAccumulator()
+    expected.add(df["dates"], df["values"])
+    np.testing.assert_array_equal(acc.dates, expected.dates)
+    np.testing.assert_allclose(acc.values, expected.values)
+
+
+def test_aggregate_files_unsupported_format(tmp_path):
+    (tmp_path / "events.txt").write_text("dates,values\n")
+    with pytest.raises(ValueError, match="Unsupported file"):
+        aggregate_files([tmp_path / "events.txt"], workers=1)
+
+
+@pytest.mark.parametrize("backend", ["polars", "pyarrow", "pandas"])
+@pytest.mark.parametrize("extension", ["csv", "parquet"])
+def test_scan_daily_files(tmp_path, backend, extension):
+    df = load_dataset()
+    path = tmp_path / f"events.{extension}"
+    if extension == "csv":
+        df.to_csv(path, index=False)
+    else:
+        df.to_parquet(path)
+
+    acc = scan_daily(
+        path, start_date="2024-03-01", end_date="2024-06-30", backend=backend
+    )
+
+    expected = DailyAccumulator(start_date="2024-03-01", end_date="2024-06-30")
+    expected.add(df["dates"], df["values"])
+    np.testing.assert_array_equal(acc.dates, expected.dates)
+    np.testing.assert_allclose(acc.values, expected.values)
+    assert acc.n_events == expected.n_events
+
+    counts = scan_daily(path, values=None, backend=backend)
+    assert counts.values.sum() == counts.n_events == len(df)
+
+
+def test_scan_daily_lazy_frame_with_timestamps():
+    pl = pytest.importorskip("polars")
+    start = datetime(2024, 1, 1, 23)
+    lf = pl.LazyFrame(
+        {
+            "ts": [start + timedelta(hours=6 * i) for i in range(100)],
+            "v": [1.5] * 100,
+        }
+    ).with_columns(pl.col("ts").dt.replace_time_zone("UTC"))
+
+    acc = scan_daily(lf, dates="ts", values="v", end_date="2024-01-10")
+
+    assert acc.dates[0] == np.datetime64("2024-01-01")
+    assert acc.dates[-1] == np.datetime64("2024-01-10")
+    assert acc.n_events == 37
+    assert acc.values.tolist() == [1.5] + [6.0] * 9
+
+
+def test_scan_daily_invalid_columns(tmp_path):
+    df = load_dataset()
+    df.to_parquet(tmp_path / "events.parquet")
+    df.to_csv(tmp_path / "events.txt", index=False)
+
+    with pytest.raises(ValueError, match="must be numeric"):
+        scan_daily(tmp_path / "events.parquet", values="dates")
+    with pytest.raises(ValueError, match="must contain dates"):
+        scan_daily(tmp_path / "events.parquet", dates="values")
+    with pytest.raises(ValueError, match="Unsupported file"):
+        scan_daily(tmp_path / "events.txt")
+
+
+def test_calendar_with_lazy_frame():
+    pl = pytest.importorskip("polars")
+    df = load_dataset()
+    lf = pl.from_pandas(df).lazy()
+
+    fig, ax = plt.subplots()
+    cells = calendar("dates", "values", data=lf, start_date="2024-01-01", ax=ax)
+    expected = calendar(df["dates"], df["values"], start_date="2024-01-01", ax=ax)
+    assert [c.get_facecolor() for c in cells] == [c.get_facecolor() for c in expected]
+
+    categories = {"d": ["2024-01-01", "2024-01-02", "2024-01-02"], "c": ["a", "b", "c"]}
+    cells = calendar("d", "c", data=pl.LazyFrame(categories), ax=ax)
+    expected = calendar(categories["d"], categories["c"], ax=ax)
+    assert [c.get_facecolor() for c in cells] == [c.get_facecolor() for c in expected]
+    plt.close(fig)
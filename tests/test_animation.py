@@ -0,0 +1,59 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from matplotlib.animation import FuncAnimation
+from matplotlib.colors import to_rgba
+
+from dayplot import animate_calendar
+from dayplot.animation import _FillFrames
+from dayplot.calendar import calendar
+
+DATES = ["2024-01-01", "2024-01-03", "2024-01-10"]
+VALUES = [1, 2, 3]
+
+
+def test_animate_calendar_returns_blitted_animation():
+    fig, ax = plt.subplots()
+    anim = animate_calendar(DATES, VALUES, days_per_frame=3, ax=ax)
+    assert isinstance(anim, FuncAnimation)
+    assert anim._blit
+    plt.close(fig)
+
+
+def test_fill_frames_reveals_days_in_order():
+    fig, ax = plt.subplots()
+    handle = calendar(DATES, VALUES, render="collection", return_handle=True, ax=ax)
+    final = handle.cells.get_facecolors().copy()
+    frames = _FillFrames(handle)
+
+    artists = frames(0)
+    assert artists == [handle.cells]
+    empty = np.array(to_rgba("#e8e8e8"))
+    colors = handle.cells.get_facecolors()
+    np.testing.assert_allclose(colors, np.broadcast_to(empty, colors.shape))
+
+    frames(3)
+    colors = handle.cells.get_facecolors()
+    np.testing.assert_allclose(colors[:3], final[:3])
+    np.testing.assert_allclose(colors[3:], np.broadcast_to(empty, colors[3:].shape))
+
+    frames(len(final))
+    np.testing.assert_allclose(handle.cells.get_facecolors(), final)
+    plt.close(fig)
+
+
+def test_animate_calendar_saves_frames(tmp_path):
+    fig, ax = plt.subplots()
+    anim = animate_calendar(DATES, VALUES, days_per_frame=5, ax=ax)
+    anim.save(tmp_path / "year.gif", writer="pillow")
+    assert (tmp_path / "year.gif").stat().st_size > 0
+    plt.close(fig)
+
+
+def test_animate_calendar_invalid_days_per_frame():
+    with pytest.raises(ValueError, match="days_per_frame"):
+        animate_calendar(DATES, VALUES, days_per_frame=0)
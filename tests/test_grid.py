@@ -0,0 +1,212 @@
+import pytest
+import matplotlib.pyplot as plt
+from matplotlib.collections import PathCollection
+from matplotlib.colors import Normalize, TwoSlopeNorm
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+from dayplot import calendar, calendar_grid, shared_norm
+
+
+@pytest.fixture
+def series():
+    dates = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(10)]
+    return {
+        "small": (dates, list(range(10))),
+        "large": (dates, [10 * i for i in range(10)]),
+        "short": (dates[:3], [1, 2, 3]),
+    }
+
+
+def test_calendar_grid_single_artist(series):
+    """Test that every series is drawn in a single collection."""
+    fig, ax = plt.subplots()
+    cells = calendar_grid(series, ncols=2, ax=ax)
+
+    assert isinstance(cells, PathCollection)
+    assert len(ax.collections) == 1
+    assert len(ax.patches) == 0
+    assert len(cells.get_offsets()) == 3 * 10
+    assert [text.get_text() for text in ax.texts[:3]] == ["small", "large", "short"]
+
+    plt.close("all")
+
+
+def test_calendar_grid_shares_color_scale(series):
+    """Test that all series use the same normalization."""
+    fig, ax = plt.subplots()
+    cells = calendar_grid(series, ax=ax)
+    face_colors = cells.get_facecolors().reshape(3, 10, 4)
+
+    # The largest value of "large" is the top of the shared scale...
+    assert face_colors[1, -1] == pytest.approx(plt.get_cmap("Greens")(1.0))
+    # ...so the largest value of "small" is not.
+    assert face_colors[0, -1] != pytest.approx(plt.get_cmap("Greens")(1.0))
+
+    plt.close("all")
+
+
+@pytest.mark.parametrize("backend", [pd, pl])
+def test_calendar_grid_long_format(backend, series):
+    """Test that a long-format dataframe gives the same result as a mapping."""
+    df = backend.DataFrame(
+        {
+            "user": [key for key, (dates, _) in series.items() for _ in dates],
+            "dates": [d for dates, _ in series.values() for d in dates],
+            "values": [v for _, values in series.values() for v in values],
+        }
+    )
+    fig, ax = plt.subplots()
+    from_frame = calendar_grid(df, by="user", ax=ax)
+    from_mapping = calendar_grid(series, ax=ax)
+
+    assert np.array_equal(from_frame.get_facecolors(), from_mapping.get_facecolors())
+
+    plt.close("all")
+
+
+def test_calendar_grid_matches_calendar():
+    """Test that a one-series grid is colored like calendar()."""
+    dates = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(10)]
+    values = [-3, 0, 1, 2, 3, 4, 5, 6, 7, 8]
+    fig, ax = plt.subplots()
+
+    cells = calendar_grid({"a": (dates, values)}, ax=ax)
+    expected = calendar(dates, values, render="collection", ax=ax)
+
+    assert np.array_equal(cells.get_facecolors(), expected.get_facecolors())
+
+    plt.close("all")
+
+
+def test_calendar_grid_agg():
+    """Test that duplicate dates are aggregated with `agg`."""
+    dates = [datetime(2024, 1, 1)] * 3 + [datetime(2024, 1, 2)]
+    values = [1, 5, 3, 2]
+    fig, ax = plt.subplots()
+
+    cells = calendar_grid({"a": (dates, values)}, agg="mean", ax=ax)
+    expected = calendar(dates[2:], [3, 2], agg="sum", render="collection", ax=ax)
+
+    assert np.array_equal(cells.get_facecolors(), expected.get_facecolors())
+
+    plt.close("all")
+
+
+def test_calendar_grid_invalid_inputs(series):
+    """Test that invalid inputs raise a ValueError."""
+    fig, ax = plt.subplots()
+    dates = [datetime(2024, 1, 1)]
+
+    with pytest.raises(ValueError, match="numeric"):
+        calendar_grid({"a": (dates, ["work"])}, ax=ax)
+    with pytest.raises(ValueError, match="`by`"):
+        calendar_grid(pd.DataFrame({"dates": dates, "values": [1]}), ax=ax)
+    with pytest.raises(ValueError, match="`ncols`"):
+        calendar_grid(series, ncols=0, ax=ax)
+    with pytest.raises(ValueError, match="same length"):
+        calendar_grid({"a": (dates, [1, 2])}, ax=ax)
+
+    plt.close("all")
+
+
+def test_calendar_grid_quantile_limits(series):
+    """Test that "pXX" limits use the daily values of all series."""
+    fig, ax = plt.subplots()
+
+    cells = calendar_grid(series, vmax="p90", ax=ax)
+    all_values = [v for _, values in series.values() for v in values]
+    expected = calendar_grid(series, vmax=np.quantile(all_values, 0.9), ax=ax)
+
+    assert np.array_equal(cells.get_facecolors(), expected.get_facecolors())
+
+    plt.close("all")
+
+
+def test_shared_norm_matches_calendar_grid(series):
+    """Test that calendars drawn with a shared norm are colored like the grid."""
+    fig, ax = plt.subplots()
+    norm = shared_norm(series)
+    grid = calendar_grid(series, ax=ax).get_facecolors()
+    n_days = len(grid) // len(series)
+
+    for i, (dates, values) in enumerate(series.values()):
+        cells = calendar(
+            dates,
+            values,
+            start_date="2024-01-01",
+            end_date="2024-01-10",
+            norm=norm,
+            render="collection",
+            ax=ax,
+        )
+        assert np.array_equal(
+            cells.get_facecolors(), grid[i * n_days : (i + 1) * n_days]
+        )
+
+    plt.close("all")
+
+
+def test_shared_norm_from_dataframe(series):
+    """Test the limits, quantiles and diverging scale of a shared norm."""
+    df = pd.DataFrame(
+        [
+            {"user": key, "dates": d, "values": v}
+            for key, (dates, values) in series.items()
+            for d, v in zip(dates, values)
+        ]
+    )
+
+    norm = shared_norm(df, by="user")
+    assert (norm.vmin, norm.vmax) == (0, 90)
+
+    norm = shared_norm(df, by="user", vmax="p50", agg="count")
+    assert (norm.vmin, norm.vmax) == (1, 1)
+
+    df.loc[0, "values"] = -5
+    norm = shared_norm(df, by="user")
+    assert isinstance(norm, TwoSlopeNorm)
+    assert (norm.vmin, norm.vcenter, norm.vmax) == (-5, 0, 90)
+
+
+def test_calendar_with_norm_keeps_scale():
+    """Test that a calendar drawn with `norm` keeps it when its data changes."""
+    dates = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(10)]
+    norm = Normalize(0, 100)
+    fig, ax = plt.subplots()
+
+    handle = calendar(dates, list(range(10)), norm=norm, ax=ax, return_handle=True)
+    handle.set_values(dates, [1000] * 10)
+
+    assert handle._norm is norm
+    with pytest.raises(ValueError, match="`norm`"):
+        calendar(dates, list(range(10)), norm=norm, vmax=5, ax=ax)
+    with pytest.raises(ValueError, match="`norm`"):
+        calendar(dates, ["a"] * 10, norm=norm, ax=ax)
+
+    plt.close("all")
+
+
+@pytest.mark.parametrize("norm", [Normalize(), TwoSlopeNorm(vcenter=0)])
+def test_calendar_with_unscaled_norm(norm):
+    """Test that the limits of a norm without limits are set from the data."""
+    dates = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(10)]
+    fig, ax = plt.subplots()
+
+    calendar(
+        dates,
+        list(range(-2, 8)),
+        norm=norm,
+        legend=True,
+        legend_bins=4,
+        render="collection",
+        ax=ax,
+    )
+
+    assert (norm.vmin, norm.vmax) == (-2, 7)
+    assert len(ax.patches) == 4
+
+    plt.close("all")
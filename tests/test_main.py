@@ -1,16 +1,31 @@
 import pytest
 import warnings
 import matplotlib
+from matplotlib.collections import PathCollection
+from matplotlib.image import PcolorImage
 from matplotlib.patches import PathPatch
 import matplotlib.pyplot as plt
 from matplotlib.colors import LinearSegmentedColormap, to_rgba
 from datetime import datetime, timedelta
 import string
+from concurrent.futures import ThreadPoolExecutor
+import calendar as calendar_module
+
+import numpy as np
 
 import pandas as pd
 import polars as pl
 
 from dayplot import calendar
+from dayplot.calendar import (
+    IMPLEMENTED_BOXSTYLE,
+    _aggregate_last,
+    _aggregate_numeric,
+    _cmap_lut,
+    _get_layout,
+    _map_colors,
+    _validate_cmap,
+)
 import dayplot
 
 
@@ -213,6 +228,94 @@ def test_diffrerent_df_backends(backend):
     assert len(patches) == 7
 
 
+@pytest.mark.parametrize("backend", ["pandas", "polars", "pyarrow"])
+def test_calendar_data_argument(backend):
+    """Test that `dates` and `values` can be column names of `data`."""
+    df = dayplot.load_dataset(backend=backend)
+    fig, ax = plt.subplots()
+
+    cells = calendar("dates", "values", data=df, render="collection", ax=ax)
+    expected = calendar(df["dates"], df["values"], render="collection", ax=ax)
+
+    assert np.array_equal(cells.get_facecolors(), expected.get_facecolors())
+
+    plt.close("all")
+
+
+def test_calendar_numpy_and_arrow_inputs():
+    """Test NumPy datetime64 arrays and Arrow arrays as inputs."""
+    pa = pytest.importorskip("pyarrow")
+    dates = np.arange("2024-01-01", "2024-01-08", dtype="datetime64[D]")
+    values = np.arange(7)
+    fig, ax = plt.subplots()
+
+    rects = calendar(dates, values, ax=ax)
+    arrow_rects = calendar(pa.array(dates), pa.array(values), ax=ax)
+
+    assert len(rects) == len(arrow_rects) == 7
+    for rect, arrow_rect in zip(rects, arrow_rects):
+        assert rect.get_facecolor() == arrow_rect.get_facecolor()
+
+    plt.close("all")
+
+
+def test_calendar_timezone_aware_dates_use_local_day():
+    """Test that timezone-aware columns are bucketed by their local date."""
+    dates = pd.Series(pd.to_datetime(["2024-01-01 23:30"]).tz_localize("US/Eastern"))
+    fig, ax = plt.subplots()
+
+    rects = calendar(dates, [1], start_date="2024-01-01", end_date="2024-01-02", ax=ax)
+
+    assert rects[0].get_facecolor() != to_rgba("#e8e8e8")
+    assert rects[1].get_facecolor() == to_rgba("#e8e8e8")
+
+    plt.close("all")
+
+
+@pytest.mark.parametrize("backend", [pd, pl])
+def test_calendar_categorical_columns(backend):
+    """Test that string columns are detected as categorical from their dtype."""
+    dates = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(3)]
+    s = backend.Series(["work", "rest", "work"])
+    fig, ax = plt.subplots()
+
+    rects = calendar(dates, s, colors={"work": "red", "rest": "blue"}, ax=ax)
+
+    assert rects[0].get_facecolor() == to_rgba("red")
+    assert rects[1].get_facecolor() == to_rgba("blue")
+
+    plt.close("all")
+
+
+@pytest.mark.parametrize(
+    "to_column",
+    [
+        lambda values: pd.Series(values, dtype="category"),
+        lambda values: pd.Series(
+            pd.Categorical(values, categories=["z", "rest", "work"])
+        ),
+        lambda values: pl.Series(values, dtype=pl.Categorical),
+        lambda values: pl.Series(values, dtype=pl.Enum(["z", "rest", "work"])),
+        lambda values: pytest.importorskip("pyarrow").array(values).dictionary_encode(),
+    ],
+)
+def test_calendar_categorical_dtype_columns(to_column):
+    """Test that categorical columns keep first-appearance order, not category order."""
+    dates = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(4)]
+    values = ["work", "rest", "work", "work"]
+    fig, ax = plt.subplots()
+
+    cells = calendar(dates, to_column(values), render="collection", ax=ax)
+    expected = calendar(dates, values, render="collection", ax=ax)
+
+    assert cells.get_facecolors() == pytest.approx(expected.get_facecolors())
+    assert tuple(cells.get_facecolors()[0]) == pytest.approx(
+        to_rgba(plt.get_cmap("tab10").colors[0])
+    )
+
+    plt.close("all")
+
+
 def test_calendar_categorical_default_colors():
     """Test categorical values use the default tab10 colors."""
     dates = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(3)]
@@ -249,6 +352,29 @@ def test_calendar_categorical_dict_colors():
     plt.close("all")
 
 
+def test_calendar_categorical_mixed_types():
+    """Test that categories of different types keep their own type."""
+    dates = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(4)]
+    values = [1, "a", 2.5, 1]
+    fig, ax = plt.subplots()
+
+    patches = calendar(
+        dates,
+        values,
+        colors={1: "red", "a": "blue", 2.5: "green"},
+        ax=ax,
+    )
+
+    assert [patch.get_facecolor() for patch in patches] == [
+        to_rgba("red"),
+        to_rgba("blue"),
+        to_rgba("green"),
+        to_rgba("red"),
+    ]
+
+    plt.close("all")
+
+
 def test_calendar_categorical_list_colors_and_legend_order():
     """Test list colors are assigned and shown in first-appearance order."""
     dates = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(3)]
@@ -481,5 +607,695 @@ def test_month_grid(month_grid, month_grid_kws):
     plt.close("all")
 
 
+@pytest.mark.parametrize("boxstyle", IMPLEMENTED_BOXSTYLE)
+def test_calendar_collection_render(boxstyle):
+    """Test that render="collection" draws every cell as one artist."""
+    dates = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(30)]
+    values = list(range(30))
+    fig, ax = plt.subplots()
+
+    cells = calendar(
+        dates,
+        values,
+        boxstyle=boxstyle,
+        edgecolor="red",
+        edgewidth=0.5,
+        alpha=0.5,
+        mutation_scale=0.85,
+        render="collection",
+        ax=ax,
+    )
+
+    assert isinstance(cells, PathCollection)
+    assert len(ax.patches) == 0
+    assert len(ax.collections) == 1
+    assert len(cells.get_paths()) == 1
+    assert len(cells.get_offsets()) == 30
+    assert len(cells.get_facecolors()) == 30
+    assert cells.get_alpha() == 0.5
+
+    plt.close("all")
+
+
+def test_calendar_collection_matches_patches():
+    """Test that the collection and patch renders use the same colors."""
+    dates = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(10)]
+    values = [-3, 0, 1, 2, 3, 4, 5, 6, 7, 8]
+    fig, ax = plt.subplots()
+
+    rects = calendar(dates, values, ax=ax)
+    cells = calendar(dates, values, render="collection", ax=ax)
+
+    for rect, face_color in zip(rects, cells.get_facecolors()):
+        assert rect.get_facecolor() == pytest.approx(tuple(face_color))
+
+    plt.close("all")
+
+
+def test_calendar_invalid_render(sample_data):
+    """Test that an unknown render mode raises a ValueError."""
+    dates, values = sample_data
+    fig, ax = plt.subplots()
+
+    with pytest.raises(ValueError, match="render"):
+        calendar(dates, values, render="svg", ax=ax)
+
+    plt.close("all")
+
+
+def _image_cell_colors(image, collection):
+    """Read the cell colors of a render="image" calendar, in day order."""
+    weeks, weekdays = (collection.get_offsets() - 0.5).astype(int).T
+    return np.asarray(image.get_array())[2 * weekdays, 2 * weeks]
+
+
+def test_calendar_image_render():
+    """Test that render="image" draws every cell in one image, like the collection."""
+    dates = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(40)]
+    values = [i - 10 for i in range(40)]
+    fig, ax = plt.subplots()
+
+    image = calendar(dates, values, render="image", alpha=0.5, ax=ax)
+    cells = calendar(dates, values, render="collection", ax=ax)
+
+    assert isinstance(image, PcolorImage)
+    assert list(ax.images) == [image]
+    assert len(ax.patches) == 0
+    assert image.get_alpha() == 0.5
+    assert image.get_array().shape == (13, 2 * 6 - 1, 4)
+    assert _image_cell_colors(image, cells) == pytest.approx(cells.get_facecolors())
+    # Gaps between cells are transparent.
+    assert (image.get_array()[1::2, :, 3] == 0).all()
+    assert (image.get_array()[:, 1::2, 3] == 0).all()
+
+    plt.close("all")
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [dict(boxstyle="round"), dict(edgewidth=0.5), dict(mutation_scale=0.8)],
+)
+def test_calendar_image_render_requires_plain_squares(sample_data, kwargs):
+    """Test that render="image" rejects cells an image cannot draw."""
+    dates, values = sample_data
+    fig, ax = plt.subplots()
+
+    with pytest.raises(ValueError, match='render="image"'):
+        calendar(dates, values, render="image", ax=ax, **kwargs)
+
+    plt.close("all")
+
+
+def test_map_colors_matches_colormap():
+    """Test that the cached lookup table maps values like the colormap itself."""
+    cmap = _validate_cmap("RdBu")
+    normed = np.array([-0.5, 0, 0.25, 0.5, 0.999, 1, 1.5, np.nan])
+
+    assert _map_colors(cmap, normed) == pytest.approx(cmap(normed))
+
+
+def test_cmap_lut_is_thread_safe():
+    """Test that threads evicting each other's lookup tables do not fail."""
+    cmaps = [
+        LinearSegmentedColormap.from_list(str(i), ["white", "C0"]) for i in range(64)
+    ]
+
+    def worker(offset):
+        for i in range(500):
+            cmap = cmaps[(offset + i) % len(cmaps)]
+            assert _cmap_lut(cmap)[0] == pytest.approx(cmap(0))
+
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(worker, range(8)))
+
+
+def test_validate_cmap_is_memoized():
+    """Test that named colormaps are resolved once."""
+    assert _validate_cmap("Blues") is _validate_cmap("Blues")
+
+
+def test_warning_color_for_none_is_emitted_once(sample_data):
+    """Test that diverging data warns once about `color_for_none`, not per day."""
+    dates, values = sample_data
+    values[0] = -19
+    fig, ax = plt.subplots()
+
+    with warnings.catch_warnings(record=True) as record:
+        warnings.simplefilter("always")
+        calendar(dates, values, color_for_none="red", ax=ax)
+
+    assert len([w for w in record if "color_for_none" in str(w.message)]) == 1
+
+    plt.close("all")
+
+
+def test_aggregate_numeric_sums_duplicates_and_drops_out_of_window():
+    """Test that daily sums use only rows inside the window."""
+    offsets = np.array([-1, 0, 0, 2, 5])
+    values = np.array([100.0, 1.0, 2.0, 3.0, 100.0])
+
+    sums, observed = _aggregate_numeric(offsets, values, 4)
+
+    assert sums.tolist() == [3.0, 0.0, 3.0, 0.0]
+    assert observed.tolist() == [True, False, True, False]
+
+
+@pytest.mark.parametrize(
+    "agg, expected",
+    [
+        ("sum", [6.0, 0.0, 3.0, 0.0]),
+        ("mean", [2.0, 0.0, 3.0, 0.0]),
+        ("min", [1.0, 0.0, 3.0, 0.0]),
+        ("max", [3.0, 0.0, 3.0, 0.0]),
+        ("count", [3.0, 0.0, 1.0, 0.0]),
+        ("median", [2.0, 0.0, 3.0, 0.0]),
+        (lambda v: v[-1], [1.0, 0.0, 3.0, 0.0]),
+    ],
+)
+def test_aggregate_numeric_reducers(agg, expected):
+    """Test the built-in and callable daily reducers."""
+    offsets = np.array([0, 2, 0, 0, 0, 9])
+    values = np.array([3.0, 3.0, 2.0, np.nan, 1.0, 100.0])
+
+    results, observed = _aggregate_numeric(offsets, values, 4, agg)
+
+    assert results.tolist() == expected
+    assert observed.tolist() == [True, False, True, False]
+
+
+def test_aggregate_numeric_median_matches_numpy():
+    """Test the vectorized median against np.median on random days."""
+    rng = np.random.default_rng(0)
+    offsets = rng.integers(0, 50, 1000)
+    values = rng.normal(size=1000)
+
+    results, observed = _aggregate_numeric(offsets, values, 50, "median")
+
+    expected = [np.median(values[offsets == day]) for day in np.flatnonzero(observed)]
+    assert results[observed] == pytest.approx(expected)
+
+
+def test_aggregate_last_keeps_last_row_per_day():
+    """Test that categorical aggregation keeps the last row of each day."""
+    offsets = np.array([0, 2, 0, 7])
+
+    assert _aggregate_last(offsets, 3).tolist() == [2, -1, 1]
+
+
+def test_calendar_color_scale_ignores_out_of_window_days():
+    """Test that the color scale only depends on the displayed days."""
+    dates = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(3)]
+    dates.append(datetime(2025, 1, 1))
+    values = [1, 2, 3, 1000]
+    fig, ax = plt.subplots()
+
+    rects = calendar(dates, values, end_date="2024-01-03", ax=ax)
+
+    assert len(rects) == 3
+    assert rects[-1].get_facecolor() == pytest.approx(plt.get_cmap("Greens")(1.0))
+
+    plt.close("all")
+
+
+def test_layout_is_cached():
+    """Test that layouts are reused for the same window and week start."""
+    start, end = datetime(2024, 1, 1).date(), datetime(2024, 12, 31).date()
+    layout = _get_layout(start, end, 6)
+
+    assert _get_layout(start, end, 6) is layout
+    assert _get_layout(start, end, 0) is not layout
+    assert layout.month_grid_path is layout.month_grid_path
+    assert layout.n_days == 366
+    assert layout.total_weeks == 53
+    assert len(layout.month_starts) == 12
+    assert not layout.weeks.flags.writeable
+
+
+@pytest.mark.parametrize("week_starts_on", ["Sunday", "Monday", "Wednesday"])
+def test_layout_positions(week_starts_on):
+    """Test that cells are placed by week (column) and weekday (row)."""
+    dates = [datetime(2024, 2, 1) + timedelta(days=i) for i in range(60)]
+    values = list(range(60))
+    fig, ax = plt.subplots()
+
+    rects = calendar(dates, values, week_starts_on=week_starts_on, ax=ax)
+    firstweekday = list(calendar_module.day_name).index(week_starts_on)
+
+    for d, rect in zip(dates, rects):
+        weekday = round(rect.get_y() - 0.35)
+        assert weekday == (d.weekday() - firstweekday) % 7
+    first_week = [rect for rect in rects if round(rect.get_x() - 0.35) == 0]
+    assert 1 <= len(first_week) <= 7
+
+    plt.close("all")
+
+
+@pytest.mark.parametrize("render", ["patches", "collection", "image"])
+def test_calendar_handle_set_values(render):
+    """Test that set_values recolors cells like a fresh calendar() call."""
+    dates = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(10)]
+    fig, ax = plt.subplots()
+    handle = calendar(dates, list(range(10)), render=render, return_handle=True, ax=ax)
+    n_artists = len(ax.get_children())
+
+    new_values = [9 - i for i in range(10)]
+    handle.set_values(dates, new_values)
+    assert len(ax.get_children()) == n_artists
+    expected = calendar(dates, new_values, render="collection", ax=ax)
+
+    if render == "collection":
+        colors = handle.cells.get_facecolors()
+    elif render == "image":
+        colors = _image_cell_colors(handle.cells, expected)
+    else:
+        colors = np.array([rect.get_facecolor() for rect in handle.cells])
+    assert colors == pytest.approx(expected.get_facecolors())
+
+    plt.close("all")
+
+
+def test_calendar_handle_update_only_changes_given_days():
+    """Test that update() keeps the other days and the color scale."""
+    dates = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(10)]
+    fig, ax = plt.subplots()
+    handle = calendar(dates, list(range(10)), return_handle=True, ax=ax)
+    before = [rect.get_facecolor() for rect in handle.cells]
+
+    handle.update([datetime(2024, 1, 3)], [0])
+
+    after = [rect.get_facecolor() for rect in handle.cells]
+    assert after[2] == to_rgba("#e8e8e8")
+    assert after[:2] == before[:2]
+    assert after[3:] == before[3:]
+
+    plt.close("all")
+
+
+def test_calendar_handle_update_moves_color_scale_and_legend():
+    """Test that values outside the color scale recolor every cell and the legend."""
+    dates = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(4)]
+    fig, ax = plt.subplots()
+    handle = calendar(
+        dates,
+        [1, 2, 3, 4],
+        legend=True,
+        legend_bins=2,
+        legend_labels="auto",
+        render="collection",
+        return_handle=True,
+        ax=ax,
+    )
+
+    handle.update([datetime(2024, 1, 1)], [8])
+
+    greens = plt.get_cmap("Greens")
+    assert handle.cells.get_facecolors()[0] == pytest.approx(greens(1.0))
+    # vmin moved from 1 to 2, and vmax from 4 to 8.
+    assert handle.cells.get_facecolors()[3] == pytest.approx(greens((4 - 2) / 6))
+    labels = [text.get_text() for text in ax.texts]
+    assert "8" in labels
+
+    plt.close("all")
+
+
+def test_calendar_handle_categorical():
+    """Test categorical updates and unknown categories."""
+    dates = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(3)]
+    fig, ax = plt.subplots()
+    handle = calendar(
+        dates,
+        ["work", "rest", "work"],
+        colors={"work": "red", "rest": "blue"},
+        return_handle=True,
+        ax=ax,
+    )
+
+    handle.update([datetime(2024, 1, 1)], ["rest"])
+    assert handle.cells[0].get_facecolor() == to_rgba("blue")
+
+    with pytest.raises(ValueError, match="Unknown categories: 'sleep'"):
+        handle.update([datetime(2024, 1, 1)], ["sleep"])
+
+    plt.close("all")
+
+
 def dayplot_version():
     assert dayplot.__version__ == "0.6.0"
+
+
+def _month_labels(ax):
+    """Return the month labels of a calendar, i.e., all texts but the day labels."""
+    return [text.get_text() for text in ax.texts[:-7]]
+
+
+@pytest.mark.parametrize(
+    "step, expected",
+    [
+        (1, ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul"]),
+        (3, ["Jan", "Apr", "Jul"]),
+        (12, ["2024"]),
+    ],
+)
+def test_calendar_month_label_step(step, expected):
+    """Test that month_label_step keeps one label every `step` months."""
+    dates = [datetime(2024, 1, 1), datetime(2024, 7, 31)]
+    fig, ax = plt.subplots()
+
+    calendar(dates, [1, 2], month_label_step=step, ax=ax)
+
+    assert _month_labels(ax) == expected
+    plt.close("all")
+
+
+@pytest.mark.parametrize(
+    "step, expected",
+    [
+        (
+            5,
+            ["Jun", "Nov", "Apr", "Sep", "Feb", "Jul", "Dec"]
+            + ["May", "Oct", "Mar", "Aug", "Jan", "Jun", "Nov"],
+        ),
+        (18, ["Jul 2020", "Jan 2022", "Jul 2023", "Jan 2025"]),
+        (24, ["2022", "2024"]),
+    ],
+)
+def test_calendar_month_label_step_across_years(step, expected):
+    """Test that labels keep the same spacing across years."""
+    dates = [datetime(2020, 3, 1), datetime(2025, 12, 31)]
+    fig, ax = plt.subplots()
+
+    calendar(dates, [1, 2], month_label_step=step, ax=ax)
+
+    assert _month_labels(ax) == expected
+    plt.close("all")
+
+
+def test_calendar_month_label_step_auto():
+    """Test that "auto" thins labels on long ranges only."""
+    fig, ax = plt.subplots(figsize=(15, 4))
+    calendar(
+        [datetime(2024, 1, 1), datetime(2024, 12, 31)],
+        [1, 2],
+        month_label_step="auto",
+        ax=ax,
+    )
+    assert len(_month_labels(ax)) == 12
+
+    fig, ax = plt.subplots(figsize=(15, 4))
+    calendar(
+        [datetime(1975, 1, 1), datetime(2024, 12, 31)],
+        [1, 2],
+        month_label_step="auto",
+        render="image",
+        ax=ax,
+    )
+    labels = _month_labels(ax)
+    assert 5 <= len(labels) <= 50
+    assert all(label.isdigit() for label in labels)
+    plt.close("all")
+
+
+@pytest.mark.parametrize("step", [0, -1, 1.5, "often", True])
+def test_calendar_invalid_month_label_step(sample_data, step):
+    """Test that an invalid month_label_step raises a ValueError."""
+    dates, values = sample_data
+    with pytest.raises(ValueError, match="month_label_step"):
+        calendar(dates, values, month_label_step=step)
+    plt.close("all")
+
+
+def test_calendar_nan_values_are_missing():
+    """Test that NaN values are treated as days without data."""
+    dates = ["2024-01-01", "2024-01-02", "2024-01-03"]
+    fig, ax = plt.subplots()
+
+    cells = calendar(dates, [1, np.nan, 3], render="collection", ax=ax)
+    expected = calendar(
+        ["2024-01-01", "2024-01-03"],
+        [1, 3],
+        start_date="2024-01-01",
+        end_date="2024-01-03",
+        render="collection",
+        ax=ax,
+    )
+
+    assert cells.get_facecolors() == pytest.approx(expected.get_facecolors())
+    plt.close("all")
+
+
+@pytest.mark.parametrize(
+    "dates",
+    [
+        pd.Series(pd.to_datetime(["2024-01-01", None, "2024-01-03"])),
+        pl.Series([datetime(2024, 1, 1), None, datetime(2024, 1, 3)]),
+        np.array(["2024-01-01", "NaT", "2024-01-03"], dtype="datetime64[D]"),
+    ],
+)
+@pytest.mark.parametrize("values", [[1, 2, 3], ["a", "b", "a"]])
+@pytest.mark.parametrize("end_date", [None, "2024-01-10"])
+def test_calendar_null_dates_are_missing(dates, values, end_date):
+    """Test that null dates are dropped with their values."""
+    fig, ax = plt.subplots()
+
+    cells = calendar(dates, values, end_date=end_date, render="collection", ax=ax)
+    expected = calendar(
+        ["2024-01-01", "2024-01-03"],
+        values[::2],
+        end_date=end_date,
+        render="collection",
+        ax=ax,
+    )
+
+    assert cells.get_facecolors() == pytest.approx(expected.get_facecolors())
+    with pytest.raises(ValueError, match="`start_date` and `end_date`"):
+        calendar(np.array(["NaT"], dtype="datetime64[D]"), [1], ax=ax)
+    plt.close("all")
+
+
+@pytest.mark.parametrize("agg", ["mean", "max", "count", "median"])
+@pytest.mark.parametrize("backend", ["pandas", "polars", "polars-lazy"])
+def test_calendar_agg_with_dataframe(agg, backend):
+    """Test that aggregations pushed down to a dataframe match NumPy's."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "dates": pd.Timestamp("2024-01-01")
+            + pd.to_timedelta(rng.integers(0, 24 * 60, 500), unit="h"),
+            "values": rng.normal(size=500),
+        }
+    )
+    if backend == "polars":
+        data = pl.from_pandas(df)
+    elif backend == "polars-lazy":
+        data = pl.from_pandas(df).lazy()
+    else:
+        data = df
+    fig, ax = plt.subplots()
+
+    handle = calendar("dates", "values", data=data, agg=agg, ax=ax, return_handle=True)
+    expected = getattr(df.groupby(df["dates"].dt.normalize())["values"], agg)()
+
+    assert handle._counts[handle._observed] == pytest.approx(expected.values)
+    plt.close("all")
+
+
+def test_calendar_agg_is_kept_by_handle(sample_data):
+    """Test that a handle aggregates new data with the calendar's `agg`."""
+    dates, values = sample_data
+    fig, ax = plt.subplots()
+
+    handle = calendar(dates, values, agg="max", ax=ax, return_handle=True)
+    handle.set_values(dates[:2] * 2, [1, 2, 5, 3])
+
+    assert handle._counts[:3].tolist() == [5.0, 3.0, 0.0]
+    plt.close("all")
+
+
+def test_calendar_invalid_agg(sample_data):
+    """Test that an unknown `agg`, or `agg` with categorical values, raises."""
+    dates, values = sample_data
+    with pytest.raises(ValueError, match="Invalid `agg`"):
+        calendar(dates, values, agg="mode")
+    with pytest.raises(ValueError, match="`agg`"):
+        calendar(dates, ["a"] * len(dates), agg="count")
+    plt.close("all")
+
+
+def test_calendar_quantile_limits():
+    """Test that "pXX" limits are quantiles of the daily values."""
+    dates = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(100)]
+    values = list(range(1, 100)) + [10_000]
+    fig, ax = plt.subplots()
+
+    handle = calendar(dates, values, vmin="p0", vmax="p99", ax=ax, return_handle=True)
+    vmax = np.quantile(values, 0.99)
+    expected = calendar(dates, values, vmin=1, vmax=vmax, ax=ax, return_handle=True)
+
+    assert handle._norm.vmin == 1
+    assert handle._norm.vmax == pytest.approx(vmax)
+    assert handle._face_colors == pytest.approx(expected._face_colors)
+
+    # The quantile follows new data.
+    handle.set_values(dates, [1] * 99 + [3])
+    assert handle._norm.vmax == pytest.approx(np.quantile([1] * 99 + [3], 0.99))
+    plt.close("all")
+
+
+def test_calendar_quantile_limits_legend(sample_data):
+    """Test that the legend uses the resolved quantile limits."""
+    dates, values = sample_data
+    fig, ax = plt.subplots()
+
+    calendar(dates, values, vmax="p50", legend=True, legend_labels="auto", ax=ax)
+    labels = [text.get_text() for text in ax.texts]
+    ax.clear()
+    calendar(dates, values, vmax=4.5, legend=True, legend_labels="auto", ax=ax)
+
+    assert labels == [text.get_text() for text in ax.texts]
+    plt.close("all")
+
+
+@pytest.mark.parametrize("limit", ["99", "p", "p101", "q99", "p-1"])
+def test_calendar_invalid_quantile_limits(sample_data, limit):
+    """Test that invalid quantile specs raise a ValueError."""
+    dates, values = sample_data
+    with pytest.raises(ValueError, match="Invalid `vmax`"):
+        calendar(dates, values, vmax=limit)
+    plt.close("all")
+
+
+def test_calendar_weekly_granularity():
+    """Test that week cells hold weekly totals, one column per month."""
+    dates = pd.date_range("2024-01-01", "2024-03-31")
+    values = np.arange(len(dates), dtype=float)
+    fig, ax = plt.subplots()
+
+    handle = calendar(
+        dates,
+        values,
+        week_starts_on="Monday",
+        granularity="week",
+        render="collection",
+        ax=ax,
+        return_handle=True,
+    )
+    expected = pd.Series(values, index=dates).resample("W-SUN").sum()
+    offsets = handle.cells.get_offsets()
+
+    assert handle._counts.tolist() == expected.tolist()
+    # Weeks starting on Jan 1, 8, ..., 29 then Feb 5, ..., 26 and Mar 4, ..., 25.
+    assert offsets[:, 0].tolist() == [0.5] * 5 + [1.5] * 4 + [2.5] * 4
+    assert (
+        offsets[:, 1].tolist()
+        == [0.5, 1.5, 2.5, 3.5, 4.5]
+        + [
+            0.5,
+            1.5,
+            2.5,
+            3.5,
+        ]
+        * 2
+    )
+    plt.close("all")
+
+
+@pytest.mark.parametrize("render", ["patches", "collection", "image"])
+def test_calendar_monthly_granularity(render):
+    """Test that month cells hold monthly aggregates, one column per year."""
+    dates = pd.date_range("2020-06-15", "2023-02-10")
+    values = np.random.default_rng(0).normal(size=len(dates))
+    fig, ax = plt.subplots()
+
+    handle = calendar(
+        dates,
+        values,
+        agg="mean",
+        granularity="month",
+        render=render,
+        month_grid=True,
+        month_kws={"size": 5},
+        ax=ax,
+        return_handle=True,
+    )
+    expected = pd.Series(values, index=dates).resample("MS").mean()
+    layout = handle._layout
+
+    assert handle._counts == pytest.approx(expected.values)
+    assert layout.weeks.tolist() == [0] * 7 + [1] * 12 + [2] * 12 + [3] * 2
+    assert layout.weekdays.tolist() == [*range(5, 12), *range(12), *range(12), 0, 1]
+    assert [text.get_text() for text in ax.texts] == [
+        "2020",
+        "2021",
+        "2022",
+        "2023",
+        *calendar_module.month_abbr[1:],
+    ]
+    plt.close("all")
+
+
+def test_calendar_auto_granularity():
+    """Test that "auto" keeps days when they are visible and aggregates otherwise."""
+    dates = pd.date_range("1990-01-01", "2024-12-31")
+    values = np.ones(len(dates))
+    fig, ax = plt.subplots(figsize=(15, 4))
+
+    short = calendar(
+        dates[-365:], values[-365:], granularity="auto", ax=ax, return_handle=True
+    )
+    ax.clear()
+    long = calendar(dates, values, granularity="auto", ax=ax, return_handle=True)
+
+    assert short._layout is _get_layout(dates[-365].date(), dates[-1].date(), 6, "day")
+    assert long._layout.n_rows == 12
+    assert long._counts.sum() == len(dates)
+    plt.close("all")
+
+
+@pytest.mark.parametrize("agg", ["max", "mean"])
+def test_calendar_granularity_with_lazy_frame(agg):
+    """Test that periods aggregate raw rows, whether or not days are pushed down."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "dates": pd.Timestamp("2024-01-01")
+            + pd.to_timedelta(rng.integers(0, 24 * 120, 2000), unit="h"),
+            "values": rng.normal(size=2000),
+        }
+    )
+    fig, ax = plt.subplots()
+
+    handle = calendar(
+        "dates",
+        "values",
+        data=pl.from_pandas(df).lazy(),
+        agg=agg,
+        granularity="month",
+        ax=ax,
+        return_handle=True,
+    )
+    expected = getattr(df.set_index("dates")["values"].resample("MS"), agg)()
+
+    assert handle._counts == pytest.approx(expected.values)
+    plt.close("all")
+
+
+def test_calendar_handle_with_granularity():
+    """Test that a handle maps new days to the cells of their period."""
+    dates = pd.date_range("2024-01-01", "2024-03-31")
+    fig, ax = plt.subplots()
+
+    handle = calendar(
+        dates, np.ones(len(dates)), granularity="month", ax=ax, return_handle=True
+    )
+    handle.update(["2024-02-03", "2024-02-04", "2025-01-01"], [2, 3, 100])
+
+    assert handle._counts.tolist() == [31.0, 5.0, 31.0]
+    plt.close("all")
+
+
+def test_calendar_invalid_granularity(sample_data):
+    """Test that an unknown `granularity` raises a ValueError."""
+    dates, values = sample_data
+    with pytest.raises(ValueError, match="Invalid `granularity`"):
+        calendar(dates, values, granularity="year")
+    plt.close("all")
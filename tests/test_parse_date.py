@@ -1,7 +1,19 @@
 import pytest
-from datetime import datetime, date
+from datetime import datetime, date, timedelta, timezone
 
-from dayplot.utils import _parse_date
+import numpy as np
+import pandas as pd
+import polars as pl
+
+from dayplot.utils import (
+    _factorize,
+    _parse_date,
+    _parse_dates,
+    _to_datetime64,
+    month_starts,
+    week_positions,
+    week_starts,
+)
 
 
 def test_parse_date_from_datetime():
@@ -34,3 +46,100 @@ def test_parse_date_from_str_invalid_format():
 def test_parse_date_from_unsupported_type():
     with pytest.raises(TypeError):
         _parse_date(123)  # An integer is not supported by the function
+
+
+def test_parse_dates_from_iso_strings():
+    dates = np.array(["2023-01-15", "2023-01-16", "2023-01-15"])
+    result = _parse_dates(dates)
+    assert result.dtype == np.dtype("datetime64[D]")
+    assert result.tolist() == [date(2023, 1, 15), date(2023, 1, 16), date(2023, 1, 15)]
+
+
+def test_parse_dates_from_mixed_objects():
+    dates = np.array(
+        ["2023-1-15", date(2023, 1, 16), datetime(2023, 1, 17, 8)], dtype=object
+    )
+    result = _parse_dates(dates)
+    assert result.tolist() == [date(2023, 1, 15), date(2023, 1, 16), date(2023, 1, 17)]
+
+
+def test_parse_dates_reports_invalid_rows():
+    dates = np.array(["2023-01-15", "15-01-2023", "2023-01-16", "15-01-2023"])
+    with pytest.raises(ValueError, match=r"'15-01-2023' in `dates` \(row 1, 3\)"):
+        _parse_dates(dates)
+
+
+def test_to_datetime64_from_datetime64_array():
+    dates = np.array(["2023-01-15T23:59"], dtype="datetime64[m]")
+    assert _to_datetime64(dates).tolist() == [date(2023, 1, 15)]
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        ["b", "a", "b", "c", "a"],
+        np.array(["b", "a", "b", "c", "a"]),
+        pd.Series(["b", "a", "b", "c", "a"], dtype="category"),
+        pl.Series(["b", "a", "b", "c", "a"]),
+    ],
+)
+def test_factorize_first_appearance_order(values):
+    uniques, inverse = _factorize(values)
+    assert uniques == ["b", "a", "c"]
+    assert inverse.tolist() == [0, 1, 0, 2, 1]
+
+    uniques, inverse = _factorize(values, rows=np.array([3, 0]))
+    assert uniques == ["b", "a", "c"]
+    assert inverse.tolist() == [2, 0]
+
+
+def test_parse_dates_datetime_objects_keep_local_date():
+    dates = np.array(
+        [
+            date(2024, 1, 1),
+            datetime(2024, 1, 2, 23, 59),
+            datetime(2024, 1, 3, 23, 30, tzinfo=timezone(timedelta(hours=-5))),
+            pd.Timestamp("2024-01-04 12:00"),
+        ],
+        dtype=object,
+    )
+    expected = np.array(
+        ["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04"], dtype="datetime64[D]"
+    )
+    np.testing.assert_array_equal(_parse_dates(dates), expected)
+
+
+def test_parse_dates_mixed_dates_and_strings():
+    dates = np.array([date(2024, 1, 1), "2024-01-02"], dtype=object)
+    expected = np.array(["2024-01-01", "2024-01-02"], dtype="datetime64[D]")
+    np.testing.assert_array_equal(_parse_dates(dates), expected)
+
+
+def test_month_starts():
+    starts = month_starts(date(2023, 11, 15), "2024-02-01")
+    assert starts.tolist() == [
+        date(2023, 11, 1),
+        date(2023, 12, 1),
+        date(2024, 1, 1),
+        date(2024, 2, 1),
+    ]
+    assert month_starts("2024-03-31", "2024-03-01").tolist() == [date(2024, 3, 1)]
+
+
+@pytest.mark.parametrize("firstweekday", range(7))
+def test_week_starts_and_positions_match_calendar(firstweekday):
+    from calendar import Calendar
+    from dayplot.calendar import calendar_week
+
+    cal = Calendar(firstweekday)
+    dates = [date(1969, 12, 25) + timedelta(days=i) for i in range(0, 20000, 37)]
+
+    starts = week_starts(dates, firstweekday)
+    weeks, weekdays = week_positions(dates, dates[0], firstweekday)
+
+    expected_starts = [calendar_week(cal, d)[0] for d in dates]
+    assert starts.tolist() == expected_starts
+    assert weeks.tolist() == [
+        (s - expected_starts[0]).days // 7 for s in expected_starts
+    ]
+    assert weekdays.tolist() == [(d - s).days for d, s in zip(dates, expected_starts)]
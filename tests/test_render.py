@@ -0,0 +1,150 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from dayplot import RenderResult, load_dataset, render_many, render_to_bytes
+from dayplot import render
+from dayplot.render import _figure_pool, _pooled_figure
+
+
+@pytest.fixture
+def jobs():
+    df = load_dataset().head(60)
+    return [
+        dict(filename="a.png", dates=df["dates"], values=df["values"]),
+        dict(filename="sub/b.png", dates=df["dates"], values=df["values"], cmap="Reds"),
+        dict(filename="broken.png", dates=df["dates"], values=df["values"][:3]),
+        dict(filename="c.svg", dates=df["dates"], values=df["values"]),
+    ]
+
+
+def _check_results(results, out_dir):
+    assert [result.filename for result in results] == [
+        "a.png",
+        "sub/b.png",
+        "broken.png",
+        "c.svg",
+    ]
+    assert all(isinstance(result, RenderResult) for result in results)
+    assert [result.ok for result in results] == [True, True, False, True]
+
+    broken = results[2]
+    assert broken.path is None
+    assert broken.error.startswith("ValueError")
+
+    for result in results:
+        assert result.seconds >= 0
+        if result.ok:
+            assert (out_dir / result.filename).stat().st_size > 0
+    assert not (out_dir / "broken.png").exists()
+
+
+def test_render_many_in_process(jobs, tmp_path):
+    results = render_many(jobs, str(tmp_path), workers=1, dpi=50)
+    _check_results(results, tmp_path)
+
+
+def test_render_many_process_pool(jobs, tmp_path):
+    results = render_many(
+        iter(jobs), str(tmp_path), workers=2, dpi=50, max_jobs_per_worker=2
+    )
+    _check_results(results, tmp_path)
+
+
+def test_render_many_replaces_pool_before_python_311(jobs, tmp_path, monkeypatch):
+    """Test that the pool is replaced every `workers * max_jobs_per_worker` jobs."""
+    pools = []
+
+    def new_pool(workers, max_jobs_per_worker):
+        pools.append(ProcessPoolExecutor(workers))
+        return pools[-1]
+
+    monkeypatch.setattr(render, "_REPLACES_WORKERS", False)
+    monkeypatch.setattr(render, "_new_pool", new_pool)
+    results = render_many(
+        jobs * 3, str(tmp_path), workers=2, dpi=50, max_jobs_per_worker=2
+    )
+
+    assert len(pools) == 3
+    assert [result.ok for result in results] == [True, True, False, True] * 3
+
+
+def test_render_many_missing_filename(tmp_path):
+    results = render_many(
+        [dict(dates=["2024-01-01"], values=[1])], str(tmp_path), workers=1
+    )
+    assert not results[0].ok
+    assert "filename" in results[0].error
+
+
+class _CrashingValues:
+    """Values whose conversion kills the worker process."""
+
+    def __len__(self):
+        return 60
+
+    def __array__(self, dtype=None, copy=None):
+        os._exit(1)
+
+
+def _jobs_with_crash(df, pause):
+    for i in range(4):
+        yield dict(filename=f"{i}.png", dates=df["dates"], values=df["values"])
+    yield dict(filename="crash.png", dates=df["dates"], values=_CrashingValues())
+    # Let the worker die before the next jobs are submitted.
+    time.sleep(pause)
+    for i in range(4, 10):
+        yield dict(filename=f"{i}.png", dates=df["dates"], values=df["values"])
+
+
+@pytest.mark.parametrize("pause", [0, 2])
+def test_render_many_worker_crash(tmp_path, pause):
+    """Test that only the job killing its worker fails, and the run goes on."""
+    df = load_dataset().head(60)
+    results = render_many(_jobs_with_crash(df, pause), str(tmp_path), workers=4, dpi=30)
+
+    failed = [result.filename for result in results if not result.ok]
+    assert failed == ["crash.png"]
+    assert results[4].error.startswith("BrokenProcessPool")
+    assert len(results) == 11
+    assert np.all([(tmp_path / f"{i}.png").exists() for i in range(10)])
+
+
+def test_render_to_bytes_formats():
+    df = load_dataset().head(60)
+    n_figures = len(plt.get_fignums())
+
+    png = render_to_bytes(df["dates"], df["values"], dpi=50)
+    svg = render_to_bytes(df["dates"], df["values"], format="svg", cmap="Reds")
+
+    assert png.startswith(b"\x89PNG")
+    assert b"<svg" in svg
+    assert len(plt.get_fignums()) == n_figures
+
+
+def test_render_to_bytes_reuses_figures():
+    df = load_dataset().head(60)
+    first = render_to_bytes(df["dates"], df["values"], figsize=(6, 3), dpi=40)
+    fig = _figure_pool[((6.0, 3.0), 40.0)][-1]
+
+    second = render_to_bytes(df["dates"], df["values"], figsize=(6, 3), dpi=40)
+
+    assert first == second
+    assert _figure_pool[((6.0, 3.0), 40.0)][-1] is fig
+    assert fig.axes == []
+
+
+def test_render_to_bytes_error_releases_figure():
+    with pytest.raises(ValueError):
+        render_to_bytes(["2024-01-01"], [1, 2], figsize=(5, 2), dpi=30)
+
+    with _pooled_figure((5, 2), 30) as fig:
+        assert fig.axes == []
@@ -0,0 +1,67 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from dayplot import CalendarHandle, CalendarRenderer, calendar, load_dataset, styles
+
+
+@pytest.mark.parametrize("render", ["patches", "collection"])
+def test_render_matches_calendar(render):
+    df = load_dataset()
+    renderer = CalendarRenderer(render=render, **styles["github"])
+    fig, (ax1, ax2) = plt.subplots(nrows=2)
+
+    cells = renderer.render(df["dates"], df["values"], ax=ax1)
+    expected = calendar(
+        df["dates"], df["values"], render=render, ax=ax2, **styles["github"]
+    )
+
+    if render == "collection":
+        assert np.array_equal(cells.get_facecolors(), expected.get_facecolors())
+        assert np.array_equal(
+            cells.get_paths()[0].vertices, expected.get_paths()[0].vertices
+        )
+    else:
+        assert [c.get_facecolor() for c in cells] == [
+            c.get_facecolor() for c in expected
+        ]
+    assert [t.get_text() for t in ax1.texts] == [t.get_text() for t in ax2.texts]
+    plt.close(fig)
+
+
+def test_render_categorical_and_data():
+    df = load_dataset("polars").head(5)
+    df = df.with_columns(category=df["values"].cast(str))
+    colors = {category: "red" for category in df["category"].to_list()}
+    renderer = CalendarRenderer(colors=colors, return_handle=True)
+    fig, ax = plt.subplots()
+
+    handle = renderer.render("dates", "category", data=df, ax=ax)
+
+    assert isinstance(handle, CalendarHandle)
+    assert renderer.style["colors"] == colors
+    plt.close(fig)
+
+
+@pytest.mark.parametrize(
+    "style, match",
+    [
+        (dict(boxstyle="hexagon"), "boxstyle"),
+        (dict(render="pixels"), "render"),
+        (dict(render="image", boxstyle="round"), "image"),
+        (dict(month_label_step=0), "month_label_step"),
+        (dict(agg="mode"), "agg"),
+        (dict(vmax="99"), "vmax"),
+        (dict(week_starts_on="Funday"), "week_starts_on"),
+        (dict(cmap=123), "cmap"),
+        (dict(colors=["not a color"]), "Invalid color"),
+        (dict(ax=None), "render()"),
+    ],
+)
+def test_invalid_style_fails_early(style, match):
+    with pytest.raises(ValueError, match=match):
+        CalendarRenderer(**style)
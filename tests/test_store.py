@@ -0,0 +1,103 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+from datetime import date
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from dayplot import DailyStore, calendar
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = DailyStore.create(
+        tmp_path / "counts.dayplot",
+        names=["alice", "bob", 42],
+        start_date="2024-01-01",
+        end_date="2024-12-31",
+    )
+    store.write("alice", ["2024-01-01", "2024-01-01", "2024-03-01"], [1, 2, 5])
+    store.write(42, ["2024-12-31", "2025-01-01"])
+    store.flush()
+    return store
+
+
+def test_create_and_reopen(store):
+    reopened = DailyStore(store.path)
+
+    assert reopened.names == ["alice", "bob", 42]
+    assert len(reopened) == 3
+    assert "bob" in reopened
+    assert reopened.start_date == date(2024, 1, 1)
+    assert reopened.end_date == date(2024, 12, 31)
+
+    dates, values = reopened.read("alice")
+    assert len(dates) == len(values) == 366
+    assert dates[0] == np.datetime64("2024-01-01")
+    assert values[0] == 3
+    assert values[60] == 5
+    assert np.isnan(values[1])
+    assert np.isnan(reopened.read("bob")[1]).all()
+    assert np.nansum(reopened.read(42)[1]) == 1
+
+
+def test_read_window_is_a_view(store):
+    reopened = DailyStore(store.path)
+    dates, values = reopened.read("alice", "2024-02-15", "2024-03-15")
+
+    assert isinstance(values, np.memmap)
+    assert not values.flags.owndata
+    assert dates[0] == np.datetime64("2024-02-15")
+    assert dates[-1] == np.datetime64("2024-03-15")
+    assert np.nansum(values) == 5
+
+    with pytest.raises(ValueError):
+        values[0] = 1
+
+
+def test_read_window_is_clipped(store):
+    dates, values = store.read("alice", "2023-12-01", "2024-01-02")
+    assert dates.tolist() == [date(2024, 1, 1), date(2024, 1, 2)]
+    assert values[0] == 3
+
+
+def test_write_keeps_other_days(store):
+    store.write("alice", ["2024-03-01"], [7])
+    values = store.read("alice")[1]
+    assert values[0] == 3
+    assert values[60] == 7
+
+
+def test_calendar_from_store(store):
+    fig, ax = plt.subplots()
+
+    cells = calendar(*store.read("alice"), render="collection", ax=ax)
+    expected = calendar(
+        ["2024-01-01", "2024-03-01"],
+        [3, 5],
+        start_date="2024-01-01",
+        end_date="2024-12-31",
+        render="collection",
+        ax=ax,
+    )
+
+    assert cells.get_facecolors() == pytest.approx(expected.get_facecolors())
+    plt.close("all")
+
+
+def test_invalid_store(tmp_path, store):
+    with pytest.raises(KeyError, match="carol"):
+        store.read("carol")
+    with pytest.raises(ValueError, match="unique"):
+        DailyStore.create(tmp_path / "a", ["a", "a"], "2024-01-01", "2024-01-02")
+    with pytest.raises(ValueError, match="dtype"):
+        DailyStore.create(tmp_path / "a", ["a"], "2024-01-01", "2024-01-02", "int8")
+    with pytest.raises(ValueError, match="start_date"):
+        DailyStore.create(tmp_path / "a", ["a"], "2024-01-02", "2024-01-01")
+
+    (tmp_path / "b").write_bytes(b"not a store")
+    with pytest.raises(ValueError, match="not a dayplot store"):
+        DailyStore(tmp_path / "b")
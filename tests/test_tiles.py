@@ -0,0 +1,99 @@
+import json
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+import pytest
+from matplotlib.image import imread
+
+from dayplot import export_tiles
+
+
+@pytest.fixture
+def daily():
+    dates = np.arange(np.datetime64("2018-03-10"), np.datetime64("2021-11-20"))
+    values = np.random.default_rng(0).poisson(3, len(dates)).astype(float)
+    return dates, values
+
+
+def _read_tiles(out_dir, level):
+    index = json.loads((out_dir / "index.json").read_text())
+    tiles = next(lv for lv in index["levels"] if lv["name"] == level)["tiles"]
+    return index, tiles, [imread(out_dir / tile["path"]) for tile in tiles]
+
+
+def test_export_tiles_index(daily, tmp_path):
+    dates, values = daily
+    results = export_tiles(
+        dates, values, str(tmp_path), levels=["year", "quarter"], workers=1
+    )
+
+    assert all(result.ok for result in results)
+    index, tiles, images = _read_tiles(tmp_path, "quarter")
+    assert index["start_date"] == "2018-03-10"
+    assert index["end_date"] == "2021-11-19"
+    assert (index["vmin"], index["vmax"]) == (values.min(), values.max())
+    assert [tile["key"] for tile in tiles[:3]] == ["2018-Q1", "2018-Q2", "2018-Q3"]
+    assert tiles[0]["start_date"] == "2018-03-10"
+    # Tiles partition the week columns of the calendar.
+    columns = [tile["column"] for tile in tiles]
+    ends = [tile["column"] + tile["columns"] for tile in tiles]
+    assert columns[0] == 0 and columns[1:] == ends[:-1]
+    assert ends[-1] == index["columns"]
+    for tile, image in zip(tiles, images):
+        assert image.shape[:2] == (tile["height"], tile["width"])
+
+
+@pytest.mark.parametrize("render", ["patches", "collection", "image"])
+def test_export_tiles_line_up(daily, tmp_path, render):
+    """Test that tiles side by side match a tile covering the same columns."""
+    dates, values = daily
+    export_tiles(
+        dates,
+        values,
+        str(tmp_path / "year"),
+        levels=["year"],
+        tile_width=157,
+        workers=1,
+        render=render,
+    )
+    export_tiles(
+        dates,
+        values,
+        str(tmp_path / "decade"),
+        levels=["decade"],
+        tile_width=1570,
+        workers=1,
+        render=render,
+    )
+
+    _, year_tiles, year_images = _read_tiles(tmp_path / "year", "year")
+    _, decade_tiles, decade_images = _read_tiles(tmp_path / "decade", "decade")
+    assert year_tiles[0]["width"] // year_tiles[0]["columns"] == 3
+    assert [tile["key"] for tile in decade_tiles] == ["2010s", "2020s"]
+
+    # 2018 and 2019 make the 2010s, 2020 and 2021 the 2020s.
+    assert np.array_equal(np.hstack(year_images[:2]), decade_images[0])
+    assert np.array_equal(np.hstack(year_images[2:]), decade_images[1])
+
+
+def test_export_tiles_in_parallel_with_empty_tiles(tmp_path):
+    dates = np.array(["2020-01-15", "2020-12-01"], dtype="datetime64[D]")
+    results = export_tiles(dates, [1, 2], str(tmp_path), levels=["quarter"], workers=2)
+
+    assert [result.filename for result in results] == [
+        f"quarter/2020-Q{i}.png" for i in range(1, 5)
+    ]
+    assert all(result.ok for result in results)
+    _, _, images = _read_tiles(tmp_path, "quarter")
+    # Quarters without data only have empty days.
+    assert len(np.unique(images[1].reshape(-1, 4), axis=0)) == 2
+
+
+def test_export_tiles_invalid_arguments(tmp_path):
+    with pytest.raises(ValueError, match="Invalid level"):
+        export_tiles(["2020-01-01"], [1], str(tmp_path), levels=["week"])
+    with pytest.raises(ValueError, match="only supports numeric values"):
+        export_tiles(["2020-01-01"], ["a"], str(tmp_path))